@@ -0,0 +1,112 @@
+"""
+Import and Startup Benchmark for Cognita SDK
+
+Measures cold-start costs in fresh interpreters: importing the package, resolving
+the lazily loaded exports, building a configuration and constructing an agent.
+Each scenario runs in a new subprocess so nothing is cached between samples.
+
+Scenarios:
+- import: `import cognita`.
+- config: `Config.from_dict(...)` after `import cognita`.
+- agent: `CognitaAgent(Config.from_dict(...))`, which loads the HTTP client.
+
+Usage:
+
+    python benchmarks/bench_import.py --runs 20 --max-import-ms 50
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+
+SCENARIOS = {
+    "import": "import cognita",
+    "config": "import cognita; cognita.Config.from_dict({'API_KEY': 'bench'})",
+    "agent": "import cognita; cognita.CognitaAgent(cognita.Config.from_dict({'API_KEY': 'bench'}))",
+}
+
+# Runs the scenario and prints its duration and the heavy modules it loaded.
+_PROBE = """
+import sys, time
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+heavy = [name for name in ("requests", "dotenv", "asyncio", "sqlite3") if name in sys.modules]
+print(elapsed, ",".join(heavy))
+"""
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Return the `pct` percentile of `values` (nearest rank)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(int(round(pct / 100.0 * len(ordered))) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+def measure(code: str, runs: int) -> Dict[str, Any]:
+    """Run one scenario `runs` times in fresh interpreters."""
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    samples = []
+    modules = ""
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", _PROBE.format(code=code)], env=env,
+                                capture_output=True, text=True, check=True).stdout.split()
+        samples.append(float(output[0]) * 1000.0)
+        modules = output[1] if len(output) > 1 else ""
+    return {
+        "runs": runs,
+        "ms": {
+            "min": min(samples),
+            "p50": percentile(samples, 50),
+            "p95": percentile(samples, 95),
+            "max": max(samples),
+        },
+        "heavy_modules": modules.split(",") if modules else [],
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Cognita import and startup benchmark")
+    parser.add_argument("--runs", type=int, default=10, help="fresh interpreters per scenario")
+    parser.add_argument("--scenarios", nargs="+", choices=sorted(SCENARIOS), default=sorted(SCENARIOS))
+    parser.add_argument("--max-import-ms", type=float, default=0.0,
+                        help="fail when the median `import cognita` exceeds this (0 disables)")
+    parser.add_argument("--output", help="write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    report: Dict[str, Any] = {
+        "metadata": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "parameters": {key: value for key, value in vars(args).items() if key != "output"},
+        },
+        "scenarios": {name: measure(SCENARIOS[name], args.runs) for name in args.scenarios},
+    }
+
+    output = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+    imported = report["scenarios"].get("import")
+    if args.max_import_ms and imported and imported["ms"]["p50"] > args.max_import_ms:
+        print(f"import cognita took {imported['ms']['p50']:.1f} ms (limit {args.max_import_ms} ms)",
+              file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,253 @@
+"""
+Query Pipeline Benchmark for Cognita SDK
+
+Runs the agent against a local mock Deep Research server and reports throughput,
+latency percentiles and per-query memory for each execution mode, so results can be
+compared between releases.
+
+Modes:
+- sync: sequential `CognitaAgent.execute_query` calls.
+- batch: `CognitaAgent.execute_batch` with `--concurrency` workers.
+- async: `CognitaAgent.aexecute_query` gathered with `--concurrency` in flight
+  (requires aiohttp; skipped otherwise).
+- stream: `CognitaAgent.stream_query`, timing first event and full stream.
+
+Usage:
+
+    python benchmarks/bench_pipeline.py --requests 500 --latency 0.02 --output bench.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+import cognita  # noqa: E402
+from cognita.agent import CognitaAgent  # noqa: E402
+from cognita.errors import APIError, ConfigError, ProcessingError  # noqa: E402
+from cognita.mock_server import MockResearchServer  # noqa: E402
+
+MODES = ("sync", "batch", "async", "stream")
+
+
+class BenchConfig:
+    """Minimal configuration pointing the agent at the mock server."""
+
+    API_KEY = "mock-key"
+    API_TIMEOUT = 30
+    MAX_RESULTS = 5
+    MIN_CONFIDENCE = 0.8
+    API_RETRY_BACKOFF_BASE = 0.01
+
+    def __init__(self, base_url: str, concurrency: int, retries: int):
+        self.API_BASE_URL = base_url
+        self.API_POOL_CONNECTIONS = concurrency
+        self.API_POOL_MAXSIZE = concurrency
+        self.API_MAX_CONCURRENCY = concurrency
+        self.API_RETRY_MAX_ATTEMPTS = retries
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Return the `pct` percentile of `values` (nearest-rank on sorted data)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * len(ordered) + 0.5)) - 1))
+    return ordered[rank]
+
+
+def summarize(latencies: List[float], errors: int, wall_time: float) -> Dict[str, Any]:
+    """Build the result record of one mode."""
+    completed = len(latencies) + errors
+    return {
+        "requests": completed,
+        "errors": errors,
+        "wall_time": wall_time,
+        "throughput": completed / wall_time if wall_time > 0 else 0.0,
+        "latency": {
+            "mean": sum(latencies) / len(latencies) if latencies else 0.0,
+            "min": min(latencies) if latencies else 0.0,
+            "max": max(latencies) if latencies else 0.0,
+            "p50": percentile(latencies, 50),
+            "p95": percentile(latencies, 95),
+            "p99": percentile(latencies, 99),
+        },
+    }
+
+
+def make_queries(count: int, mode: str) -> List[str]:
+    # Unique queries so neither the cache nor request coalescing hides API calls.
+    return [f"Benchmark {mode} query number {index}" for index in range(count)]
+
+
+def run_sync(agent: CognitaAgent, queries: List[str]) -> Dict[str, Any]:
+    latencies, errors = [], 0
+    start = time.perf_counter()
+    for query in queries:
+        began = time.perf_counter()
+        try:
+            agent.execute_query(query)
+        except (APIError, ProcessingError):
+            errors += 1
+        else:
+            latencies.append(time.perf_counter() - began)
+    return summarize(latencies, errors, time.perf_counter() - start)
+
+
+def run_batch(agent: CognitaAgent, queries: List[str], concurrency: int) -> Dict[str, Any]:
+    run = agent.execute_batch(queries, max_concurrency=concurrency)
+    latencies, errors = [], 0
+    start = time.perf_counter()
+    for outcome in run:
+        if outcome.ok:
+            latencies.append(outcome.elapsed)
+        else:
+            errors += 1
+    return summarize(latencies, errors, time.perf_counter() - start)
+
+
+def run_async(agent: CognitaAgent, queries: List[str], concurrency: int) -> Dict[str, Any]:
+    async def main():
+        semaphore = asyncio.Semaphore(concurrency)
+        latencies, errors = [], []
+
+        async def one(query):
+            async with semaphore:
+                began = time.perf_counter()
+                try:
+                    await agent.aexecute_query(query)
+                except (APIError, ProcessingError):
+                    errors.append(query)
+                else:
+                    latencies.append(time.perf_counter() - began)
+
+        start = time.perf_counter()
+        try:
+            await asyncio.gather(*(one(query) for query in queries))
+        finally:
+            await agent.async_api.aclose()
+        return summarize(latencies, len(errors), time.perf_counter() - start)
+
+    return asyncio.run(main())
+
+
+def run_stream(agent: CognitaAgent, queries: List[str]) -> Dict[str, Any]:
+    latencies, first_event, errors = [], [], 0
+    start = time.perf_counter()
+    for query in queries:
+        began = time.perf_counter()
+        try:
+            for index, _ in enumerate(agent.stream_query(query)):
+                if index == 0:
+                    first_event.append(time.perf_counter() - began)
+        except (APIError, ProcessingError):
+            errors += 1
+        else:
+            latencies.append(time.perf_counter() - began)
+    record = summarize(latencies, errors, time.perf_counter() - start)
+    record["first_event_latency"] = {
+        "p50": percentile(first_event, 50),
+        "p95": percentile(first_event, 95),
+        "p99": percentile(first_event, 99),
+    }
+    return record
+
+
+def measure_memory(agent: CognitaAgent, queries: List[str]) -> Dict[str, float]:
+    """
+    Measure memory allocated per query with tracemalloc.
+
+    `retained_bytes` is what the returned results keep alive; `peak_bytes` is the
+    peak allocation during the run. Both are divided by the number of queries.
+    Timing modes run without tracemalloc so its overhead does not skew latencies.
+    """
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.take_snapshot()
+        results = []
+        for query in queries:
+            try:
+                results.append(agent.execute_query(query))
+            except (APIError, ProcessingError):
+                pass
+        peak = tracemalloc.get_traced_memory()[1]
+        retained = sum(stat.size_diff for stat in tracemalloc.take_snapshot().compare_to(baseline, "filename"))
+    finally:
+        tracemalloc.stop()
+    count = max(len(queries), 1)
+    return {"queries": len(queries), "retained_bytes": retained / count, "peak_bytes": peak / count}
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the Cognita query pipeline")
+    parser.add_argument("--requests", type=int, default=200, help="Queries per mode")
+    parser.add_argument("--concurrency", type=int, default=16, help="Workers for batch/async modes")
+    parser.add_argument("--latency", type=float, default=0.01, help="Server latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.2, help="Relative latency jitter")
+    parser.add_argument("--sources", type=int, default=20, help="Sources per response (payload size)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of 503 responses")
+    parser.add_argument("--stream-format", choices=("ndjson", "sse"), default="ndjson")
+    parser.add_argument("--retries", type=int, default=1, help="API_RETRY_MAX_ATTEMPTS")
+    parser.add_argument("--modes", default=",".join(MODES), help="Comma-separated modes to run")
+    parser.add_argument("--memory-requests", type=int, default=50,
+                        help="Queries for the memory measurement (0 disables it)")
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args(argv)
+    args.modes = [mode.strip() for mode in args.modes.split(",") if mode.strip()]
+    unknown = set(args.modes) - set(MODES)
+    if unknown:
+        parser.error(f"unknown modes: {', '.join(sorted(unknown))}")
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    args = parse_args(argv)
+    report: Dict[str, Any] = {
+        "metadata": {
+            "cognita_version": getattr(cognita, "__version__", "unknown"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "parameters": {key: value for key, value in vars(args).items() if key != "output"},
+        },
+        "modes": {},
+    }
+
+    with MockResearchServer(latency=args.latency, jitter=args.jitter, num_sources=args.sources,
+                            error_rate=args.error_rate, stream_format=args.stream_format) as server:
+        config = BenchConfig(server.url, args.concurrency, args.retries)
+        runners: Dict[str, Callable[[CognitaAgent, List[str]], Dict[str, Any]]] = {
+            "sync": run_sync,
+            "batch": lambda agent, queries: run_batch(agent, queries, args.concurrency),
+            "async": lambda agent, queries: run_async(agent, queries, args.concurrency),
+            "stream": run_stream,
+        }
+        for mode in args.modes:
+            with CognitaAgent(config) as agent:
+                try:
+                    report["modes"][mode] = runners[mode](agent, make_queries(args.requests, mode))
+                except ConfigError as e:
+                    report["modes"][mode] = {"skipped": str(e)}
+        if args.memory_requests:
+            with CognitaAgent(config) as agent:
+                report["memory"] = measure_memory(agent, make_queries(args.memory_requests, "memory"))
+        report["server"] = dict(server.stats)
+
+    output = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+    return report
+
+
+if __name__ == "__main__":
+    main()
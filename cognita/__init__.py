@@ -8,19 +8,52 @@ Modules:
     - agent: Core AI agent for managing research workflows.
     - config: Configuration management for API settings.
     - deep_research_api: API client for interacting with the Deep Research API.
+    - models: Compact typed result models.
 
-Exports:
+Exports (imported lazily on first access):
     - CognitaAgent: Main interface for executing research queries.
     - Config: Configuration manager for environment settings.
     - DeepResearchAPI: API handler for submitting research requests.
+    - AsyncDeepResearchAPI: Asyncio API handler for submitting research requests.
+    - ResearchResult, Source, ResultCollection: Typed research result models.
 
 Version:
     0.0.1
 """
 
-from .agent import CognitaAgent
-from .config import Config
-from .deep_research_api import DeepResearchAPI
+import importlib
+import logging
 
-__all__ = ['CognitaAgent', 'Config', 'DeepResearchAPI']
+# Exports are imported on first access (PEP 562), so `import cognita` stays cheap
+# and does not pull in `requests` or `dotenv` until they are needed.
+_EXPORTS = {
+    'CognitaAgent': '.agent',
+    'Config': '.config',
+    'DeepResearchAPI': '.deep_research_api',
+    'AsyncDeepResearchAPI': '.deep_research_api',
+    'ResearchResult': '.models',
+    'ResultCollection': '.models',
+    'Source': '.models',
+}
+
+__all__ = [
+    'CognitaAgent', 'Config', 'DeepResearchAPI', 'AsyncDeepResearchAPI',
+    'ResearchResult', 'ResultCollection', 'Source',
+]
 __version__ = '0.0.1'
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
+# Library logging stays silent unless the application configures handlers.
+logging.getLogger(__name__).addHandler(logging.NullHandler())
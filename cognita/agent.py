@@ -1,8 +1,36 @@
+import copy
 import logging
-from typing import Dict, Any
-from .deep_research_api import DeepResearchAPI
-from .utils import format_response, validate_query, summarize_results
-from .errors import APIError, ProcessingError
+import threading
+from concurrent.futures import Future
+from contextlib import nullcontext
+from typing import Dict, Any, AsyncIterator, Callable, Iterable, Iterator, Optional, Union
+from .batch import BatchRun
+from .cache import ResultCache, create_cache, make_cache_key
+from .singleflight import AsyncSingleFlight, SingleFlight
+from .deadline import check_deadline, deadline_scope
+from .deep_research_api import DeepResearchAPI, AsyncDeepResearchAPI
+from .utils import (
+    astream_format_response,
+    format_response,
+    stream_format_response,
+    summarize_results,
+    validate_query,
+)
+from .errors import APIError, ConfigError, ProcessingError
+from .instrumentation import Instrumentation, RequestTrace, stage
+from .jobs import JobPoller
+from .microbatch import MicroBatcher
+from .models import ResearchResult
+from .normalization import QUERY_MATCHING_MODES, NearDuplicateIndex, canonicalize_query
+from .pipeline import Pipeline, Stage
+from .refresh import REFRESH_OUTCOMES, RefreshState, create_state_store
+from .store import ResultStore
+
+def _completed(result: Any) -> Future:
+    """Return a future that already holds `result`."""
+    future: Future = Future()
+    future.set_result(result)
+    return future
 
 class CognitaAgent:
     """
@@ -14,59 +42,638 @@ class CognitaAgent:
     Attributes:
         config (Config): Configuration object containing API settings.
         api (DeepResearchAPI): API handler for making research requests.
+        async_api (AsyncDeepResearchAPI): Asyncio API handler used by `aexecute_query`.
+        cache (ResultCache): Cache of summarized results, or None when caching is disabled.
+        store (ResultStore): Archive of every fetched result, or None when disabled.
+        query_matching (str): Cache matching mode from `QUERY_MATCHING`.
+        similar_queries (NearDuplicateIndex): Recently cached queries used by
+            "similar" matching, or None.
+        near_duplicate_hits (int): Cached results served for near-duplicate queries.
+        refresh_states (ResultCache): Validators and last raw response per query used
+            by incremental refresh, or None when `INCREMENTAL_REFRESH` is off.
+        refresh_outcomes (dict): Number of incremental fetches per outcome ("full",
+            "delta" or "unchanged").
+        single_flight (SingleFlight): Coalesces identical in-flight requests from threads.
+        async_single_flight (AsyncSingleFlight): Coalesces identical in-flight requests
+            from coroutines.
+        instrumentation (Instrumentation): Per-request tracing and metrics hooks.
+        pipeline (Pipeline): Post-processing stages registered with `add_stage`.
+        job_poller (JobPoller): Background poller for jobs started with `submit_job`,
+            created on first use.
+        batcher (MicroBatcher): Collects queries from `submit_batched` into batch
+            requests, created on first use.
         logger (logging.Logger): Logger instance for tracking operations and errors.
     """
 
-    def __init__(self, config):
+    def __init__(self, config, cache: Optional[ResultCache] = None,
+                 store: Optional[ResultStore] = None):
         """
         Initialize the research agent with configuration settings.
 
         Args:
             config (Config): Configuration object with API settings.
+            cache (ResultCache, optional): Result cache to use. Defaults to the
+                backend selected by `CACHE_BACKEND` (disabled unless configured).
+            store (ResultStore, optional): Archive to append fetched results to.
+                Defaults to a store at `RESULT_STORE_PATH`, if set.
+
+        Raises:
+            ConfigError: If `QUERY_MATCHING` names an unknown mode.
         """
         self.config = config
         self.api = DeepResearchAPI(config)
+        self.async_api = AsyncDeepResearchAPI(
+            config,
+            circuit_breakers=self.api.circuit_breakers,
+            rate_limiter=self.api.rate_limiter,
+            concurrency_limiter=self.api.concurrency_limiter,
+            balancer=self.api.balancer,
+        )
+        self.cache = cache if cache is not None else create_cache(config)
+        store_path = getattr(config, "RESULT_STORE_PATH", "")
+        self.store = store if store is not None else (ResultStore(store_path) if store_path else None)
+        self.query_matching = (getattr(config, "QUERY_MATCHING", "exact") or "exact").lower()
+        if self.query_matching not in QUERY_MATCHING_MODES:
+            raise ConfigError(f"Unknown query matching mode: {self.query_matching}")
+        self.similar_queries: Optional[NearDuplicateIndex] = None
+        if self.query_matching == "similar" and self.cache is not None:
+            self.similar_queries = NearDuplicateIndex(
+                threshold=getattr(config, "QUERY_SIMILARITY_THRESHOLD", 0.8),
+                capacity=getattr(config, "QUERY_SIMILARITY_CAPACITY", 10000),
+            )
+        self.near_duplicate_hits = 0
+        self.refresh_states = (create_state_store(config)
+                               if getattr(config, "INCREMENTAL_REFRESH", False) else None)
+        self.refresh_outcomes = dict.fromkeys(REFRESH_OUTCOMES, 0)
+        self.single_flight = SingleFlight()
+        self.async_single_flight = AsyncSingleFlight()
+        self.instrumentation = Instrumentation()
+        self.pipeline = Pipeline.from_config(config)
+        self._job_poller: Optional[JobPoller] = None
+        self._batcher: Optional[MicroBatcher] = None
+        self._lazy_lock = threading.Lock()
         self.logger = logging.getLogger(__name__)
-        self.logger.info("Cognita Agent initialized with configuration: %s", config)
+        self.logger.debug("Cognita Agent initialized with configuration: %r", config)
 
-    def execute_query(self, query: str) -> Dict[str, Any]:
+    def execute_query(self, query: str, use_cache: bool = True, refresh: bool = False,
+                      as_model: bool = False, timeout: Optional[float] = None
+                      ) -> Union[Dict[str, Any], ResearchResult]:
         """
         Execute a research query and process the results.
 
         This method validates the input query, submits it to the Deep Research API, 
-        formats the response, and summarizes the research findings.
+        formats the response, and summarizes the research findings. When a cache is
+        configured, results are looked up and stored under the validated query and
+        the `MAX_RESULTS`/`MIN_CONFIDENCE` parameters; `QUERY_MATCHING` lets
+        reworded queries share cached results. Concurrent calls for the same query
+        share a single upstream request. With `INCREMENTAL_REFRESH`, a query fetched
+        before is fetched conditionally and only the changes are transferred. Stages
+        registered with `add_stage` then post-process the summarized results.
 
         Args:
             query (str): Research question or topic.
+            use_cache (bool): Read from and write to the cache. False bypasses it entirely.
+            refresh (bool): Skip the cache lookup but store the fresh result.
+            as_model (bool): Return a `ResearchResult` built directly from the raw
+                response instead of the summarized dictionary.
+            timeout (float, optional): Deadline in seconds for the whole call,
+                including rate limiting, retries and formatting. Defaults to
+                `API_DEADLINE` (no deadline when 0).
 
         Returns:
-            dict: Structured and summarized research results.
+            dict: Structured and summarized research results (a `ResearchResult`
+            when `as_model` is true).
 
         Raises:
             APIError: Raised if an error occurs while communicating with the API.
+            DeadlineExceededError: Raised if the deadline passes before the call completes.
             ProcessingError: Raised if there is an issue with processing the research data.
         """
-        try:
+        with self.instrumentation.trace(query) as trace, self._deadline_scope(timeout):
+            try:
+                validated, cache_key, cached = self._prepare(query, use_cache, refresh, as_model)
+                if cached is None:
+                    result = self.single_flight.do(cache_key, lambda: self._finish(
+                        validated, self._fetch(validated, cache_key),
+                        cache_key if use_cache else None, as_model))
+                    cached = self._reshape(validated, result, as_model)
+                return self._post_process(validated, cached)
+
+            except APIError as e:
+                self.logger.error("API Error [%s]: %s", trace.request_id, e)
+                raise
+            except ProcessingError as e:
+                self.logger.error("Processing Error [%s]: %s", trace.request_id, e)
+                raise
+
+    def stream_query(self, query: str) -> Iterator[Dict[str, Any]]:
+        """
+        Execute a research query and yield results incrementally.
+
+        Sources, summary fragments and the confidence score are yielded as
+        `{"type": ..., "value": ...}` events as soon as the API streams them, so
+        callers can render or index sources without waiting for the full response.
+        Streaming bypasses the result cache. `cognita.utils.collect_stream` folds the
+        events back into the `format_response` structure.
+
+        Args:
+            query (str): Research question or topic.
+
+        Yields:
+            dict: Formatted stream events of type "source", "summary" or "confidence".
+
+        Raises:
+            APIError: Raised if an error occurs while communicating with the API.
+            ProcessingError: Raised if the query is invalid or a stream event is malformed.
+        """
+        validated = validate_query(query)
+        self.logger.debug("Validated query: %s", validated)
+        yield from stream_format_response(self.api.stream_research_request(validated))
+
+    async def astream_query(self, query: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Asynchronous counterpart of `stream_query`.
+
+        Args:
+            query (str): Research question or topic.
+
+        Yields:
+            dict: Formatted stream events of type "source", "summary" or "confidence".
+
+        Raises:
+            APIError: Raised if an error occurs while communicating with the API.
+            ProcessingError: Raised if the query is invalid or a stream event is malformed.
+        """
+        validated = validate_query(query)
+        self.logger.debug("Validated query: %s", validated)
+        events = self.async_api.stream_research_request(validated)
+        async for event in astream_format_response(events):
+            yield event
+
+    def execute_batch(self, queries: Iterable[str], max_concurrency: Optional[int] = None,
+                      ordered: bool = False) -> BatchRun:
+        """
+        Execute many research queries concurrently.
+
+        Queries run on a thread pool sharing this agent's pooled API client. Queries
+        that are identical after validation are sent to the API only once. Each query
+        yields a `QueryOutcome` carrying either its summarized results or the captured
+        `APIError`/`ProcessingError`, so a failing query does not stop the batch.
+
+        Example:
+            run = agent.execute_batch(topics, max_concurrency=8)
+            for outcome in run:
+                print(outcome.query, outcome.result if outcome.ok else outcome.error)
+            print(run.stats.as_dict())
+
+        Args:
+            queries (iterable): Research questions or topics.
+            max_concurrency (int, optional): Maximum queries in flight. Defaults to the
+                configured connection pool size (`API_POOL_MAXSIZE`).
+            ordered (bool): Yield outcomes in input order instead of completion order.
+
+        Returns:
+            BatchRun: Iterable of `QueryOutcome` objects with aggregate `stats`.
+        """
+        if max_concurrency is None:
+            max_concurrency = getattr(self.config, "API_POOL_MAXSIZE", 10)
+        return BatchRun(self.execute_query, queries, max_concurrency=max_concurrency, ordered=ordered)
+
+    def submit_job(self, query: str, use_cache: bool = True,
+                   as_model: bool = False) -> Future:
+        """
+        Start a long-running research query as a job and return a future for its results.
+
+        The query is submitted to the API's jobs endpoint, which returns immediately;
+        a single background poller shared by all of this agent's jobs then checks
+        their status with adaptive intervals. No connection is held open while the
+        research runs, so one process can track thousands of jobs. Cached results are
+        returned as an already completed future.
+
+        Example:
+            futures = [agent.submit_job(topic) for topic in topics]
+            for future in concurrent.futures.as_completed(futures):
+                print(future.result()["final_summary"])
+
+        Use `asyncio.wrap_future` to await the returned future from a coroutine.
+
+        Args:
+            query (str): Research question or topic.
+            use_cache (bool): Read from and write to the cache.
+            as_model (bool): Resolve to a `ResearchResult` instead of the summarized dict.
+
+        Returns:
+            Future: Resolves to the summarized results, or fails with `APIError`
+            (`JobFailedError` when the job fails or times out) or `ProcessingError`.
+
+        Raises:
+            APIError: Raised if the job could not be submitted.
+            ProcessingError: Raised if the query is invalid.
+        """
+        with self.instrumentation.trace(query) as trace:
+            try:
+                validated, cache_key, cached = self._prepare(query, use_cache, False, as_model)
+                if cached is not None:
+                    return _completed(self._post_process(validated, cached))
+                handle = self.api.submit_job(validated)
+            except (APIError, ProcessingError) as e:
+                self.logger.error("Job Submission Error [%s]: %s", trace.request_id, e)
+                raise
+        self.logger.debug("Submitted job %s for query: %s", handle.job_id, validated)
+        return self._chain(self.job_poller.track(handle), validated,
+                           cache_key if use_cache else None, as_model, f"Job {handle.job_id}")
+
+    def submit_batched(self, query: str, use_cache: bool = True, as_model: bool = False) -> Future:
+        """
+        Queue a research query to be sent together with other queries.
+
+        Queries submitted within `BATCH_WINDOW` seconds of each other (up to
+        `BATCH_MAX_SIZE` of them) are packed into a single request to the API's batch
+        endpoint, and each caller's future receives its own result. This trades a few
+        milliseconds of latency for far fewer HTTP requests when many threads issue
+        queries at once. Cached results are returned as an already completed future.
+
+        Example:
+            futures = [agent.submit_batched(topic) for topic in topics]
+            results = [future.result() for future in futures]
+
+        Args:
+            query (str): Research question or topic.
+            use_cache (bool): Read from and write to the cache.
+            as_model (bool): Resolve to a `ResearchResult` instead of the summarized dict.
+
+        Returns:
+            Future: Resolves to the summarized results, or fails with `APIError` or
+            `ProcessingError`.
+
+        Raises:
+            ProcessingError: Raised if the query is invalid.
+        """
+        validated, cache_key, cached = self._prepare(query, use_cache, False, as_model)
+        if cached is not None:
+            return _completed(self._post_process(validated, cached))
+        return self._chain(self.batcher.submit(validated), validated,
+                           cache_key if use_cache else None, as_model, "Batched query")
+
+    def _chain(self, raw_future: Future, validated: str, cache_key: Optional[str],
+               as_model: bool, label: str) -> Future:
+        """
+        Return a future for the processed result of a future raw response.
+
+        Cancelling the returned future also cancels `raw_future`.
+        """
+        future: Future = Future()
+
+        def resolve(done: Future) -> None:
+            if done.cancelled():
+                future.cancel()
+                return
+            try:
+                result = self._finish(validated, done.result(), cache_key, as_model)
+                result = self._post_process(validated, result)
+            except Exception as e:
+                # Anything raised here would be swallowed by the done-callback
+                # machinery and leave the caller's future pending forever.
+                self.logger.error("%s failed: %s", label, e)
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(result)
+
+        future.add_done_callback(lambda done: raw_future.cancel() if done.cancelled() else None)
+        raw_future.add_done_callback(resolve)
+        return future
+
+    @property
+    def batcher(self) -> MicroBatcher:
+        """Micro-batcher used by `submit_batched`, created on first use."""
+        with self._lazy_lock:
+            if self._batcher is None:
+                self._batcher = MicroBatcher.from_config(self.api.submit_batch_request, self.config)
+            return self._batcher
+
+    @property
+    def job_poller(self) -> JobPoller:
+        """Background poller for jobs started with `submit_job`, created on first use."""
+        with self._lazy_lock:
+            if self._job_poller is None:
+                self._job_poller = JobPoller.from_config(self.api, self.config)
+            return self._job_poller
+
+    async def aexecute_query(self, query: str, use_cache: bool = True, refresh: bool = False,
+                             as_model: bool = False, timeout: Optional[float] = None
+                             ) -> Union[Dict[str, Any], ResearchResult]:
+        """
+        Execute a research query on the running event loop.
+
+        This is the asyncio counterpart of `execute_query`: the query goes through
+        the same validation, formatting and summarizing steps, but the API call is
+        made with `AsyncDeepResearchAPI`, so many queries can be awaited concurrently
+        on a single event loop. Concurrent coroutines awaiting the same query share a
+        single upstream request.
+
+        Args:
+            query (str): Research question or topic.
+            use_cache (bool): Read from and write to the cache. False bypasses it entirely.
+            refresh (bool): Skip the cache lookup but store the fresh result.
+            as_model (bool): Return a `ResearchResult` built directly from the raw
+                response instead of the summarized dictionary.
+            timeout (float, optional): Deadline in seconds for the whole call,
+                including rate limiting, retries and formatting. Defaults to
+                `API_DEADLINE` (no deadline when 0).
+
+        Returns:
+            dict: Structured and summarized research results (a `ResearchResult`
+            when `as_model` is true).
+
+        Raises:
+            APIError: Raised if an error occurs while communicating with the API.
+            DeadlineExceededError: Raised if the deadline passes before the call completes.
+            ProcessingError: Raised if there is an issue with processing the research data.
+        """
+        with self.instrumentation.trace(query) as trace, self._deadline_scope(timeout):
+            try:
+                validated, cache_key, cached = self._prepare(query, use_cache, refresh, as_model)
+                if cached is None:
+                    result = await self.async_single_flight.do(
+                        cache_key, lambda: self._afetch_finished(
+                            validated, cache_key, cache_key if use_cache else None, as_model)
+                    )
+                    cached = self._reshape(validated, result, as_model)
+                return await self._apost_process(validated, cached)
+
+            except APIError as e:
+                self.logger.error("API Error [%s]: %s", trace.request_id, e)
+                raise
+            except ProcessingError as e:
+                self.logger.error("Processing Error [%s]: %s", trace.request_id, e)
+                raise
+
+    def add_hook(self, hook: Callable[[RequestTrace], None]) -> None:
+        """
+        Register a callable that receives a `RequestTrace` after every query.
+
+        Traces carry the request ID, per-stage timings (validate, cache, http, parse,
+        format, summarize), payload sizes and the outcome, e.g. for metrics export.
+
+        Args:
+            hook (callable): Function taking a `RequestTrace`.
+        """
+        self.instrumentation.add_hook(hook)
+
+    def add_stage(self, name: str, func: Callable[..., Any], requires: Iterable[str] = ("results",),
+                  kind: str = "cpu", memoize: bool = True) -> Stage:
+        """
+        Register a post-processing stage run on the results of every query.
+
+        Stages declare what they depend on: the pipeline inputs "query" and
+        "results" or previously registered stages. Stages that do not depend on
+        each other run in parallel, and outputs are memoized per query and result,
+        so cached results are not post-processed again. The outputs are returned
+        under the "stages" key of the summarized results (`ResearchResult.stages`
+        with `as_model=True`). Stages receive a copy of the results, so modifying
+        it does not affect the cache. Stage timings are added
+        to the request trace as "pipeline.<name>"; `pipeline.stats()` aggregates them.
+
+        Example:
+            agent.add_stage("keywords", extract_keywords)
+            agent.add_stage("ranked", rank_sources, requires=("results", "keywords"))
+            agent.execute_query(topic)["stages"]["ranked"]
+
+        Args:
+            name (str): Name of the stage's output.
+            func (callable): Called with one argument per dependency.
+            requires (iterable): Names of the inputs and stages the stage depends on.
+            kind (str): "cpu" (thread pool), "process" (process pool; `func` must be
+                picklable) or "io" (coroutine function awaited on the event loop).
+            memoize (bool): Reuse the output for the same query and results.
+
+        Returns:
+            Stage: The registered stage.
+
+        Raises:
+            ValueError: If the name is taken, a dependency is unknown or the kind
+                is not supported.
+        """
+        return self.pipeline.add_stage(name, func, tuple(requires), kind=kind, memoize=memoize)
+
+    @property
+    def coalesced_requests(self) -> int:
+        """Number of calls that were served by another caller's in-flight request."""
+        return self.single_flight.coalesced + self.async_single_flight.coalesced
+
+    def _fetch(self, validated: str, key: str) -> Dict[str, Any]:
+        """Fetch the raw response, incrementally when `INCREMENTAL_REFRESH` is on."""
+        if self.refresh_states is None:
+            return self.api.submit_research_request(validated)
+        previous = self._refresh_state(key)
+        state = self.api.submit_refresh_request(validated, previous)
+        return self._save_refresh_state(key, previous, state)
+
+    async def _afetch(self, validated: str, key: str) -> Dict[str, Any]:
+        """Asynchronous counterpart of `_fetch`."""
+        if self.refresh_states is None:
+            return await self.async_api.submit_research_request(validated)
+        previous = self._refresh_state(key)
+        state = await self.async_api.submit_refresh_request(validated, previous)
+        return self._save_refresh_state(key, previous, state)
+
+    async def _afetch_finished(self, validated: str, key: str, cache_key: Optional[str],
+                               as_model: bool) -> Union[Dict[str, Any], ResearchResult]:
+        """Fetch and `_finish` a result; run once per group of coalesced async callers."""
+        return self._finish(validated, await self._afetch(validated, key), cache_key, as_model)
+
+    def _refresh_state(self, key: str) -> Optional[RefreshState]:
+        data = self.refresh_states.get(key)
+        return RefreshState.from_dict(data) if data is not None else None
+
+    def _save_refresh_state(self, key: str, previous: Optional[RefreshState],
+                            state: RefreshState) -> Dict[str, Any]:
+        """Store the state of a refresh and return its up-to-date raw response."""
+        self.refresh_outcomes[state.outcome] += 1
+        # An unchanged result with the same validators is not rewritten, so the
+        # cost of an unchanged refresh does not grow with the size of the result.
+        if (state.outcome != "unchanged" or previous is None
+                or (state.etag, state.last_modified) != (previous.etag, previous.last_modified)):
+            self.refresh_states.set(key, state.to_dict())
+        return state.response
+
+    def _prepare(self, query: str, use_cache: bool, refresh: bool, as_model: bool):
+        """
+        Validate the query and consult the cache.
+
+        Returns:
+            tuple: `(validated, cache_key, cached)` where `cached` is the cached result
+            in the requested shape, or None when the API has to be called.
+        """
+        with stage("validate"):
             validated = validate_query(query)
-            self.logger.debug("Validated query: %s", validated)
-            
-            raw_response = self.api.submit_research_request(validated)
+        self.logger.debug("Validated query: %s", validated)
+
+        cache_key = self._cache_key(validated)
+        cached = None
+        if use_cache and not refresh and self.cache is not None:
+            with stage("cache"):
+                cached = self._cache_get(cache_key)
+                if cached is None and self.similar_queries is not None:
+                    cached = self._similar_get(validated)
+            if cached is not None and as_model:
+                cached = ResearchResult.from_dict(cached, validated)
+        return validated, cache_key, cached
+
+    def _cache_key(self, validated: str) -> str:
+        """Build the cache key for a validated query using the configured parameters."""
+        if self.query_matching != "exact":
+            validated = canonicalize_query(validated)
+        return make_cache_key(validated, self.config.MAX_RESULTS, self.config.MIN_CONFIDENCE)
+
+    def _similar_get(self, validated: str) -> Optional[Dict[str, Any]]:
+        """Return the cached results of a near-duplicate of `validated`, or None."""
+        match = self.similar_queries.find(validated)
+        if match is None:
+            return None
+        key, similarity = match
+        cached = self._cache_get(key)
+        if cached is None:
+            # The cached result expired or was evicted.
+            self.similar_queries.discard(key)
+            return None
+        self.near_duplicate_hits += 1
+        self.logger.debug("Reusing cached result of a near-duplicate query (similarity %.2f)", similarity)
+        return cached
+
+    def _cache_get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached results for `key`, or None when absent or caching is off."""
+        if self.cache is None:
+            return None
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.logger.debug("Cache hit for key %s", key)
+        return cached
+
+    def _cache_set(self, key: str, results: Dict[str, Any], validated: str) -> None:
+        """Store results in the cache, if one is configured."""
+        if self.cache is not None:
+            self.cache.set(key, results)
+            if self.similar_queries is not None:
+                self.similar_queries.add(key, validated)
+
+    def _deadline_scope(self, timeout: Optional[float]):
+        """Activate the deadline of one call: `timeout`, else `API_DEADLINE`, if any."""
+        total = timeout if timeout is not None else getattr(self.config, "API_DEADLINE", 0)
+        return deadline_scope(total=total) if total else nullcontext()
+
+    def _finish(self, validated: str, raw_response: Dict[str, Any], cache_key: Optional[str],
+                as_model: bool) -> Union[Dict[str, Any], ResearchResult]:
+        """
+        Turn a raw response into the caller's result, cache it and archive it.
+
+        Args:
+            validated (str): The validated query.
+            raw_response (dict): Raw response returned by the API client.
+            cache_key (str, optional): Key to store the result under; None skips caching.
+            as_model (bool): Build a `ResearchResult` instead of the summarized dict.
+
+        Raises:
+            DeadlineExceededError: If the active deadline passed before formatting.
+            ProcessingError: If the raw response is malformed.
+        """
+        check_deadline("format")
+        if as_model:
+            with stage("format"):
+                try:
+                    result = ResearchResult.from_response(raw_response, validated)
+                except (AttributeError, TypeError, ValueError) as e:
+                    raise ProcessingError(f"Invalid response format: {str(e)}") from e
+            if cache_key is not None or self.store is not None:
+                data = result.to_dict()
+                if cache_key is not None:
+                    self._cache_set(cache_key, data, validated)
+                self._archive(validated, data)
+            return result
+        results = self._process_response(raw_response)
+        if cache_key is not None:
+            self._cache_set(cache_key, results, validated)
+        self._archive(validated, results)
+        return results
+
+    @staticmethod
+    def _reshape(validated: str, result: Union[Dict[str, Any], ResearchResult],
+                 as_model: bool) -> Union[Dict[str, Any], ResearchResult]:
+        """
+        Give one of the callers sharing a coalesced fetch its own result.
+
+        The result was processed, cached and archived once, in the shape the first
+        caller asked for; it is converted the way a cache hit would be.
+        """
+        if isinstance(result, ResearchResult):
+            return result if as_model else result.to_dict()
+        return ResearchResult.from_dict(result, validated) if as_model else copy.deepcopy(result)
+
+    @staticmethod
+    def _stage_inputs(validated: str, result: Union[Dict[str, Any], ResearchResult]) -> Dict[str, Any]:
+        """Return the pipeline inputs; stages get their own copy of the results."""
+        if isinstance(result, ResearchResult):
+            return {"query": validated, "results": result.to_dict()}
+        return {"query": validated, "results": copy.deepcopy(result)}
+
+    @staticmethod
+    def _with_stages(result: Union[Dict[str, Any], ResearchResult], outputs: Dict[str, Any]
+                     ) -> Union[Dict[str, Any], ResearchResult]:
+        """Attach stage outputs to a new result, leaving `result` (possibly cached) as it was."""
+        if isinstance(result, ResearchResult):
+            return result.with_stages(outputs)
+        return dict(result, stages=outputs)
+
+    def _post_process(self, validated: str, result: Union[Dict[str, Any], ResearchResult]
+                      ) -> Union[Dict[str, Any], ResearchResult]:
+        """Run the registered stages and attach their outputs to the results."""
+        if not self.pipeline.stages:
+            return result
+        with stage("pipeline"):
+            outputs = self.pipeline.run(self._stage_inputs(validated, result))
+        return self._with_stages(result, outputs)
+
+    async def _apost_process(self, validated: str, result: Union[Dict[str, Any], ResearchResult]
+                             ) -> Union[Dict[str, Any], ResearchResult]:
+        """Asynchronous counterpart of `_post_process`."""
+        if not self.pipeline.stages:
+            return result
+        with stage("pipeline"):
+            outputs = await self.pipeline.arun(self._stage_inputs(validated, result))
+        return self._with_stages(result, outputs)
+
+    def _archive(self, validated: str, results: Dict[str, Any]) -> None:
+        """Append a fetched result to the result store, if one is configured."""
+        if self.store is not None:
+            self.store.append(results, query=validated)
+
+    def _process_response(self, raw_response: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Format and summarize a raw API response.
+
+        Args:
+            raw_response (dict): Raw response returned by the API client.
+
+        Returns:
+            dict: Summarized research results.
+        """
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
             self.logger.debug("Raw response received: %s", raw_response)
-            
+
+        with stage("format"):
             formatted_response = format_response(raw_response)
+        if debug:
             self.logger.debug("Formatted response: %s", formatted_response)
-            
+
+        with stage("summarize"):
             summarized_results = self.summarize_results(formatted_response)
+        if debug:
             self.logger.debug("Summarized results: %s", summarized_results)
-            
-            return summarized_results
-        
-        except APIError as e:
-            self.logger.error(f"API Error: {str(e)}")
-            raise
-        except ProcessingError as e:
-            self.logger.error(f"Processing Error: {str(e)}")
-            raise
+
+        return summarized_results
 
     def summarize_results(self, results: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -86,8 +693,44 @@ class CognitaAgent:
         """
         try:
             summary = summarize_results(results)
-            self.logger.info("Results summarized successfully")
+            self.logger.debug("Results summarized successfully")
             return summary
         except Exception as e:
-            self.logger.error(f"Error summarizing results: {str(e)}")
+            self.logger.error("Error summarizing results: %s", e)
             raise ProcessingError("Failed to summarize results") from e
+
+    def close(self) -> None:
+        """
+        Flush batched queries, stop polling jobs, release the pooled HTTP connections,
+        shut down the pipeline executors and close the cache, result store and
+        refresh state store.
+        """
+        if self._batcher is not None:
+            self._batcher.close()
+        if self._job_poller is not None:
+            self._job_poller.close()
+        self.api.close()
+        self.pipeline.close()
+        if self.cache is not None:
+            self.cache.close()
+        if self.store is not None:
+            self.store.close()
+        if self.refresh_states is not None:
+            self.refresh_states.close()
+
+    def __enter__(self) -> "CognitaAgent":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    async def aclose(self) -> None:
+        """Release the connections held by both the sync and async API clients."""
+        self.close()
+        await self.async_api.aclose()
+
+    async def __aenter__(self) -> "CognitaAgent":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
@@ -0,0 +1,337 @@
+"""
+Source Aggregation Module for Cognita SDK
+
+This module deduplicates and ranks the sources cited across many research results.
+Results for related topics cite the same papers under slightly different URLs, DOI
+spellings or title casing; the index recognizes them by a normalized fingerprint,
+merges their confidence scores and returns the best sources without sorting
+everything.
+
+Features:
+- `source_fingerprint`: 64-bit fingerprint of a source from its normalized DOI,
+  URL or title (in that order of preference).
+- `SourceIndex`: hashed index with O(1) deduplication per source, configurable
+  confidence merging ("max", "mean" or "noisy_or"), heap-based `top(k)` and an
+  optional capacity that evicts the lowest-scoring sources to bound memory.
+- `dedupe_sources`: order-preserving deduplication of a single sources list.
+"""
+
+import hashlib
+import heapq
+import itertools
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from urllib.parse import parse_qsl, urlencode
+from .models import ResearchResult, Source
+
+SourceLike = Union[str, Dict[str, Any], Source]
+
+MERGE_STRATEGIES = ("max", "mean", "noisy_or")
+
+_DOI_PREFIX = re.compile(r"^(?:https?://(?:dx\.)?doi\.org/|doi:\s*)", re.IGNORECASE)
+_NON_WORD = re.compile(r"[\W_]+", re.UNICODE)
+# scheme, netloc, path, query; a hand-rolled split is several times faster than urlsplit.
+_URL = re.compile(r"^(?:([A-Za-z][A-Za-z0-9+.-]*):)?//([^/?#]*)([^?#]*)(?:\?([^#]*))?")
+_TRACKING_PARAMS = ("utm_", "fbclid", "gclid")
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def _fields(source: SourceLike) -> Tuple[Optional[str], Optional[str], Optional[str], Optional[float]]:
+    """Return `(doi, url, title, confidence)` of a source in any supported shape."""
+    if isinstance(source, Source):
+        return source.doi, source.url, source.title, source.confidence
+    if isinstance(source, dict):
+        return source.get("doi"), source.get("url"), source.get("title"), source.get("confidence")
+    return None, None, str(source), None
+
+
+def normalize_doi(doi: str) -> str:
+    """Lowercase a DOI and strip `doi:` and resolver URL prefixes."""
+    return _DOI_PREFIX.sub("", doi.strip()).lower()
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize a URL for comparison.
+
+    The scheme is dropped (http and https count as the same), the host is lowercased
+    without `www.` and default ports, and fragments, tracking parameters and trailing
+    slashes are removed. Remaining query parameters are sorted.
+    """
+    url = url.strip()
+    match = _URL.match(url)
+    if match is None:
+        return url.lower()
+    scheme, netloc, path, query = match.groups()
+    netloc = netloc.rpartition("@")[2].lower()
+    if netloc.startswith("["):
+        host, _, port = netloc.partition("]")
+        host, port = host + "]", port[1:]
+    else:
+        host, _, port = netloc.partition(":")
+    if host.startswith("www."):
+        host = host[4:]
+    if port and port != str(_DEFAULT_PORTS.get((scheme or "").lower())):
+        host = f"{host}:{port}"
+    normalized = "//" + host + path.rstrip("/")
+    if query:
+        query = urlencode(sorted(
+            (key, value) for key, value in parse_qsl(query, keep_blank_values=True)
+            if not key.lower().startswith(_TRACKING_PARAMS)
+        ))
+        if query:
+            normalized += "?" + query
+    return normalized
+
+
+def normalize_title(title: str) -> str:
+    """Casefold a title and collapse punctuation and whitespace to single spaces."""
+    return _NON_WORD.sub(" ", title.casefold()).strip()
+
+
+def source_fingerprint(source: SourceLike) -> Optional[int]:
+    """
+    Compute the fingerprint identifying a source.
+
+    Sources with a DOI are identified by it; otherwise by their URL and, failing
+    that, their title. The key is hashed to 64 bits so the index stores a small
+    integer per source instead of the normalized strings.
+
+    Args:
+        source (str, dict or Source): A source as found in research results.
+
+    Returns:
+        int: The fingerprint, or None if the source has no DOI, URL or title.
+    """
+    doi, url, title, _ = _fields(source)
+    return _fingerprint(doi, url, title)
+
+
+def _fingerprint(doi: Optional[str], url: Optional[str], title: Optional[str]) -> Optional[int]:
+    if doi:
+        key = "doi:" + normalize_doi(doi)
+    elif url:
+        key = "url:" + normalize_url(url)
+    elif title and normalize_title(title):
+        key = "title:" + normalize_title(title)
+    else:
+        return None
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class _Entry:
+    """Aggregated state of one distinct source."""
+
+    __slots__ = ("source", "count", "best", "total", "complement")
+
+    def __init__(self, source: SourceLike):
+        self.source = source
+        self.count = 0
+        self.best = 0.0
+        self.total = 0.0
+        self.complement = 1.0
+
+    def add(self, confidence: float) -> None:
+        self.count += 1
+        self.best = max(self.best, confidence)
+        self.total += confidence
+        self.complement *= 1.0 - min(max(confidence, 0.0), 1.0)
+
+
+class SourceIndex:
+    """
+    Index of distinct sources across many research results.
+
+    Example:
+        index = SourceIndex(capacity=100_000)
+        for result in results:
+            index.add_result(result)
+        for source in index.top(10):
+            print(source["confidence"], source["occurrences"], source.get("title"))
+
+    Confidence of repeated sources is merged with one of:
+
+    - "max": the highest confidence seen (default).
+    - "mean": the average confidence over all occurrences.
+    - "noisy_or": `1 - prod(1 - c)`, which rises as independent results agree.
+
+    Sources without their own confidence inherit the confidence of the result that
+    cited them.
+    """
+
+    def __init__(self, capacity: Optional[int] = None, merge: str = "max"):
+        """
+        Args:
+            capacity (int, optional): Maximum distinct sources kept. When exceeded, the
+                lowest-scoring source is evicted. None keeps every source.
+            merge (str): Confidence merge strategy: "max", "mean" or "noisy_or".
+
+        Raises:
+            ValueError: If `capacity` is not positive or `merge` is unknown.
+        """
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if merge not in MERGE_STRATEGIES:
+            raise ValueError(f"merge must be one of {', '.join(MERGE_STRATEGIES)}")
+        self.capacity = capacity
+        self.merge = merge
+        self.added = 0
+        self.evicted = 0
+        self._entries: Dict[int, _Entry] = {}
+        # Min-heap of (score, seq, fingerprint) used for eviction. Entries whose score
+        # changed since they were pushed are stale and skipped when popped.
+        self._heap: List[Tuple[float, int, int]] = []
+        self._counter = itertools.count()
+
+    def _score(self, entry: _Entry) -> float:
+        if self.merge == "max":
+            return entry.best
+        if self.merge == "mean":
+            return entry.total / entry.count if entry.count else 0.0
+        return 1.0 - entry.complement
+
+    def add(self, source: SourceLike, confidence: Optional[float] = None) -> Optional[int]:
+        """
+        Add one occurrence of a source.
+
+        Args:
+            source (str, dict or Source): The source.
+            confidence (float, optional): Fallback confidence when the source has none.
+
+        Returns:
+            int: The source's fingerprint, or None if it could not be identified.
+        """
+        doi, url, title, own = _fields(source)
+        fingerprint = _fingerprint(doi, url, title)
+        if fingerprint is None:
+            return None
+        score_in = float(own if own is not None else confidence or 0.0)
+        entry = self._entries.get(fingerprint)
+        if entry is None:
+            entry = self._entries[fingerprint] = _Entry(source)
+            previous = None
+        else:
+            previous = self._score(entry)
+        entry.add(score_in)
+        self.added += 1
+        if self.capacity is not None:
+            score = self._score(entry)
+            if score != previous:
+                heapq.heappush(self._heap, (score, next(self._counter), fingerprint))
+            if len(self._entries) > self.capacity:
+                self._evict()
+            elif len(self._heap) > 2 * self.capacity + 16:
+                self._compact()
+        return fingerprint
+
+    def _is_current(self, score: float, fingerprint: int) -> bool:
+        entry = self._entries.get(fingerprint)
+        return entry is not None and self._score(entry) == score
+
+    def _evict(self) -> None:
+        while self._heap:
+            score, _, fingerprint = heapq.heappop(self._heap)
+            if self._is_current(score, fingerprint):
+                del self._entries[fingerprint]
+                self.evicted += 1
+                return
+
+    def _compact(self) -> None:
+        # Drop stale heap items so the heap stays proportional to the capacity.
+        seen = set()
+        fresh = []
+        for score, seq, fingerprint in sorted(self._heap, key=lambda item: -item[1]):
+            if fingerprint not in seen and self._is_current(score, fingerprint):
+                seen.add(fingerprint)
+                fresh.append((score, seq, fingerprint))
+        heapq.heapify(fresh)
+        self._heap = fresh
+
+    def add_sources(self, sources: Iterable[SourceLike], confidence: Optional[float] = None) -> None:
+        """Add every source of a list, with `confidence` as fallback."""
+        for source in sources:
+            self.add(source, confidence)
+
+    def add_result(self, result: Union[ResearchResult, Dict[str, Any]]) -> None:
+        """
+        Add the sources of one research result.
+
+        Args:
+            result (ResearchResult or dict): A typed result, a summarized or formatted
+                result dictionary, or a raw API response.
+        """
+        if isinstance(result, ResearchResult):
+            self.add_sources(result.sources, result.confidence)
+        else:
+            confidence = result.get("confidence", result.get("confidence_score"))
+            self.add_sources(result.get("sources", ()), confidence)
+
+    def _describe(self, entry: _Entry) -> Dict[str, Any]:
+        source = entry.source
+        if isinstance(source, Source):
+            data = source.to_dict()
+        elif isinstance(source, dict):
+            data = dict(source)
+        else:
+            data = {"title": source}
+        data["confidence"] = self._score(entry)
+        data["occurrences"] = entry.count
+        return data
+
+    def top(self, k: int) -> List[Dict[str, Any]]:
+        """
+        Return the `k` highest-scoring sources.
+
+        Uses a bounded heap (`heapq.nlargest`), i.e. O(n log k) instead of sorting all
+        n sources. Ties are broken by the number of occurrences.
+
+        Args:
+            k (int): Number of sources to return.
+
+        Returns:
+            list: Source dictionaries (the first representative seen) with the merged
+            `confidence` and the number of `occurrences`, best first.
+        """
+        best = heapq.nlargest(k, self._entries.values(),
+                              key=lambda entry: (self._score(entry), entry.count))
+        return [self._describe(entry) for entry in best]
+
+    def get(self, source: SourceLike) -> Optional[Dict[str, Any]]:
+        """Return the aggregated entry matching `source`, or None."""
+        entry = self._entries.get(source_fingerprint(source))
+        return self._describe(entry) if entry is not None else None
+
+    def __contains__(self, source: SourceLike) -> bool:
+        return source_fingerprint(source) in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for entry in self._entries.values():
+            yield self._describe(entry)
+
+    def __repr__(self) -> str:
+        return f"SourceIndex(sources={len(self)}, added={self.added}, merge={self.merge!r})"
+
+
+def dedupe_sources(sources: Iterable[SourceLike]) -> List[SourceLike]:
+    """
+    Remove duplicate sources, keeping the first occurrence of each.
+
+    Args:
+        sources (iterable): Sources of one or more results.
+
+    Returns:
+        list: The distinct sources in their original order. Sources that cannot be
+        fingerprinted are kept.
+    """
+    seen = set()
+    distinct = []
+    for source in sources:
+        fingerprint = source_fingerprint(source)
+        if fingerprint is None or fingerprint not in seen:
+            if fingerprint is not None:
+                seen.add(fingerprint)
+            distinct.append(source)
+    return distinct
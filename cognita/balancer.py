@@ -0,0 +1,222 @@
+"""
+Load Balancing Module for Cognita SDK
+
+This module spreads requests over several base URLs (regions or replicas) of the
+Deep Research API. The API clients ask the balancer for a base URL on every
+attempt, so a failed attempt fails over to another replica.
+
+Features:
+- `LoadBalancer`: latency-aware selection among the healthy base URLs with one
+  of three strategies:
+  - "p2c" (power of two choices): compares two random replicas by EWMA latency
+    times outstanding requests. Replicas without latency samples count with the
+    median latency of the measured ones.
+  - "ewma": always takes the replica with the lowest such score.
+  - "round_robin": ignores latency.
+- Per-replica statistics (`EndpointStats`): EWMA latency, requests in flight,
+  request and failure counts.
+- `parse_base_urls(config)`: reads `API_BASE_URLS`, falling back to `API_BASE_URL`.
+
+Replica health is not tracked here: the clients skip replicas whose circuit
+breaker is open (see `cognita.retry.CircuitBreaker`) and pass the remaining ones
+as candidates.
+"""
+
+import itertools
+import random
+import statistics
+import threading
+from typing import Any, Dict, List, Optional, Sequence
+
+BALANCER_STRATEGIES = ("p2c", "ewma", "round_robin")
+
+
+def parse_base_urls(config) -> List[str]:
+    """
+    Return the configured base URLs, without trailing slashes.
+
+    `API_BASE_URLS` may be a list or a comma-separated string; when it is empty,
+    `API_BASE_URL` is the only base URL.
+
+    Args:
+        config (Config): Configuration object.
+
+    Returns:
+        list: Base URLs in configured order; the first one is the primary.
+    """
+    urls = getattr(config, "API_BASE_URLS", None) or [config.API_BASE_URL]
+    if isinstance(urls, str):
+        urls = urls.split(",")
+    return [url.strip().rstrip("/") for url in urls if url and url.strip()]
+
+
+class EndpointStats:
+    """
+    Running statistics of one base URL.
+
+    Attributes:
+        url (str): The base URL.
+        latency (float): EWMA of attempt latencies in seconds, or None before the
+            first sample.
+        in_flight (int): Attempts currently running.
+        requests (int): Attempts started.
+        failures (int): Attempts that failed with a retryable error.
+    """
+
+    __slots__ = ("url", "latency", "in_flight", "requests", "failures")
+
+    def __init__(self, url: str):
+        self.url = url
+        self.latency: Optional[float] = None
+        self.in_flight = 0
+        self.requests = 0
+        self.failures = 0
+
+    def score(self, default_latency: float = 1.0) -> float:
+        """
+        Expected wait on this replica.
+
+        Args:
+            default_latency (float): Latency assumed while the replica has no samples,
+                so requests already in flight still count against it.
+        """
+        latency = self.latency if self.latency is not None else default_latency
+        return latency * (self.in_flight + 1)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the statistics as a plain dictionary."""
+        return {
+            "latency": self.latency,
+            "in_flight": self.in_flight,
+            "requests": self.requests,
+            "failures": self.failures,
+        }
+
+
+class LoadBalancer:
+    """
+    Chooses the base URL of each request attempt.
+
+    Usage:
+        url = balancer.choose(candidates)
+        balancer.start(url)
+        ...  # make the request
+        balancer.finish(url, latency, failed=False)
+
+    The balancer is thread-safe and may be shared by a synchronous and an async client.
+    """
+
+    def __init__(self, urls: Sequence[str], strategy: str = "p2c", decay: float = 0.3,
+                 seed: Optional[int] = None):
+        """
+        Args:
+            urls (sequence): Base URLs to balance over.
+            strategy (str): "p2c", "ewma" or "round_robin".
+            decay (float): Weight of the newest latency sample in the EWMA (0-1].
+            seed (int, optional): Seed of the random choices made by "p2c".
+
+        Raises:
+            ValueError: If no URL is given, the strategy is unknown or `decay` is out of range.
+        """
+        if not urls:
+            raise ValueError("at least one base URL is required")
+        if strategy not in BALANCER_STRATEGIES:
+            raise ValueError(f"unknown balancer strategy: {strategy}")
+        if not 0.0 < decay <= 1.0:
+            raise ValueError("decay must be in (0, 1]")
+        self.urls = list(urls)
+        self.strategy = strategy
+        self.decay = decay
+        self._stats = {url: EndpointStats(url) for url in self.urls}
+        self._random = random.Random(seed)
+        self._cycle = itertools.count()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config, urls: Optional[Sequence[str]] = None) -> "LoadBalancer":
+        """
+        Build a balancer from the `API_BASE_URLS` and `API_BALANCER*` settings.
+
+        Args:
+            config (Config): Configuration object.
+            urls (sequence, optional): Base URLs; defaults to `parse_base_urls(config)`.
+        """
+        return cls(
+            urls if urls is not None else parse_base_urls(config),
+            strategy=(getattr(config, "API_BALANCER", "p2c") or "p2c").lower(),
+            decay=getattr(config, "API_BALANCER_DECAY", 0.3),
+        )
+
+    def choose(self, candidates: Optional[Sequence[str]] = None) -> str:
+        """
+        Pick the base URL for the next attempt.
+
+        Args:
+            candidates (sequence, optional): Base URLs eligible for this attempt,
+                e.g. the healthy ones not yet tried. Defaults to all of them.
+
+        Returns:
+            str: The chosen base URL.
+
+        Raises:
+            ValueError: If `candidates` is empty.
+        """
+        urls = self.urls if candidates is None else list(candidates)
+        if not urls:
+            raise ValueError("no candidate base URL")
+        if len(urls) == 1:
+            return urls[0]
+        with self._lock:
+            if self.strategy == "round_robin":
+                return urls[next(self._cycle) % len(urls)]
+            if self.strategy == "p2c":
+                urls = self._random.sample(urls, 2)
+            measured = [stats.latency for stats in self._stats.values() if stats.latency is not None]
+            default = statistics.median(measured) if measured else 1.0
+            # Unmeasured replicas win ties so they get sampled; min() then keeps
+            # the first of equal keys, i.e. the configured order.
+            return min(urls, key=lambda url: (self._stats[url].score(default),
+                                              self._stats[url].latency is not None))
+
+    def start(self, url: str) -> None:
+        """Record that an attempt to `url` started. Unknown URLs get statistics too."""
+        with self._lock:
+            stats = self._stats.get(url)
+            if stats is None:
+                stats = self._stats[url] = EndpointStats(url)
+            stats.in_flight += 1
+            stats.requests += 1
+
+    def finish(self, url: str, latency: Optional[float], failed: bool = False) -> None:
+        """
+        Record the end of an attempt started with `start`.
+
+        Args:
+            url (str): The base URL.
+            latency (float, optional): Seconds the attempt took; None records no
+                sample (e.g. the attempt was abandoned for reasons unrelated to
+                the replica).
+            failed (bool): Whether the attempt failed with a retryable error. The
+                sample then counts at least twice the current average, so a
+                replica that keeps failing drifts to the back.
+        """
+        with self._lock:
+            stats = self._stats[url]
+            stats.in_flight -= 1
+            if failed:
+                stats.failures += 1
+                if latency is not None and stats.latency is not None:
+                    latency = max(latency, 2 * stats.latency)
+            if latency is not None:
+                if stats.latency is None:
+                    stats.latency = latency
+                else:
+                    stats.latency += self.decay * (latency - stats.latency)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return the statistics of every base URL, keyed by URL."""
+        with self._lock:
+            return {url: stats.as_dict() for url, stats in self._stats.items()}
+
+    def __repr__(self) -> str:
+        return f"LoadBalancer(strategy={self.strategy!r}, urls={self.urls!r})"
@@ -0,0 +1,222 @@
+"""
+Batch Execution Module for Cognita SDK
+
+This module runs many research queries concurrently on a thread pool and streams
+back one outcome per query as results become available.
+
+Features:
+- Bounded concurrency through a shared thread pool.
+- Identical (post-validation) queries are submitted to the API only once.
+- Errors are captured per query (`APIError`, `ProcessingError` or any other
+  exception), so one failing topic does not abort the rest of the batch.
+- Aggregate timing statistics for the whole batch.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+from .errors import ProcessingError
+from .utils import validate_query
+
+
+class QueryOutcome:
+    """
+    Result of a single query in a batch.
+
+    Attributes:
+        index (int): Position of the query in the input sequence.
+        query (str): The query as it was passed in.
+        result (dict): Summarized research results, or None on failure.
+        error (Exception): The captured exception, usually an `APIError` or
+            `ProcessingError`, or None on success.
+        elapsed (float): Seconds spent executing the query (shared by duplicates).
+    """
+
+    __slots__ = ("index", "query", "result", "error", "elapsed")
+
+    def __init__(self, index: int, query: str, result: Optional[Dict[str, Any]] = None,
+                 error: Optional[Exception] = None, elapsed: float = 0.0):
+        self.index = index
+        self.query = query
+        self.result = result
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def ok(self) -> bool:
+        """Whether the query completed successfully."""
+        return self.error is None
+
+    def __repr__(self) -> str:
+        status = "ok" if self.ok else type(self.error).__name__
+        return f"QueryOutcome(index={self.index}, query={self.query!r}, status={status})"
+
+
+class BatchStats:
+    """
+    Aggregate statistics for a batch run.
+
+    Attributes:
+        total (int): Number of outcomes yielded so far.
+        succeeded (int): Number of successful outcomes.
+        failed (int): Number of failed outcomes.
+        rejected (int): Number of queries that failed validation and were never sent.
+        submitted (int): Number of distinct queries sent to the API.
+        wall_time (float): Seconds from the start of the batch to the last outcome.
+        latencies (list): Per-query execution times of the distinct submitted queries.
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.rejected = 0
+        self.submitted = 0
+        self.wall_time = 0.0
+        self.latencies: List[float] = []
+
+    @property
+    def deduplicated(self) -> int:
+        """Number of queries served by another identical query in the batch."""
+        return max(self.total - self.rejected - self.submitted, 0)
+
+    @property
+    def mean_latency(self) -> float:
+        return sum(self.latencies) / len(self.latencies) if self.latencies else 0.0
+
+    @property
+    def min_latency(self) -> float:
+        return min(self.latencies) if self.latencies else 0.0
+
+    @property
+    def max_latency(self) -> float:
+        return max(self.latencies) if self.latencies else 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Outcomes per second of wall time."""
+        return self.total / self.wall_time if self.wall_time else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the statistics as a plain dictionary."""
+        return {
+            "total": self.total,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "submitted": self.submitted,
+            "deduplicated": self.deduplicated,
+            "wall_time": self.wall_time,
+            "mean_latency": self.mean_latency,
+            "min_latency": self.min_latency,
+            "max_latency": self.max_latency,
+            "throughput": self.throughput,
+        }
+
+    def __repr__(self) -> str:
+        return f"BatchStats({self.as_dict()})"
+
+
+class BatchRun:
+    """
+    Iterable over the outcomes of a batch of queries.
+
+    Work starts when iteration begins. Outcomes are yielded as each query completes
+    or, when `ordered` is true, in input order. `stats` is updated as outcomes are
+    yielded and is complete once iteration finishes. Abandoning iteration early
+    cancels queries that have not started yet.
+    """
+
+    def __init__(self, execute: Callable[[str], Dict[str, Any]], queries: Iterable[str],
+                 max_concurrency: int = 10, ordered: bool = False):
+        """
+        Args:
+            execute (callable): Function executing one validated query.
+            queries (iterable): Research queries to run.
+            max_concurrency (int): Maximum number of queries executing at once.
+            ordered (bool): Yield outcomes in input order instead of completion order.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self._execute = execute
+        self._queries = list(queries)
+        self.max_concurrency = max_concurrency
+        self.ordered = ordered
+        self.stats = BatchStats()
+
+    def __iter__(self) -> Iterator[QueryOutcome]:
+        return self._run()
+
+    def results(self) -> List[QueryOutcome]:
+        """Run the whole batch and return the outcomes in input order."""
+        return sorted(self, key=lambda outcome: outcome.index)
+
+    def _timed(self, query: str):
+        start = time.perf_counter()
+        try:
+            return self._execute(query), None, time.perf_counter() - start
+        except Exception as e:
+            # Unexpected errors are outcomes too: raising them from the iterator
+            # would drop every outcome not yet yielded.
+            return None, e, time.perf_counter() - start
+
+    def _record(self, outcome: QueryOutcome) -> QueryOutcome:
+        self.stats.total += 1
+        if outcome.ok:
+            self.stats.succeeded += 1
+        else:
+            self.stats.failed += 1
+        self.stats.wall_time = time.perf_counter() - self._started
+        return outcome
+
+    def _run(self) -> Iterator[QueryOutcome]:
+        self.stats = BatchStats()
+        self._started = time.perf_counter()
+        self._timed_futures = set()
+        invalid: List[QueryOutcome] = []
+        groups: Dict[str, List[int]] = {}
+        for index, query in enumerate(self._queries):
+            try:
+                groups.setdefault(validate_query(query), []).append(index)
+            except ProcessingError as e:
+                invalid.append(QueryOutcome(index, query, error=e))
+        self.stats.rejected = len(invalid)
+        self.stats.submitted = len(groups)
+
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrency)
+        futures = {executor.submit(self._timed, validated): indices
+                   for validated, indices in groups.items()}
+        try:
+            if self.ordered:
+                yield from self._iter_ordered(futures, invalid)
+            else:
+                for outcome in invalid:
+                    yield self._record(outcome)
+                for future in as_completed(futures):
+                    yield from self._expand(future, futures[future])
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def _iter_ordered(self, futures, invalid) -> Iterator[QueryOutcome]:
+        by_index = {outcome.index: outcome for outcome in invalid}
+        future_by_index = {index: future for future, indices in futures.items()
+                           for index in indices}
+        for index in range(len(self._queries)):
+            if index in by_index:
+                yield self._record(by_index[index])
+            else:
+                future = future_by_index[index]
+                yield self._record(self._outcome(future, index))
+
+    def _expand(self, future, indices) -> Iterator[QueryOutcome]:
+        for index in indices:
+            yield self._record(self._outcome(future, index))
+
+    def _outcome(self, future, index: int) -> QueryOutcome:
+        result, error, elapsed = future.result()
+        if future not in self._timed_futures:
+            self._timed_futures.add(future)
+            self.stats.latencies.append(elapsed)
+        return QueryOutcome(index, self._queries[index], result, error, elapsed)
@@ -0,0 +1,298 @@
+"""
+Result Cache Module for Cognita SDK
+
+This module provides pluggable caches for summarized research results, so repeated
+queries can be answered without another round-trip to the Deep Research API.
+
+Features:
+- `make_cache_key` derives a stable key from the validated query and request parameters.
+- `MemoryCache`: thread-safe in-process LRU cache with TTL and an entry limit.
+- `SQLiteCache`: on-disk cache that survives process restarts.
+- Hit, miss and eviction counters on every backend.
+"""
+
+import copy
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+from .errors import ConfigError
+
+
+def make_cache_key(query: str, max_results: int, min_confidence: float) -> str:
+    """
+    Build the cache key for a research request.
+
+    Args:
+        query (str): Validated (normalized) research query.
+        max_results (int): `MAX_RESULTS` sent with the request.
+        min_confidence (float): `MIN_CONFIDENCE` sent with the request.
+
+    Returns:
+        str: Hex digest identifying the request.
+    """
+    material = json.dumps([query, max_results, float(min_confidence)], ensure_ascii=False)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class CacheStats:
+    """
+    Counters describing cache effectiveness.
+
+    Attributes:
+        hits (int): Lookups answered from the cache.
+        misses (int): Lookups that found no live entry.
+        evictions (int): Entries removed to respect the size limit.
+        expirations (int): Entries dropped because their TTL elapsed.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the counters as a plain dictionary."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": self.hit_rate,
+        }
+
+    def __repr__(self) -> str:
+        return f"CacheStats({self.as_dict()})"
+
+
+class ResultCache(ABC):
+    """
+    Interface shared by all cache backends.
+
+    Subclasses implement `get`, `set`, `delete`, `clear` and `__len__`, and update
+    `stats` as they go; a backend missing one of them cannot be instantiated.
+    Values are summarized result dictionaries, and `get` must not return an object
+    that a later `get` also returns, so callers may modify what they receive.
+    """
+
+    def __init__(self):
+        self.stats = CacheStats()
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached value for `key`, or None if missing or expired."""
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store `value` under `key`."""
+        ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove `key` from the cache if present."""
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        ...
+
+    def close(self) -> None:
+        """Release resources held by the backend."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Return the number of stored entries."""
+        ...
+
+
+class MemoryCache(ResultCache):
+    """
+    In-process LRU cache with optional TTL.
+
+    Values are deep-copied when stored and when returned, so neither the caller
+    that stored a value nor those reading it can change the cached entry.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: Optional[float] = None):
+        """
+        Args:
+            max_entries (int): Maximum number of entries before the least recently
+                used entry is evicted.
+            ttl (float, optional): Seconds an entry stays valid. None disables expiry.
+        """
+        super().__init__()
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+        return copy.deepcopy(value)
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCache(ResultCache):
+    """
+    Persistent cache stored in a SQLite database.
+
+    Entries survive process restarts. Recency is tracked per entry so the least
+    recently used rows are evicted once `max_entries` is exceeded. A single
+    connection is shared between threads and guarded by a lock.
+    """
+
+    def __init__(self, path: str, max_entries: Optional[int] = None, ttl: Optional[float] = None):
+        """
+        Args:
+            path (str): Database file path (":memory:" for a throwaway database).
+            max_entries (int, optional): Maximum number of rows to keep.
+            ttl (float, optional): Seconds an entry stays valid. None disables expiry.
+        """
+        super().__init__()
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " expires_at REAL,"
+                " accessed_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed_at)"
+            )
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.stats.misses += 1
+                return None
+            value, expires_at = row
+            with self._conn:
+                if expires_at is not None and expires_at <= now:
+                    self._conn.execute("DELETE FROM results WHERE key = ?", (key,))
+                    self.stats.expirations += 1
+                    self.stats.misses += 1
+                    return None
+                self._conn.execute(
+                    "UPDATE results SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+            self.stats.hits += 1
+        return json.loads(value)
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        now = time.time()
+        expires_at = now + self.ttl if self.ttl is not None else None
+        encoded = json.dumps(value, ensure_ascii=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (key, value, expires_at, accessed_at)"
+                " VALUES (?, ?, ?, ?)",
+                (key, encoded, expires_at, now),
+            )
+            if self.max_entries is not None:
+                deleted = self._conn.execute(
+                    "DELETE FROM results WHERE key IN ("
+                    " SELECT key FROM results ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                ).rowcount
+                self.stats.evictions += max(deleted, 0)
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM results WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM results")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+
+def create_cache(config) -> Optional[ResultCache]:
+    """
+    Build the cache described by the configuration.
+
+    Uses `CACHE_BACKEND` ("none", "memory" or "sqlite"), `CACHE_TTL`,
+    `CACHE_MAX_ENTRIES` and `CACHE_PATH`.
+
+    Args:
+        config (Config): Configuration object.
+
+    Returns:
+        ResultCache: The configured cache, or None when caching is disabled.
+
+    Raises:
+        ConfigError: If `CACHE_BACKEND` names an unknown backend.
+    """
+    backend = (getattr(config, "CACHE_BACKEND", "none") or "none").lower()
+    ttl = getattr(config, "CACHE_TTL", 3600.0) or None
+    max_entries = getattr(config, "CACHE_MAX_ENTRIES", 1024)
+    if backend == "none":
+        return None
+    if backend == "memory":
+        return MemoryCache(max_entries=max_entries, ttl=ttl)
+    if backend == "sqlite":
+        path = getattr(config, "CACHE_PATH", ".cognita_cache.sqlite3")
+        return SQLiteCache(path, max_entries=max_entries, ttl=ttl)
+    raise ConfigError(f"Unknown cache backend: {backend}")
@@ -1,5 +1,53 @@
+import numbers
 import os
-from dotenv import load_dotenv
+import threading
+from typing import Any, Dict, Mapping, Optional
+
+_dotenv_loaded = False
+_snapshot: Optional["Config"] = None
+_snapshot_lock = threading.Lock()
+
+
+def _load_dotenv_once() -> None:
+    """Load the `.env` file into the environment the first time it is needed."""
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        # Imported here so that importing the package does not pull in dotenv.
+        from dotenv import load_dotenv
+        load_dotenv()
+        _dotenv_loaded = True
+
+
+def _env_bool(env: Mapping[str, str], name: str, default: bool) -> bool:
+    """Read a boolean flag from the environment ("1", "true", "yes", "on")."""
+    value = env.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _typed_setting(name: str, default: Any, value: Any) -> Any:
+    """
+    Validate a non-string `from_dict` value against the type of the setting's default.
+
+    Numbers are taken as given (an int setting such as `API_TIMEOUT` accepts 2.5),
+    float settings are converted to float, flags must be bools and lists must hold
+    strings.
+
+    Raises:
+        ValueError: If the value does not fit the setting.
+    """
+    if isinstance(default, bool):
+        if isinstance(value, bool):
+            return value
+    elif isinstance(default, (int, float)):
+        if isinstance(value, numbers.Real) and not isinstance(value, bool):
+            return float(value) if isinstance(default, float) else value
+    elif isinstance(default, (list, tuple)):
+        if isinstance(value, (list, tuple)) and all(isinstance(item, str) for item in value):
+            return [item.strip() for item in value if item.strip()]
+    raise ValueError(f"Invalid value for {name}: {value!r}")
+
 
 class Config:
     """
@@ -9,29 +57,283 @@ class Config:
     and provides a structured way to access them.
 
     Features:
-    - Loads environment variables using `dotenv`.
+    - Loads environment variables using `dotenv` (once per process).
+    - Builds immutable snapshots from a dictionary or environment mapping without
+      touching the filesystem (`from_dict`, `from_env`), and a cached process-wide
+      snapshot (`snapshot`).
     - Provides default values for optional settings.
     - Validates essential configuration parameters.
 
     Attributes:
         API_BASE_URL (str): Base URL for the Deep Research API.
+        API_BASE_URLS (list): Base URLs of several replicas to balance requests over
+            (comma-separated in the environment); empty uses `API_BASE_URL` only.
+            Frozen configurations hold a tuple.
+        API_BALANCER (str): Replica selection strategy: "p2c" (power of two choices
+            on latency), "ewma" (least latency) or "round_robin".
+        API_BALANCER_DECAY (float): Weight of the newest sample in a replica's
+            latency average (0-1].
         API_KEY (str): API key for authentication.
         API_TIMEOUT (int): Timeout duration for API requests.
         MAX_RESULTS (int): Maximum number of research results per request.
         MIN_CONFIDENCE (float): Minimum confidence score for filtering research results.
+        API_POOL_CONNECTIONS (int): Number of per-host connection pools to keep.
+        API_POOL_MAXSIZE (int): Maximum number of connections kept open per host.
+        API_POOL_BLOCK (bool): Block when the pool is exhausted instead of opening
+            extra, non-reusable connections.
+        API_KEEP_ALIVE (bool): Reuse connections between requests (HTTP keep-alive).
+        API_MAX_CONCURRENCY (int): Maximum number of in-flight requests for the async client.
+        API_RETRY_MAX_ATTEMPTS (int): Total attempts per request, including the first.
+        API_RETRY_BACKOFF_BASE (float): Seconds before the first retry; doubles per attempt.
+        API_RETRY_BACKOFF_CAP (float): Upper bound for a single retry delay.
+        API_RETRY_JITTER (bool): Randomize retry delays to avoid synchronized retries.
+        API_RETRY_RESPECT_RETRY_AFTER (bool): Honor the server's `Retry-After` header.
+        API_RETRY_DEADLINE (float): Overall seconds allowed for all attempts (0 disables).
+        API_CONNECT_TIMEOUT (float): Seconds allowed to connect per attempt (0 uses
+            `API_TIMEOUT`).
+        API_READ_TIMEOUT (float): Seconds allowed between response bytes per attempt
+            (0 uses `API_TIMEOUT`).
+        API_DEADLINE (float): Overall seconds allowed per query, across rate limiting,
+            retries and formatting (0 disables).
+        API_HEDGE_URL (str): Secondary base URL that slow research requests are
+            duplicated to; empty disables hedging.
+        API_HEDGE_DELAY (float): Seconds to wait for the primary before hedging (0
+            adapts the delay to recent latencies).
+        API_HEDGE_PERCENTILE (float): Latency percentile used as the adaptive hedge delay.
+        API_CIRCUIT_FAILURE_THRESHOLD (int): Consecutive failures that open an endpoint's breaker.
+        API_CIRCUIT_RESET_TIMEOUT (float): Seconds a breaker stays open before probing again.
+        API_RATE_LIMIT (float): Maximum requests per second (0 disables rate limiting).
+        API_RATE_BURST (float): Token bucket capacity (0 uses the rate, at least 1).
+        API_RATE_LIMIT_FILE (str): State file shared by processes on one host; empty
+            keeps the rate limit in-process.
+        API_MAX_CONCURRENT_REQUESTS (int): Maximum requests in flight per process (0 disables).
+        CACHE_BACKEND (str): Result cache backend: "none", "memory" or "sqlite".
+        CACHE_TTL (float): Seconds a cached result stays valid (0 disables expiry).
+        CACHE_MAX_ENTRIES (int): Maximum number of cached results.
+        CACHE_PATH (str): Database file used by the "sqlite" cache backend.
+        JOB_POLL_MIN_INTERVAL (float): Seconds before a job's first status check and
+            after its status changes.
+        JOB_POLL_MAX_INTERVAL (float): Maximum seconds between status checks of a job.
+        JOB_POLL_BACKOFF (float): Growth factor of the polling interval while a job's
+            status is unchanged.
+        JOB_TIMEOUT (float): Seconds after which a job is abandoned (0 waits forever).
+        JOB_POLL_TIMEOUT (float): Seconds allowed per job status check (0 disables).
+        BATCH_MAX_SIZE (int): Maximum queries packed into one batch request.
+        BATCH_WINDOW (float): Seconds to collect queries before sending a batch.
+        BATCH_MAX_IN_FLIGHT (int): Maximum batch requests in flight at once.
+        JSON_BACKEND (str): JSON serializer: "auto" (orjson when installed), "orjson" or "json".
+        QUERY_MATCHING (str): How cached results are matched to queries: "exact"
+            (validated query), "canonical" (case, punctuation, stopwords and word
+            endings ignored) or "similar" (canonical plus near-duplicate reuse).
+        QUERY_SIMILARITY_THRESHOLD (float): Minimum similarity (0-1) for "similar"
+            matching to reuse a cached result.
+        QUERY_SIMILARITY_CAPACITY (int): Recent queries remembered for "similar" matching.
+        RESULT_STORE_PATH (str): Base path of a `ResultStore` archiving every fetched
+            result; empty disables archiving.
+        INCREMENTAL_REFRESH (bool): Fetch queries seen before with conditional requests
+            and merge delta responses instead of downloading full results.
+        REFRESH_STATE_PATH (str): SQLite file keeping refresh states across restarts;
+            empty keeps them in memory.
+        REFRESH_MAX_STATES (int): Maximum number of queries with a refresh state.
+        PIPELINE_WORKERS (int): Threads running post-processing stages in parallel.
+        PIPELINE_PROCESSES (int): Worker processes for "process" stages; 0 uses the
+            number of CPUs.
+        PIPELINE_MEMO_SIZE (int): Queries whose stage outputs are memoized.
     """
 
-    def __init__(self):
-        """Initialize configuration from environment variables."""
-        load_dotenv()
+    def __init__(self, env: Optional[Mapping[str, str]] = None):
+        """
+        Initialize configuration from environment variables.
+
+        Args:
+            env (mapping, optional): Variables to read instead of `os.environ`. The
+                `.env` file is only loaded when reading `os.environ`.
+        """
+        if env is None:
+            _load_dotenv_once()
+            env = os.environ
         
         # API Configuration
-        self.API_BASE_URL = os.getenv("API_BASE_URL", "https://api.research.com/v1")
-        self.API_KEY = os.getenv("API_KEY")
-        self.API_TIMEOUT = int(os.getenv("API_TIMEOUT", 30))
-        self.MAX_RESULTS = int(os.getenv("MAX_RESULTS", 10))
-        self.MIN_CONFIDENCE = float(os.getenv("MIN_CONFIDENCE", 0.7))
+        self.API_BASE_URL = env.get("API_BASE_URL", "https://api.research.com/v1")
+        self.API_BASE_URLS = [url.strip() for url in env.get("API_BASE_URLS", "").split(",") if url.strip()]
+        self.API_BALANCER = env.get("API_BALANCER", "p2c")
+        self.API_BALANCER_DECAY = float(env.get("API_BALANCER_DECAY", 0.3))
+        self.API_KEY = env.get("API_KEY")
+        self.API_TIMEOUT = int(env.get("API_TIMEOUT", 30))
+        self.MAX_RESULTS = int(env.get("MAX_RESULTS", 10))
+        self.MIN_CONFIDENCE = float(env.get("MIN_CONFIDENCE", 0.7))
+
+        # Connection pooling
+        self.API_POOL_CONNECTIONS = int(env.get("API_POOL_CONNECTIONS", 10))
+        self.API_POOL_MAXSIZE = int(env.get("API_POOL_MAXSIZE", 10))
+        self.API_POOL_BLOCK = _env_bool(env, "API_POOL_BLOCK", False)
+        self.API_KEEP_ALIVE = _env_bool(env, "API_KEEP_ALIVE", True)
+        self.API_MAX_CONCURRENCY = int(env.get("API_MAX_CONCURRENCY", 100))
+
+        # Retries and circuit breaking
+        self.API_RETRY_MAX_ATTEMPTS = int(env.get("API_RETRY_MAX_ATTEMPTS", 3))
+        self.API_RETRY_BACKOFF_BASE = float(env.get("API_RETRY_BACKOFF_BASE", 0.5))
+        self.API_RETRY_BACKOFF_CAP = float(env.get("API_RETRY_BACKOFF_CAP", 30))
+        self.API_RETRY_JITTER = _env_bool(env, "API_RETRY_JITTER", True)
+        self.API_RETRY_RESPECT_RETRY_AFTER = _env_bool(env, "API_RETRY_RESPECT_RETRY_AFTER", True)
+        self.API_RETRY_DEADLINE = float(env.get("API_RETRY_DEADLINE", 0))
+        self.API_CIRCUIT_FAILURE_THRESHOLD = int(env.get("API_CIRCUIT_FAILURE_THRESHOLD", 5))
+        self.API_CIRCUIT_RESET_TIMEOUT = float(env.get("API_CIRCUIT_RESET_TIMEOUT", 30))
+
+        # Deadlines and hedged requests
+        self.API_CONNECT_TIMEOUT = float(env.get("API_CONNECT_TIMEOUT", 0))
+        self.API_READ_TIMEOUT = float(env.get("API_READ_TIMEOUT", 0))
+        self.API_DEADLINE = float(env.get("API_DEADLINE", 0))
+        self.API_HEDGE_URL = env.get("API_HEDGE_URL", "")
+        self.API_HEDGE_DELAY = float(env.get("API_HEDGE_DELAY", 0))
+        self.API_HEDGE_PERCENTILE = float(env.get("API_HEDGE_PERCENTILE", 95))
+
+        # Client-side rate limiting
+        self.API_RATE_LIMIT = float(env.get("API_RATE_LIMIT", 0))
+        self.API_RATE_BURST = float(env.get("API_RATE_BURST", 0))
+        self.API_RATE_LIMIT_FILE = env.get("API_RATE_LIMIT_FILE", "")
+        self.API_MAX_CONCURRENT_REQUESTS = int(env.get("API_MAX_CONCURRENT_REQUESTS", 0))
+
+        # Result caching
+        self.CACHE_BACKEND = env.get("CACHE_BACKEND", "none")
+        self.CACHE_TTL = float(env.get("CACHE_TTL", 3600))
+        self.CACHE_MAX_ENTRIES = int(env.get("CACHE_MAX_ENTRIES", 1024))
+        self.CACHE_PATH = env.get("CACHE_PATH", ".cognita_cache.sqlite3")
+        self.QUERY_MATCHING = env.get("QUERY_MATCHING", "exact")
+        self.QUERY_SIMILARITY_THRESHOLD = float(env.get("QUERY_SIMILARITY_THRESHOLD", 0.8))
+        self.QUERY_SIMILARITY_CAPACITY = int(env.get("QUERY_SIMILARITY_CAPACITY", 10000))
+        self.RESULT_STORE_PATH = env.get("RESULT_STORE_PATH", "")
+
+        # Incremental refresh
+        self.INCREMENTAL_REFRESH = _env_bool(env, "INCREMENTAL_REFRESH", False)
+        self.REFRESH_STATE_PATH = env.get("REFRESH_STATE_PATH", "")
+        self.REFRESH_MAX_STATES = int(env.get("REFRESH_MAX_STATES", 1024))
+
+        # Post-processing pipeline
+        self.PIPELINE_WORKERS = int(env.get("PIPELINE_WORKERS", 4))
+        self.PIPELINE_PROCESSES = int(env.get("PIPELINE_PROCESSES", 0))
+        self.PIPELINE_MEMO_SIZE = int(env.get("PIPELINE_MEMO_SIZE", 1024))
+
+        # Long-running jobs
+        self.JOB_POLL_MIN_INTERVAL = float(env.get("JOB_POLL_MIN_INTERVAL", 1.0))
+        self.JOB_POLL_MAX_INTERVAL = float(env.get("JOB_POLL_MAX_INTERVAL", 30.0))
+        self.JOB_POLL_BACKOFF = float(env.get("JOB_POLL_BACKOFF", 1.5))
+        self.JOB_TIMEOUT = float(env.get("JOB_TIMEOUT", 0))
+        self.JOB_POLL_TIMEOUT = float(env.get("JOB_POLL_TIMEOUT", 10))
+
+        # Micro-batching
+        self.BATCH_MAX_SIZE = int(env.get("BATCH_MAX_SIZE", 20))
+        self.BATCH_WINDOW = float(env.get("BATCH_WINDOW", 0.01))
+        self.BATCH_MAX_IN_FLIGHT = int(env.get("BATCH_MAX_IN_FLIGHT", 4))
+
+        # Serialization
+        self.JSON_BACKEND = env.get("JSON_BACKEND", "auto")
         
         # Validate required settings
         if not self.API_KEY:
             raise ValueError("API_KEY must be set in environment variables")
+
+    @classmethod
+    def from_env(cls, environ: Optional[Mapping[str, str]] = None) -> "Config":
+        """
+        Build an immutable configuration from environment variables.
+
+        Unlike `Config()`, the `.env` file is not read.
+
+        Args:
+            environ (mapping, optional): Variables to read. Defaults to `os.environ`.
+
+        Returns:
+            Config: A frozen configuration.
+
+        Raises:
+            ValueError: If `API_KEY` is missing.
+        """
+        return cls(os.environ if environ is None else environ)._freeze()
+
+    @classmethod
+    def from_dict(cls, values: Mapping[str, Any]) -> "Config":
+        """
+        Build an immutable configuration from a dictionary of settings.
+
+        Known settings take the same defaults as environment variables. String
+        values are converted like environment variables; typed values (numbers,
+        bools, lists of URLs) are validated and kept as given. Other keys are kept
+        as given. Neither the environment nor the `.env` file is read.
+
+        Example:
+            config = Config.from_dict({"API_KEY": key, "MAX_RESULTS": 5})
+
+        Args:
+            values (mapping): Settings by name.
+
+        Returns:
+            Config: A frozen configuration.
+
+        Raises:
+            ValueError: If `API_KEY` is missing or a value does not fit its setting.
+        """
+        config = cls({name: value for name, value in values.items() if isinstance(value, str)})
+        for name, value in values.items():
+            if name not in config.__dict__:
+                config.__dict__[name] = value
+            elif value is not None and not isinstance(value, str):
+                config.__dict__[name] = _typed_setting(name, config.__dict__[name], value)
+        return config._freeze()
+
+    @classmethod
+    def snapshot(cls, refresh: bool = False) -> "Config":
+        """
+        Return the process-wide configuration, built from the environment once.
+
+        Args:
+            refresh (bool): Rebuild the snapshot from the current environment.
+
+        Returns:
+            Config: The cached, frozen configuration.
+        """
+        global _snapshot
+        with _snapshot_lock:
+            if _snapshot is None or refresh:
+                _load_dotenv_once()
+                _snapshot = cls.from_env()
+            return _snapshot
+
+    def _freeze(self) -> "Config":
+        """Make this configuration immutable, including its list of base URLs."""
+        self.__dict__["API_BASE_URLS"] = tuple(self.API_BASE_URLS)
+        self._frozen = True
+        return self
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the settings as a dictionary."""
+        return {name: value for name, value in vars(self).items() if not name.startswith("_")}
+
+    def replace(self, **changes: Any) -> "Config":
+        """Return a frozen copy of this configuration with some settings changed."""
+        settings = self.as_dict()
+        settings.update(changes)
+        return Config.from_dict(settings)
+
+    @property
+    def frozen(self) -> bool:
+        """Whether the configuration is an immutable snapshot."""
+        return self.__dict__.get("_frozen", False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self.__dict__.get("_frozen", False):
+            raise AttributeError("Config snapshots are immutable; use replace() to change settings")
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name: str) -> None:
+        if self.__dict__.get("_frozen", False):
+            raise AttributeError("Config snapshots are immutable; use replace() to change settings")
+        super().__delattr__(name)
+
+    def __repr__(self) -> str:
+        """Show the settings with the API key redacted."""
+        settings = ", ".join(
+            f"{name}={'***' if name == 'API_KEY' and value else repr(value)}"
+            for name, value in self.as_dict().items()
+        )
+        return f"Config({settings})"
@@ -0,0 +1,176 @@
+"""
+Deadline Module for Cognita SDK
+
+This module bounds how long a query may take end to end. A `Deadline` holds a
+total budget plus optional connect and read timeouts; it is activated for the
+current thread or asyncio task with `deadline_scope(...)` and picked up by every
+stage of the pipeline below it (rate limiting, HTTP attempts and retries,
+formatting), each of which only gets the time that is left.
+
+Features:
+- `Deadline`: total budget with per-attempt connect/read timeouts capped by the
+  remaining budget, as a `requests` timeout tuple or `aiohttp.ClientTimeout`.
+- `deadline_scope`: context manager activating a deadline; nested scopes can only
+  tighten the enclosing deadline, never extend it.
+- `current_deadline()` / `check_deadline(stage)`: query the active deadline and
+  raise `DeadlineExceededError` once it has passed.
+"""
+
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional, Tuple
+from .errors import DeadlineExceededError
+
+_current_deadline: "contextvars.ContextVar[Optional[Deadline]]" = contextvars.ContextVar(
+    "cognita_current_deadline", default=None
+)
+
+
+class Deadline:
+    """
+    Time budget of one call.
+
+    Attributes:
+        total (float): Overall seconds allowed, or None for no overall limit.
+        connect (float): Seconds allowed to establish a connection, or None to use
+            the client's default.
+        read (float): Seconds allowed between bytes of the response, or None to use
+            the client's default.
+        expires_at (float): `time.monotonic()` value at which the budget runs out,
+            or None.
+    """
+
+    __slots__ = ("total", "connect", "read", "expires_at")
+
+    def __init__(self, total: Optional[float] = None, connect: Optional[float] = None,
+                 read: Optional[float] = None, expires_at: Optional[float] = None):
+        self.total = total
+        self.connect = connect
+        self.read = read
+        if expires_at is None and total is not None:
+            expires_at = time.monotonic() + total
+        self.expires_at = expires_at
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left, or None when there is no overall limit."""
+        if self.expires_at is None:
+            return None
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    @property
+    def expired(self) -> bool:
+        """Whether the overall budget is used up."""
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+    def check(self, stage: str) -> None:
+        """
+        Raise if the budget is used up.
+
+        Args:
+            stage (str): Pipeline stage about to start, for the error message.
+
+        Raises:
+            DeadlineExceededError: If the deadline has passed.
+        """
+        if self.expired:
+            raise DeadlineExceededError(stage, self.total)
+
+    def cap(self, seconds: Optional[float]) -> Optional[float]:
+        """Return `seconds` limited to the remaining budget."""
+        remaining = self.remaining()
+        if remaining is None:
+            return seconds
+        return remaining if seconds is None else min(seconds, remaining)
+
+    def request_timeout(self, connect: Optional[float], read: Optional[float]
+                        ) -> Tuple[Optional[float], Optional[float]]:
+        """
+        Return the `(connect, read)` timeout tuple for one `requests` attempt.
+
+        Both values are kept above zero, so an attempt started as the budget runs
+        out times out instead of being rejected by the HTTP client.
+
+        Args:
+            connect (float): Client default connect timeout.
+            read (float): Client default read timeout.
+        """
+        return (_positive(self.cap(self.connect if self.connect is not None else connect)),
+                _positive(self.cap(self.read if self.read is not None else read)))
+
+    def tightened(self, other: "Deadline") -> "Deadline":
+        """Combine with a nested deadline, keeping the stricter limits."""
+        if self.expires_at is None:
+            expires_at = other.expires_at
+        elif other.expires_at is None:
+            expires_at = self.expires_at
+        else:
+            expires_at = min(self.expires_at, other.expires_at)
+        return Deadline(
+            total=other.total if expires_at == other.expires_at else self.total,
+            connect=_stricter(self.connect, other.connect),
+            read=_stricter(self.read, other.read),
+            expires_at=expires_at,
+        )
+
+    def __repr__(self) -> str:
+        return (f"Deadline(total={self.total}, connect={self.connect}, read={self.read}, "
+                f"remaining={self.remaining()})")
+
+
+def _positive(seconds: Optional[float]) -> Optional[float]:
+    return None if seconds is None else max(seconds, 0.001)
+
+
+def _stricter(first: Optional[float], second: Optional[float]) -> Optional[float]:
+    if first is None:
+        return second
+    if second is None:
+        return first
+    return min(first, second)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Return the deadline active in the current thread or asyncio task, if any."""
+    return _current_deadline.get()
+
+
+def check_deadline(stage: str) -> None:
+    """
+    Raise `DeadlineExceededError` if the active deadline has passed.
+
+    Args:
+        stage (str): Pipeline stage about to start.
+    """
+    deadline = _current_deadline.get()
+    if deadline is not None:
+        deadline.check(stage)
+
+
+@contextmanager
+def deadline_scope(total: Optional[float] = None, connect: Optional[float] = None,
+                   read: Optional[float] = None) -> Iterator[Deadline]:
+    """
+    Activate a deadline for the enclosed block.
+
+    Example:
+        with deadline_scope(total=5.0, connect=0.5):
+            agent.execute_query(query)
+
+    Args:
+        total (float, optional): Overall seconds allowed.
+        connect (float, optional): Connect timeout per HTTP attempt.
+        read (float, optional): Read timeout per HTTP attempt.
+
+    Yields:
+        Deadline: The active deadline, combined with any enclosing one.
+    """
+    deadline = Deadline(total, connect, read)
+    enclosing = _current_deadline.get()
+    if enclosing is not None:
+        deadline = enclosing.tightened(deadline)
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
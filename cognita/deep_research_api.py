@@ -1,42 +1,332 @@
 """
 Deep Research API Handler for Cognita SDK
 
-This module manages interactions with the Deep Research API, allowing the Cognita agent 
+This module manages interactions with the Deep Research API, allowing the Cognita agent
 to retrieve scientific research data.
 
 Features:
 - Handles research queries and sends them to the Deep Research API.
 - Manages API authentication using API keys.
+- Reuses pooled, keep-alive HTTP connections across requests and threads.
+- Provides an asyncio client (`AsyncDeepResearchAPI`) backed by `aiohttp` with a
+  shared connection pool and bounded concurrency.
+- Retries transient failures with exponential backoff and guards each endpoint
+  with a circuit breaker (see `cognita.retry`).
+- Streams NDJSON or server-sent-event responses incrementally.
+- Packs many queries into a single request through the batch endpoint.
+- Submits long-running research as jobs and checks their status, so no
+  connection is held open while the research runs (see `cognita.jobs`).
+- Encodes request bodies and parses responses straight from the received bytes
+  with a pluggable JSON serializer (`orjson` when installed, see `cognita.serialization`).
+- Keeps request rate and concurrency within quota using limiters shared by every
+  client in the process (see `cognita.ratelimit`).
+- Spreads requests over several base URLs (`API_BASE_URLS`) with latency-aware
+  selection and fails over to another replica when an attempt fails (see
+  `cognita.balancer`).
+- Refreshes standing queries incrementally with conditional requests and delta
+  responses (see `cognita.refresh`).
+- Honors per-call deadlines with separate connect/read/total budgets (see
+  `cognita.deadline`) and can hedge slow research requests to a secondary base
+  URL (see `cognita.hedging`).
 - Implements error handling for failed API requests.
 - Uses logging for better debugging and monitoring.
 """
 
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 import requests
+from requests.adapters import HTTPAdapter
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, AsyncIterator, Iterator, List, Optional, Sequence, Set, Tuple, Union
+from urllib.parse import quote
+from .balancer import LoadBalancer, parse_base_urls
 from .config import Config
-from .errors import APIError
+from .deadline import Deadline, current_deadline, deadline_scope
+from .errors import APIError, CircuitOpenError, ConfigError, DeadlineExceededError
+from .hedging import HedgePolicy, ahedged_call, hedged_call
+from .instrumentation import current_trace, record_size, stage
+from .jobs import JobHandle
+from .ratelimit import ConcurrencyLimiter, TokenBucket, shared_limiters
+from .refresh import RefreshState, apply_response, conditional_request
+from .retry import CircuitBreaker, RetryPolicy, parse_retry_after
+from .serialization import JSONSerializer, get_serializer
+from .utils import aiter_ndjson, aiter_sse, iter_ndjson, iter_sse
+
+# Accept header for streaming requests; the server picks NDJSON or SSE.
+STREAM_ACCEPT = "application/x-ndjson, text/event-stream"
+
+def _import_aiohttp():
+    """Import `aiohttp` on demand so the synchronous client does not require it."""
+    try:
+        import aiohttp
+    except ImportError as e:
+        raise ConfigError(
+            "aiohttp is required for the async client (pip install cognita[async])"
+        ) from e
+    return aiohttp
+
+def _record_sizes(response) -> None:
+    """Record request and response body sizes on the active trace, if any."""
+    if current_trace() is None:
+        return
+    body = getattr(getattr(response, "request", None), "body", None)
+    if body:
+        record_size("request_bytes", len(body))
+    content = getattr(response, "content", None)
+    if content:
+        record_size("response_bytes", len(content))
+
+def _demultiplex(response: Any, count: int) -> List[Union[Dict[str, Any], APIError]]:
+    """Match the items of a batch response back to the request positions."""
+    items = response.get("results") if isinstance(response, dict) else None
+    if not isinstance(items, list):
+        raise APIError("Invalid batch response: missing 'results' list")
+    results: List[Union[Dict[str, Any], APIError]] = [
+        APIError("No result returned for batch item") for _ in range(count)
+    ]
+    for item in items:
+        try:
+            index = int(item["id"])
+        except (KeyError, TypeError, ValueError):
+            raise APIError("Invalid batch response: item without a valid 'id'")
+        if not 0 <= index < count:
+            raise APIError(f"Invalid batch response: unknown item id {index}")
+        if item.get("error"):
+            results[index] = APIError(str(item["error"]))
+        elif isinstance(item.get("result"), dict):
+            results[index] = item["result"]
+        else:
+            results[index] = APIError("Batch item has neither a result nor an error")
+    return results
+
+class _RetryableError(Exception):
+    """Internal marker for a failed attempt that may be retried."""
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+def _stream_deadline(default: Optional[float]) -> Optional[Deadline]:
+    """
+    Return the deadline of a streaming request: the caller's, else one of `default` seconds.
+
+    Generators cannot activate a `deadline_scope` without leaking it to the code
+    consuming them, so the deadline is passed around explicitly instead.
+    """
+    deadline = current_deadline()
+    if deadline is None and default is not None:
+        deadline = Deadline(default)
+    if deadline is not None:
+        deadline.check("request")
+    return deadline
+
+def _stream_failure_trips(status: Optional[int]) -> bool:
+    """
+    Whether a failed streaming request counts against the endpoint's breaker.
+
+    Like `_retry_loop`, permanent HTTP errors (e.g. 4xx) leave the breaker alone;
+    transport errors and retryable statuses count as failures.
+    """
+    return status is None or RetryPolicy.is_retryable_status(status)
+
+def _exceeds_deadline(deadline: Optional[Deadline], delay: float) -> bool:
+    """Whether waiting `delay` seconds before a retry would overrun `deadline`."""
+    if deadline is None:
+        return False
+    remaining = deadline.remaining()
+    return remaining is not None and delay >= remaining
 
 class DeepResearchAPI:
-    """Handler for Deep Research API interactions."""
-    
-    def __init__(self, config: Config):
+    """
+    Handler for Deep Research API interactions.
+
+    All requests go through a single pooled `HTTPAdapter`, so TCP/TLS connections
+    are reused between calls. Each thread gets its own `requests.Session` mounted
+    on that shared adapter, which keeps session state thread-local while the
+    underlying connection pool (which is thread-safe) is shared.
+
+    Transient failures (timeouts, connection errors, 408/425/429/5xx responses) are
+    retried according to a `RetryPolicy`, and every endpoint has a `CircuitBreaker`
+    that rejects calls with `CircuitOpenError` while the endpoint keeps failing.
+
+    With several base URLs, every attempt goes to the replica chosen by `balancer`
+    among those whose breaker is not open; a failed attempt fails over to a replica
+    not yet tried, without the backoff delay. Jobs stay on the first (primary) base
+    URL because job IDs are only known to the replica that created them.
+
+    The client can be used as a context manager to release pooled connections:
+
+        with DeepResearchAPI(config) as api:
+            api.submit_research_request("...")
+    """
+
+    def __init__(self, config: Config, retry_policy: Optional[RetryPolicy] = None,
+                 circuit_breakers: Optional[Dict[str, CircuitBreaker]] = None,
+                 rate_limiter: Optional[TokenBucket] = None,
+                 concurrency_limiter: Optional[ConcurrencyLimiter] = None,
+                 serializer: Optional[JSONSerializer] = None,
+                 balancer: Optional[LoadBalancer] = None):
         """
         Initialize the API client with the provided configuration.
 
         Args:
             config (Config): Configuration object containing API details.
+            retry_policy (RetryPolicy, optional): Retry policy; built from the
+                `API_RETRY_*` settings by default.
+            circuit_breakers (dict, optional): Endpoint-to-breaker mapping to share
+                with other clients; a new one is created by default.
+            rate_limiter (TokenBucket, optional): Request rate limiter. Defaults to
+                the process-wide limiter for the `API_RATE_*` settings.
+            concurrency_limiter (ConcurrencyLimiter, optional): In-flight request cap.
+                Defaults to the process-wide limiter for `API_MAX_CONCURRENT_REQUESTS`.
+            serializer (JSONSerializer, optional): JSON encoder/decoder for request and
+                response bodies. Defaults to the `JSON_BACKEND` setting ("auto").
+            balancer (LoadBalancer, optional): Chooses among the base URLs; share it
+                with other clients to pool latency statistics. Built from the
+                `API_BASE_URLS`/`API_BALANCER*` settings by default.
         """
         self.config = config  # Store the configuration instance
-        self.base_url = config.API_BASE_URL
+        self.balancer = balancer or LoadBalancer.from_config(config)
+        self.base_urls = self.balancer.urls
+        self.base_url = self.base_urls[0]
         self.api_key = config.API_KEY
         self.timeout = config.API_TIMEOUT
+        self.connect_timeout = getattr(config, "API_CONNECT_TIMEOUT", 0) or self.timeout
+        self.read_timeout = getattr(config, "API_READ_TIMEOUT", 0) or self.timeout
+        self.default_deadline = getattr(config, "API_DEADLINE", 0) or None
+        hedge_url = getattr(config, "API_HEDGE_URL", "")
+        self.hedge_url = hedge_url.rstrip("/") if hedge_url else None
+        self.hedge_policy = HedgePolicy.from_config(config) if self.hedge_url else None
+        self.keep_alive = getattr(config, "API_KEEP_ALIVE", True)
+        self.retry_policy = retry_policy or RetryPolicy.from_config(config)
+        self.circuit_breakers = circuit_breakers if circuit_breakers is not None else {}
+        shared_rate, shared_concurrency = shared_limiters(config)
+        self.rate_limiter = rate_limiter or shared_rate
+        self.concurrency_limiter = concurrency_limiter or shared_concurrency
+        self.serializer = serializer or get_serializer(getattr(config, "JSON_BACKEND", "auto"))
         self.logger = logging.getLogger(__name__)
 
+        self._adapter = HTTPAdapter(
+            pool_connections=getattr(config, "API_POOL_CONNECTIONS", 10),
+            pool_maxsize=getattr(config, "API_POOL_MAXSIZE", 10),
+            pool_block=getattr(config, "API_POOL_BLOCK", False),
+        )
+        self._local = threading.local()
+        self._sessions = []
+        self._sessions_lock = threading.Lock()
+        self._hedge_executor = None
+        self._closed = False
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        Return the calling thread's session, creating it on first use.
+
+        Raises:
+            APIError: If the client has already been closed.
+        """
+        session = getattr(self._local, "session", None)
+        if session is None:
+            if self._closed:
+                raise APIError("API client has been closed")
+            session = requests.Session()
+            session.mount("http://", self._adapter)
+            session.mount("https://", self._adapter)
+            session.headers.update(self._build_headers())
+            with self._sessions_lock:
+                self._sessions.append(session)
+            self._local.session = session
+        return session
+
+    def _build_headers(self) -> Dict[str, str]:
+        """Build the headers sent with every request."""
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "Connection": "keep-alive" if self.keep_alive else "close",
+        }
+
+    def _build_payload(self, query: str) -> Dict[str, Any]:
+        """Build the JSON body for a research request."""
+        return {
+            "query": query,
+            "parameters": {
+                "max_results": self.config.MAX_RESULTS,
+                "min_confidence": self.config.MIN_CONFIDENCE
+            }
+        }
+
+    def circuit_breaker(self, endpoint: str) -> CircuitBreaker:
+        """Return the circuit breaker guarding `endpoint`, creating it on first use."""
+        breaker = self.circuit_breakers.get(endpoint)
+        if breaker is None:
+            breaker = self.circuit_breakers.setdefault(endpoint, CircuitBreaker(
+                failure_threshold=getattr(self.config, "API_CIRCUIT_FAILURE_THRESHOLD", 5),
+                reset_timeout=getattr(self.config, "API_CIRCUIT_RESET_TIMEOUT", 30.0),
+            ))
+        return breaker
+
+    def circuit_breaker_states(self) -> Dict[str, Dict[str, Any]]:
+        """Return a monitoring snapshot of every endpoint's circuit breaker."""
+        return {endpoint: breaker.snapshot() for endpoint, breaker in list(self.circuit_breakers.items())}
+
+    def endpoint_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return monitoring statistics per base URL.
+
+        Returns:
+            dict: For each base URL, the balancer statistics (EWMA `latency`,
+            `in_flight`, `requests`, `failures`) and the `state` of its research
+            endpoint's circuit breaker.
+        """
+        stats = self.balancer.stats()
+        for url, entry in stats.items():
+            entry["state"] = self.circuit_breaker(f"{url}/research").state
+        return stats
+
+    def _healthy_base_urls(self, breaker_path: str, tried: Set[str]) -> List[str]:
+        """Base URLs whose breaker for `breaker_path` is not open, untried ones only if any."""
+        healthy = [url for url in self.base_urls
+                   if self.circuit_breaker(url + breaker_path).state != CircuitBreaker.OPEN]
+        untried = [url for url in healthy if url not in tried]
+        return untried or healthy
+
+    def _choose_base_url(self, breaker_path: str, tried: Set[str]) -> str:
+        """
+        Choose the base URL of the next attempt.
+
+        Replicas whose breaker is open are skipped and replicas already tried by this
+        call come last. When every breaker is open the balancer still picks one, so
+        the caller's breaker check raises `CircuitOpenError`.
+        """
+        return self.balancer.choose(self._healthy_base_urls(breaker_path, tried) or self.base_urls)
+
+    def _deadline_scope(self):
+        """Activate `API_DEADLINE` unless the caller already set a deadline."""
+        if self.default_deadline is None or current_deadline() is not None:
+            return nullcontext(current_deadline())
+        return deadline_scope(total=self.default_deadline)
+
+    def _get_hedge_executor(self) -> ThreadPoolExecutor:
+        """Return the thread pool running hedged requests, creating it on first use."""
+        with self._sessions_lock:
+            if self._hedge_executor is None:
+                workers = 2 * max(getattr(self.config, "API_POOL_MAXSIZE", 10), 1)
+                self._hedge_executor = ThreadPoolExecutor(max_workers=workers,
+                                                          thread_name_prefix="cognita-hedge")
+            return self._hedge_executor
+
     def submit_research_request(self, query: str) -> Dict[str, Any]:
         """
         Submit a research request to the Deep Research API.
 
+        Transient failures are retried with backoff according to `retry_policy`.
+        When `API_HEDGE_URL` is set and the primary endpoint has not answered
+        within the hedge delay, the request is also sent to the hedge URL and the
+        first answer wins.
+
         Args:
             query (str): Validated research query.
 
@@ -45,29 +335,768 @@ class DeepResearchAPI:
 
         Raises:
             APIError: If there are issues with API communication or response handling.
+            CircuitOpenError: If the endpoint's circuit breaker is open.
+            DeadlineExceededError: If the active deadline passes first.
         """
-        endpoint = f"{self.base_url}/research"
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-        payload = {
-            "query": query,
-            "parameters": {
-                "max_results": self.config.MAX_RESULTS,
-                "min_confidence": self.config.MIN_CONFIDENCE
-            }
-        }
+        payload = self._build_payload(query)
+        if self.hedge_policy is None:
+            return self._post_with_retries("/research", payload)
+        with self._deadline_scope():
+            return hedged_call(
+                lambda cancelled: self._post_with_retries("/research", payload, cancelled=cancelled),
+                lambda cancelled: self._post_with_retries("/research", payload, cancelled=cancelled,
+                                                          base_url=self.hedge_url),
+                self.hedge_policy,
+                self._get_hedge_executor(),
+            )
+
+    def submit_refresh_request(self, query: str, state: Optional[RefreshState] = None) -> RefreshState:
+        """
+        Fetch a research result again, transferring only what changed.
+
+        The request carries the validators of `state` (`If-None-Match`,
+        `If-Modified-Since`) and a `since` field. A "304 Not Modified" answer reuses
+        the stored response, a delta body is merged into it, and a full body equal
+        to the stored one is not parsed again. Refresh requests are not hedged.
+
+        Args:
+            query (str): Validated research query.
+            state (RefreshState, optional): State returned by the previous refresh of
+                this query; None makes a plain first fetch.
+
+        Returns:
+            RefreshState: The new state; `response` holds the up-to-date raw response.
 
+        Raises:
+            APIError: If there are issues with API communication or response handling.
+            CircuitOpenError: If the endpoint's circuit breaker is open.
+            DeadlineExceededError: If the active deadline passes first.
+        """
+        headers, fields = conditional_request(state)
+        payload = self._build_payload(query)
+        payload.update(fields)
+        status, response_headers, body = self._post_with_retries("/research", payload,
+                                                                  headers=headers, raw=True)
         try:
-            response = requests.post(
-                endpoint,
-                json=payload,
-                headers=headers,
-                timeout=self.timeout
-            )
+            return apply_response(state, status, response_headers, body, self.serializer.loads)
+        except ValueError as e:
+            self.logger.error("Invalid JSON in API response: %s", e)
+            raise APIError(f"Invalid JSON in API response: {str(e)}")
+
+    def submit_batch_request(self, queries: Sequence[str],
+                             parameters: Optional[Sequence[Optional[Dict[str, Any]]]] = None
+                             ) -> List[Union[Dict[str, Any], APIError]]:
+        """
+        Submit several research requests in one HTTP request.
+
+        The batch is sent to `/research/batch` as
+        `{"requests": [{"id": ..., "query": ..., "parameters": {...}}, ...]}` and the
+        results are matched back to the queries by `id`. The whole batch is retried
+        like a single request; an error reported for one item is returned in that
+        item's position instead of being raised.
+
+        Args:
+            queries (sequence): Validated research queries.
+            parameters (sequence, optional): Per-query overrides of `max_results` and
+                `min_confidence`, aligned with `queries` (None keeps the defaults).
+
+        Returns:
+            list: For each query, in order, the raw API response or an `APIError`.
+
+        Raises:
+            APIError: If the batch request fails or the response is malformed.
+            CircuitOpenError: If the endpoint's circuit breaker is open.
+        """
+        requests_payload = []
+        for index, query in enumerate(queries):
+            item = self._build_payload(query)
+            overrides = parameters[index] if parameters is not None else None
+            if overrides:
+                item["parameters"].update(overrides)
+            item["id"] = str(index)
+            requests_payload.append(item)
+        response = self._post_with_retries("/research/batch", {"requests": requests_payload})
+        return _demultiplex(response, len(requests_payload))
+
+    def submit_job(self, query: str) -> JobHandle:
+        """
+        Submit a research request as a long-running job and return immediately.
+
+        The API answers with a job ID instead of holding the connection open until
+        the research is done; poll it with `get_job_status` or hand the handle to a
+        `cognita.jobs.JobPoller`.
+
+        Args:
+            query (str): Validated research query.
+
+        Returns:
+            JobHandle: Handle identifying the submitted job.
+
+        Raises:
+            APIError: If the job could not be submitted or the response has no job ID.
+            CircuitOpenError: If the endpoint's circuit breaker is open.
+        """
+        response = self._post_with_retries("/research/jobs", self._build_payload(query),
+                                           base_url=self.base_url)
+        return JobHandle.from_response(response, query)
+
+    def get_job_status(self, job_id: str) -> Dict[str, Any]:
+        """
+        Fetch the status of a job submitted with `submit_job`.
+
+        Args:
+            job_id (str): Job ID from the `JobHandle`.
+
+        Returns:
+            dict: Job status with a `status` of "pending", "running", "completed" or
+                "failed", the raw research response under `result` once completed, and
+                optionally `error` and a `poll_after` hint in seconds.
+
+        Raises:
+            APIError: If there are issues with API communication or response handling.
+            CircuitOpenError: If the jobs endpoint's circuit breaker is open.
+        """
+        # Every job shares the breaker of the jobs endpoint rather than one per URL.
+        return self._post_with_retries(f"/research/jobs/{quote(job_id, safe='')}", None,
+                                       breaker_path="/research/jobs",
+                                       base_url=self.base_url)
+
+    def _post_with_retries(self, path: str, payload: Optional[Dict[str, Any]],
+                           breaker_path: Optional[str] = None,
+                           cancelled: Optional[threading.Event] = None,
+                           base_url: Optional[str] = None,
+                           headers: Optional[Dict[str, str]] = None, raw: bool = False) -> Any:
+        """
+        POST `payload` to `path` (GET when `payload` is None), retrying transient
+        failures within the active deadline. Gives up once `cancelled` is set.
+
+        Each attempt goes to the base URL chosen by the balancer unless `base_url`
+        pins one. Breakers are keyed by base URL plus `breaker_path` (default `path`).
+        `headers` and `raw` are passed on to `_post_once`.
+        """
+        with self._deadline_scope() as deadline:
+            return self._retry_loop(path, payload, breaker_path or path, cancelled, base_url, deadline,
+                                    headers, raw)
+
+    def _retry_loop(self, path: str, payload: Optional[Dict[str, Any]], breaker_path: str,
+                    cancelled: Optional[threading.Event], pinned: Optional[str],
+                    deadline: Optional[Deadline], headers: Optional[Dict[str, str]],
+                    raw: bool) -> Any:
+        policy = self.retry_policy
+        started = time.monotonic()
+        attempt = 0
+        tried: Set[str] = set()
+        while True:
+            if deadline is not None:
+                deadline.check("request")
+            base_url = pinned or self._choose_base_url(breaker_path, tried)
+            endpoint = base_url + path
+            breaker = self.circuit_breaker(base_url + breaker_path)
+            if not breaker.allow_request():
+                raise CircuitOpenError(endpoint, breaker.retry_in())
+            attempt += 1
+            try:
+                result = self._post_once(base_url, path, payload, deadline, headers, raw)
+            except _RetryableError as e:
+                breaker.record_failure()
+                tried.add(base_url)
+                # Fail over straight away while a healthy replica is left untried.
+                failover = pinned is None and any(
+                    url not in tried for url in self._healthy_base_urls(breaker_path, tried))
+                delay = 0.0 if failover else policy.compute_delay(attempt, e.retry_after)
+                if not policy.can_retry(attempt, delay, started):
+                    self.logger.error("API Request Failed after %d attempt(s): %s", attempt, e)
+                    raise APIError(f"API communication error: {str(e)}")
+                if _exceeds_deadline(deadline, delay):
+                    raise DeadlineExceededError("retry", deadline.total) from e
+                self.logger.warning("API Request Failed (attempt %d), retrying in %.2fs: %s",
+                                    attempt, delay, e)
+                if cancelled is None:
+                    time.sleep(delay)
+                elif cancelled.wait(delay):
+                    raise APIError(f"request to {endpoint} cancelled")
+                continue
+            except DeadlineExceededError:
+                # The endpoint is not at fault, but a half-open probe must not stay taken.
+                breaker.release_probe()
+                raise
+            except APIError:
+                # Permanent failure (e.g. a 4xx response): the endpoint itself is healthy.
+                breaker.record_success()
+                raise
+            except BaseException:
+                breaker.release_probe()
+                raise
+            breaker.record_success()
+            return result
+
+    def _acquire_limiters(self, deadline: Optional[Deadline]) -> None:
+        """
+        Wait for the rate and concurrency limiters, at most until `deadline`.
+
+        The rate token is refunded if no concurrency slot is obtained, since no
+        request is sent.
+
+        Raises:
+            DeadlineExceededError: If the deadline passes while waiting.
+        """
+        wait = deadline.remaining() if deadline is not None else None
+        if self.rate_limiter is not None and not self.rate_limiter.acquire(timeout=wait):
+            raise DeadlineExceededError("rate limit", deadline.total)
+        if self.concurrency_limiter is None:
+            return
+        wait = deadline.remaining() if deadline is not None else None
+        acquired = False
+        try:
+            acquired = self.concurrency_limiter.acquire(timeout=wait)
+        finally:
+            if not acquired and self.rate_limiter is not None:
+                self.rate_limiter.refund()
+        if not acquired:
+            raise DeadlineExceededError("concurrency limit", deadline.total)
+
+    def _post_once(self, base_url: str, path: str, payload: Optional[Dict[str, Any]],
+                   deadline: Optional[Deadline] = None, headers: Optional[Dict[str, str]] = None,
+                   raw: bool = False) -> Any:
+        """
+        Make a single POST attempt (a GET when `payload` is None) and report its
+        latency to the balancer.
+
+        Returns the parsed body, or `(status, headers, body bytes)` without parsing
+        when `raw` is true. `headers` are sent in addition to the session headers.
+
+        Raises:
+            _RetryableError: For timeouts, connection errors and retryable statuses.
+            APIError: For permanent failures.
+            DeadlineExceededError: If `deadline` passes while waiting for the limiters.
+        """
+        self._acquire_limiters(deadline)
+        timeout: Tuple[Optional[float], Optional[float]] = (self.connect_timeout, self.read_timeout)
+        if deadline is not None:
+            timeout = deadline.request_timeout(*timeout)
+        endpoint = base_url + path
+        self.balancer.start(base_url)
+        started = time.monotonic()
+        failed = False
+        options = {"headers": headers} if headers else {}
+        try:
+            with stage("http"):
+                if payload is None:
+                    response = self.session.get(endpoint, timeout=timeout, **options)
+                else:
+                    response = self.session.post(
+                        endpoint,
+                        data=self.serializer.dumps(payload),
+                        timeout=timeout,
+                        **options
+                    )
+            if RetryPolicy.is_retryable_status(response.status_code):
+                headers = getattr(response, "headers", None) or {}
+                raise _RetryableError(
+                    f"HTTP {response.status_code} from {endpoint}",
+                    parse_retry_after(headers.get("Retry-After")),
+                )
             response.raise_for_status()
-            return response.json()
+            _record_sizes(response)
+            if raw:
+                return response.status_code, response.headers, response.content
+            with stage("parse"):
+                # Parse the raw body bytes; response.json() would decode to str first.
+                return self.serializer.loads(response.content)
+        except _RetryableError:
+            failed = True
+            raise
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            failed = True
+            raise _RetryableError(str(e))
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"API Request Failed: {str(e)}")
+            self.logger.error("API Request Failed: %s", e)
             raise APIError(f"API communication error: {str(e)}")
+        except ValueError as e:
+            self.logger.error("Invalid JSON in API response: %s", e)
+            raise APIError(f"Invalid JSON in API response: {str(e)}")
+        finally:
+            self.balancer.finish(base_url, time.monotonic() - started, failed)
+            if self.concurrency_limiter is not None:
+                self.concurrency_limiter.release()
+
+    def stream_research_request(self, query: str) -> Iterator[Dict[str, Any]]:
+        """
+        Submit a research request and yield response events as they arrive.
+
+        The request asks the server to stream (`"stream": true`) and the body is read
+        incrementally as NDJSON or server-sent events, depending on the response
+        content type, so the full payload is never held in memory. Streaming requests
+        are rate limited and guarded by the circuit breaker but are not retried. The
+        active deadline (or `API_DEADLINE`) bounds the wait for the limiters and caps
+        the connect and read timeouts.
+
+        Args:
+            query (str): Validated research query.
+
+        Yields:
+            dict: Raw stream events (see `cognita.utils.stream_format_response`).
+
+        Raises:
+            APIError: If there are issues with API communication or response handling.
+            CircuitOpenError: If the endpoint's circuit breaker is open.
+            DeadlineExceededError: If the deadline passes before the stream starts.
+        """
+        endpoint = self._choose_base_url("/research", set()) + "/research"
+        payload = self._build_payload(query)
+        payload["stream"] = True
+        deadline = _stream_deadline(self.default_deadline)
+        breaker = self.circuit_breaker(endpoint)
+        if not breaker.allow_request():
+            raise CircuitOpenError(endpoint, breaker.retry_in())
+        try:
+            self._acquire_limiters(deadline)
+        except BaseException:
+            breaker.release_probe()
+            raise
+        timeout: Tuple[Optional[float], Optional[float]] = (self.connect_timeout, self.read_timeout)
+        if deadline is not None:
+            timeout = deadline.request_timeout(*timeout)
+        try:
+            response = None
+            try:
+                response = self.session.post(
+                    endpoint,
+                    data=self.serializer.dumps(payload),
+                    timeout=timeout,
+                    stream=True,
+                    headers={"Accept": STREAM_ACCEPT},
+                )
+                response.raise_for_status()
+            except requests.exceptions.RequestException as e:
+                if response is not None:
+                    # Unread streamed responses keep their pooled connection until closed.
+                    response.close()
+                status = getattr(getattr(e, "response", None), "status_code", None)
+                if _stream_failure_trips(status):
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+                self.logger.error("API Stream Request Failed: %s", e)
+                raise APIError(f"API communication error: {str(e)}")
+            except BaseException:
+                if response is not None:
+                    response.close()
+                breaker.release_probe()
+                raise
+            breaker.record_success()
+
+            with response:
+                content_type = response.headers.get("Content-Type", "")
+                parse = iter_sse if "text/event-stream" in content_type else iter_ndjson
+                try:
+                    yield from parse(response.iter_lines(), loads=self.serializer.loads)
+                except requests.exceptions.RequestException as e:
+                    self.logger.error("API Stream Interrupted: %s", e)
+                    raise APIError(f"API stream interrupted: {str(e)}")
+        finally:
+            if self.concurrency_limiter is not None:
+                self.concurrency_limiter.release()
+
+    def close(self) -> None:
+        """Close all sessions and release pooled connections."""
+        self._closed = True
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+        self._adapter.close()
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False)
+            self._hedge_executor = None
+        self._local = threading.local()
+
+    def __enter__(self) -> "DeepResearchAPI":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class AsyncDeepResearchAPI:
+    """
+    Asyncio twin of `DeepResearchAPI`.
+
+    A single `aiohttp.ClientSession` (and therefore a single connection pool) is
+    shared by every coroutine using the client, and an `asyncio.Semaphore` caps the
+    number of requests in flight at `API_MAX_CONCURRENCY`. The session is created
+    lazily inside the running event loop and must be released with `aclose()` or
+    by using the client as an async context manager:
+
+        async with AsyncDeepResearchAPI(config) as api:
+            await api.submit_research_request("...")
+
+    Retries and circuit breaking follow the same rules as `DeepResearchAPI`; passing
+    the sync client's `circuit_breakers` lets both clients share endpoint health.
+    """
+
+    def __init__(self, config: Config, retry_policy: Optional[RetryPolicy] = None,
+                 circuit_breakers: Optional[Dict[str, CircuitBreaker]] = None,
+                 rate_limiter: Optional[TokenBucket] = None,
+                 concurrency_limiter: Optional[ConcurrencyLimiter] = None,
+                 serializer: Optional[JSONSerializer] = None,
+                 balancer: Optional[LoadBalancer] = None):
+        """
+        Initialize the async API client with the provided configuration.
+
+        Args:
+            config (Config): Configuration object containing API details.
+            retry_policy (RetryPolicy, optional): Retry policy; built from the
+                `API_RETRY_*` settings by default.
+            circuit_breakers (dict, optional): Endpoint-to-breaker mapping to share
+                with other clients; a new one is created by default.
+            rate_limiter (TokenBucket, optional): Request rate limiter. Defaults to
+                the process-wide limiter for the `API_RATE_*` settings.
+            concurrency_limiter (ConcurrencyLimiter, optional): In-flight request cap.
+                Defaults to the process-wide limiter for `API_MAX_CONCURRENT_REQUESTS`.
+            serializer (JSONSerializer, optional): JSON encoder/decoder for request and
+                response bodies. Defaults to the `JSON_BACKEND` setting ("auto").
+            balancer (LoadBalancer, optional): Chooses among the base URLs; share it
+                with other clients to pool latency statistics. Built from the
+                `API_BASE_URLS`/`API_BALANCER*` settings by default.
+        """
+        self.config = config
+        self.balancer = balancer or LoadBalancer.from_config(config)
+        self.base_urls = self.balancer.urls
+        self.base_url = self.base_urls[0]
+        self.api_key = config.API_KEY
+        self.timeout = config.API_TIMEOUT
+        self.connect_timeout = getattr(config, "API_CONNECT_TIMEOUT", 0) or self.timeout
+        self.read_timeout = getattr(config, "API_READ_TIMEOUT", 0) or self.timeout
+        self.default_deadline = getattr(config, "API_DEADLINE", 0) or None
+        hedge_url = getattr(config, "API_HEDGE_URL", "")
+        self.hedge_url = hedge_url.rstrip("/") if hedge_url else None
+        self.hedge_policy = HedgePolicy.from_config(config) if self.hedge_url else None
+        self.keep_alive = getattr(config, "API_KEEP_ALIVE", True)
+        self.max_concurrency = getattr(config, "API_MAX_CONCURRENCY", 100)
+        self.retry_policy = retry_policy or RetryPolicy.from_config(config)
+        self.circuit_breakers = circuit_breakers if circuit_breakers is not None else {}
+        shared_rate, shared_concurrency = shared_limiters(config)
+        self.rate_limiter = rate_limiter or shared_rate
+        self.concurrency_limiter = concurrency_limiter or shared_concurrency
+        self.serializer = serializer or get_serializer(getattr(config, "JSON_BACKEND", "auto"))
+        self.logger = logging.getLogger(__name__)
+
+        self._session = None
+        self._semaphore = None
+
+    # Header/payload construction and breaker bookkeeping match the synchronous client.
+    _build_headers = DeepResearchAPI._build_headers
+    _build_payload = DeepResearchAPI._build_payload
+    circuit_breaker = DeepResearchAPI.circuit_breaker
+    circuit_breaker_states = DeepResearchAPI.circuit_breaker_states
+    endpoint_stats = DeepResearchAPI.endpoint_stats
+    _healthy_base_urls = DeepResearchAPI._healthy_base_urls
+    _choose_base_url = DeepResearchAPI._choose_base_url
+    _deadline_scope = DeepResearchAPI._deadline_scope
+
+    def _get_session(self):
+        """Return the shared `aiohttp.ClientSession`, creating it on first use."""
+        if self._session is None or self._session.closed:
+            aiohttp = _import_aiohttp()
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrency,
+                force_close=not self.keep_alive,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self._build_headers(),
+                timeout=aiohttp.ClientTimeout(total=self.timeout, sock_connect=self.connect_timeout,
+                                              sock_read=self.read_timeout),
+            )
+        return self._session
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Return the concurrency semaphore, creating it inside the running loop."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def submit_research_request(self, query: str) -> Dict[str, Any]:
+        """
+        Submit a research request to the Deep Research API without blocking the event loop.
+
+        Transient failures are retried with backoff according to `retry_policy`.
+
+        Args:
+            query (str): Validated research query.
+
+        Returns:
+            dict: Raw API response containing research data.
+
+        Raises:
+            APIError: If there are issues with API communication or response handling.
+            CircuitOpenError: If the endpoint's circuit breaker is open.
+            ConfigError: If `aiohttp` is not installed.
+            DeadlineExceededError: If the active deadline passes first.
+        """
+        payload = self._build_payload(query)
+        if self.hedge_policy is None:
+            return await self._post_with_retries("/research", payload)
+        with self._deadline_scope():
+            return await ahedged_call(
+                lambda: self._post_with_retries("/research", payload),
+                lambda: self._post_with_retries("/research", payload, base_url=self.hedge_url),
+                self.hedge_policy,
+            )
+
+    async def submit_refresh_request(self, query: str,
+                                     state: Optional[RefreshState] = None) -> RefreshState:
+        """
+        Asynchronous counterpart of `DeepResearchAPI.submit_refresh_request`.
+
+        Args:
+            query (str): Validated research query.
+            state (RefreshState, optional): State returned by the previous refresh.
+
+        Returns:
+            RefreshState: The new state.
+
+        Raises:
+            APIError: If there are issues with API communication or response handling.
+            CircuitOpenError: If the endpoint's circuit breaker is open.
+            ConfigError: If `aiohttp` is not installed.
+        """
+        headers, fields = conditional_request(state)
+        payload = self._build_payload(query)
+        payload.update(fields)
+        status, response_headers, body = await self._post_with_retries(
+            "/research", payload, headers=headers, raw=True)
+        try:
+            return apply_response(state, status, response_headers, body, self.serializer.loads)
+        except ValueError as e:
+            self.logger.error("Invalid JSON in API response: %s", e)
+            raise APIError(f"Invalid JSON in API response: {str(e)}")
+
+    async def _post_with_retries(self, path: str, payload: Dict[str, Any],
+                                 base_url: Optional[str] = None,
+                                 headers: Optional[Dict[str, str]] = None, raw: bool = False) -> Any:
+        """
+        POST `payload` to `path`, retrying transient failures within the active
+        deadline. Base URLs are chosen as in `DeepResearchAPI._post_with_retries`.
+        """
+        with self._deadline_scope() as deadline:
+            pinned = base_url
+            policy = self.retry_policy
+            started = time.monotonic()
+            attempt = 0
+            tried: Set[str] = set()
+            while True:
+                if deadline is not None:
+                    deadline.check("request")
+                base_url = pinned or self._choose_base_url(path, tried)
+                endpoint = base_url + path
+                breaker = self.circuit_breaker(endpoint)
+                if not breaker.allow_request():
+                    raise CircuitOpenError(endpoint, breaker.retry_in())
+                attempt += 1
+                try:
+                    result = await self._post_once(base_url, path, payload, deadline, headers, raw)
+                except _RetryableError as e:
+                    breaker.record_failure()
+                    tried.add(base_url)
+                    # Fail over straight away while a healthy replica is left untried.
+                    failover = pinned is None and any(
+                        url not in tried for url in self._healthy_base_urls(path, tried))
+                    delay = 0.0 if failover else policy.compute_delay(attempt, e.retry_after)
+                    if not policy.can_retry(attempt, delay, started):
+                        self.logger.error("API Request Failed after %d attempt(s): %s", attempt, e)
+                        raise APIError(f"API communication error: {str(e)}")
+                    if _exceeds_deadline(deadline, delay):
+                        raise DeadlineExceededError("retry", deadline.total) from e
+                    self.logger.warning("API Request Failed (attempt %d), retrying in %.2fs: %s",
+                                        attempt, delay, e)
+                    await asyncio.sleep(delay)
+                    continue
+                except DeadlineExceededError:
+                    breaker.release_probe()
+                    raise
+                except APIError:
+                    breaker.record_success()
+                    raise
+                except BaseException:
+                    # Includes cancellation, e.g. of the losing request of a hedge.
+                    breaker.release_probe()
+                    raise
+                breaker.record_success()
+                return result
+
+    async def _acquire_limiters(self, deadline: Optional[Deadline]) -> None:
+        """Asynchronous counterpart of `DeepResearchAPI._acquire_limiters`."""
+        # Each limiter refunds or passes on what it reserved when its own wait is
+        # abandoned; the rate token is refunded here if no slot is obtained.
+        if self.rate_limiter is not None and not await self.rate_limiter.acquire_async(
+                deadline.remaining() if deadline is not None else None):
+            raise DeadlineExceededError("rate limit", deadline.total)
+        if self.concurrency_limiter is None:
+            return
+        acquired = False
+        try:
+            acquired = await self.concurrency_limiter.acquire_async(
+                deadline.remaining() if deadline is not None else None)
+        finally:
+            if not acquired and self.rate_limiter is not None:
+                self.rate_limiter.refund()
+        if not acquired:
+            raise DeadlineExceededError("concurrency limit", deadline.total)
+
+    def _request_timeout(self, deadline: Optional[Deadline]):
+        """Return the `aiohttp.ClientTimeout` of one attempt, capped by `deadline`."""
+        if deadline is None:
+            return None
+        aiohttp = _import_aiohttp()
+        connect, read = deadline.request_timeout(self.connect_timeout, self.read_timeout)
+        return aiohttp.ClientTimeout(total=max(deadline.cap(self.timeout), 0.001), sock_connect=connect,
+                                     sock_read=read)
+
+    async def _post_once(self, base_url: str, path: str, payload: Dict[str, Any],
+                         deadline: Optional[Deadline] = None,
+                         headers: Optional[Dict[str, str]] = None, raw: bool = False) -> Any:
+        """
+        Make a single POST attempt and report its latency to the balancer.
+
+        Returns the parsed body, or `(status, headers, body bytes)` when `raw` is true.
+
+        Raises:
+            _RetryableError: For timeouts, connection errors and retryable statuses.
+            APIError: For permanent failures.
+            DeadlineExceededError: If `deadline` passes while waiting for the limiters.
+        """
+        aiohttp = _import_aiohttp()
+        endpoint = base_url + path
+        async with self._get_semaphore():
+            await self._acquire_limiters(deadline)
+            self.balancer.start(base_url)
+            started = time.monotonic()
+            failed = False
+            cancelled = False
+            try:
+                with stage("http"):
+                    options = {}
+                    timeout = self._request_timeout(deadline)
+                    if timeout is not None:
+                        options["timeout"] = timeout
+                    if headers:
+                        options["headers"] = headers
+                    async with self._get_session().post(
+                        endpoint, data=self.serializer.dumps(payload), **options
+                    ) as response:
+                        if RetryPolicy.is_retryable_status(response.status):
+                            raise _RetryableError(
+                                f"HTTP {response.status} from {endpoint}",
+                                parse_retry_after(response.headers.get("Retry-After")),
+                            )
+                        response.raise_for_status()
+                        body = await response.read()
+                record_size("response_bytes", len(body))
+                if raw:
+                    return response.status, response.headers, body
+                with stage("parse"):
+                    return self.serializer.loads(body)
+            except _RetryableError:
+                failed = True
+                raise
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                failed = True
+                raise _RetryableError(str(e) or type(e).__name__)
+            except (aiohttp.ClientError, ValueError) as e:
+                self.logger.error("API Request Failed: %s", e)
+                raise APIError(f"API communication error: {str(e)}")
+            except asyncio.CancelledError:
+                # Cancelled (e.g. the losing side of a hedge): the elapsed time says
+                # nothing about the replica, so no latency sample is recorded.
+                cancelled = True
+                raise
+            finally:
+                self.balancer.finish(base_url, None if cancelled else time.monotonic() - started, failed)
+                if self.concurrency_limiter is not None:
+                    self.concurrency_limiter.release()
+
+    async def stream_research_request(self, query: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Asynchronous counterpart of `DeepResearchAPI.stream_research_request`.
+
+        Args:
+            query (str): Validated research query.
+
+        Yields:
+            dict: Raw stream events as they arrive.
+
+        Raises:
+            APIError: If there are issues with API communication or response handling.
+            CircuitOpenError: If the endpoint's circuit breaker is open.
+            ConfigError: If `aiohttp` is not installed.
+            DeadlineExceededError: If the deadline passes before the stream starts.
+        """
+        aiohttp = _import_aiohttp()
+        endpoint = self._choose_base_url("/research", set()) + "/research"
+        payload = self._build_payload(query)
+        payload["stream"] = True
+        deadline = _stream_deadline(self.default_deadline)
+        breaker = self.circuit_breaker(endpoint)
+        if not breaker.allow_request():
+            raise CircuitOpenError(endpoint, breaker.retry_in())
+        async with self._get_semaphore():
+            try:
+                await self._acquire_limiters(deadline)
+            except BaseException:
+                breaker.release_probe()
+                raise
+            options = {"headers": {"Accept": STREAM_ACCEPT}}
+            if deadline is not None:
+                # Only per-socket timeouts: the stream itself may outlast the budget.
+                connect, read = deadline.request_timeout(self.connect_timeout, self.read_timeout)
+                options["timeout"] = aiohttp.ClientTimeout(total=None, sock_connect=connect, sock_read=read)
+            try:
+                response = None
+                try:
+                    response = await self._get_session().post(
+                        endpoint, data=self.serializer.dumps(payload), **options
+                    )
+                    response.raise_for_status()
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    if response is not None:
+                        response.release()
+                    status = e.status if isinstance(e, aiohttp.ClientResponseError) else None
+                    if _stream_failure_trips(status):
+                        breaker.record_failure()
+                    else:
+                        breaker.record_success()
+                    self.logger.error("API Stream Request Failed: %s", e)
+                    raise APIError(f"API communication error: {str(e)}")
+                except BaseException:
+                    if response is not None:
+                        response.release()
+                    breaker.release_probe()
+                    raise
+                breaker.record_success()
+
+                async with response:
+                    content_type = response.headers.get("Content-Type", "")
+                    parse = aiter_sse if "text/event-stream" in content_type else aiter_ndjson
+                    try:
+                        async for event in parse(response.content, loads=self.serializer.loads):
+                            yield event
+                    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                        self.logger.error("API Stream Interrupted: %s", e)
+                        raise APIError(f"API stream interrupted: {str(e)}")
+            finally:
+                if self.concurrency_limiter is not None:
+                    self.concurrency_limiter.release()
+
+    async def aclose(self) -> None:
+        """Close the shared session and release pooled connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "AsyncDeepResearchAPI":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
@@ -5,15 +5,42 @@ This module defines custom exceptions to handle errors more effectively within t
 
 Features:
 - `APIError`: Raised for API-related issues (e.g., failed requests, invalid responses).
+- `CircuitOpenError`: An `APIError` raised without contacting the API while its circuit breaker is open.
+- `JobFailedError`: An `APIError` raised when a submitted research job fails or times out.
+- `DeadlineExceededError`: An `APIError` raised when a call runs out of its time budget.
 - `ConfigError`: Raised when configuration issues occur (e.g., missing API keys, incorrect settings).
 - `ProcessingError`: Raised for issues during data processing (e.g., invalid input data, parsing failures).
 """
 
+from typing import Optional
+
 class APIError(Exception):
     """Exception raised for API-related errors."""
     def __init__(self, message: str):
         super().__init__(f"API Error: {message}")
 
+class CircuitOpenError(APIError):
+    """Exception raised when a call is rejected because the endpoint's circuit breaker is open."""
+    def __init__(self, endpoint: str, retry_in: float):
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+        super().__init__(f"circuit open for {endpoint}, retry in {retry_in:.1f}s")
+
+class JobFailedError(APIError):
+    """Exception raised when a long-running research job fails or times out."""
+    def __init__(self, job_id: str, reason: str):
+        self.job_id = job_id
+        self.reason = reason
+        super().__init__(f"job {job_id} failed: {reason}")
+
+class DeadlineExceededError(APIError):
+    """Exception raised when a call's deadline passes before it completes."""
+    def __init__(self, stage: str, budget: Optional[float] = None):
+        self.stage = stage
+        self.budget = budget
+        limit = f" of {budget:g}s" if budget is not None else ""
+        super().__init__(f"deadline{limit} exceeded before {stage}")
+
 class ConfigError(Exception):
     """Exception raised for configuration errors."""
     def __init__(self, message: str):
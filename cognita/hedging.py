@@ -0,0 +1,214 @@
+"""
+Request Hedging Module for Cognita SDK
+
+This module trims tail latency by racing a slow request against a duplicate. When
+the primary request has not answered after a delay (by default the observed p95
+latency), the same request is sent to a secondary endpoint; whichever succeeds
+first is used and the other is cancelled.
+
+Features:
+- `HedgePolicy`: fixed or adaptive hedge delay from a sliding window of recent
+  primary latencies, plus counters of hedged requests and secondary wins.
+- `hedged_call`: thread-based hedging for the synchronous client. The loser is
+  signalled through a `threading.Event` so it stops retrying.
+- `ahedged_call`: asyncio hedging; the losing task is cancelled outright.
+
+Only idempotent requests should be hedged.
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, wait
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+from .deadline import current_deadline
+
+T = TypeVar("T")
+
+
+class HedgePolicy:
+    """
+    Decides when to send the hedge request.
+
+    The policy is shared by the threads of the synchronous client, so its counters
+    and latency window are only updated under its lock.
+
+    Attributes:
+        requests (int): Calls made through the policy.
+        hedged (int): Calls for which a hedge request was sent.
+        wins (int): Hedged calls answered first by the secondary endpoint.
+    """
+
+    def __init__(self, delay: Optional[float] = None, percentile: float = 95.0,
+                 window: int = 256, min_samples: int = 20, initial_delay: float = 1.0):
+        """
+        Args:
+            delay (float, optional): Fixed hedge delay in seconds. None adapts the
+                delay to the `percentile` of recent primary latencies.
+            percentile (float): Latency percentile used as the adaptive delay.
+            window (int): Number of recent latencies kept.
+            min_samples (int): Samples needed before the adaptive delay is used.
+            initial_delay (float): Delay used until enough samples are collected.
+        """
+        if not 0.0 < percentile <= 100.0:
+            raise ValueError("percentile must be in (0, 100]")
+        self.delay = delay
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.initial_delay = initial_delay
+        self.requests = 0
+        self.hedged = 0
+        self.wins = 0
+        self._latencies = deque(maxlen=max(window, 1))
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config) -> "HedgePolicy":
+        """Build a policy from the `API_HEDGE_*` settings."""
+        return cls(
+            delay=getattr(config, "API_HEDGE_DELAY", 0.0) or None,
+            percentile=getattr(config, "API_HEDGE_PERCENTILE", 95.0),
+        )
+
+    def record(self, latency: float) -> None:
+        """Record the latency of a primary request that answered."""
+        with self._lock:
+            self._latencies.append(latency)
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def current_delay(self) -> float:
+        """Seconds to wait for the primary before sending the hedge."""
+        if self.delay is not None:
+            return self.delay
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return self.initial_delay
+            ordered = sorted(self._latencies)
+        rank = max(int(round(self.percentile / 100.0 * len(ordered))) - 1, 0)
+        return ordered[min(rank, len(ordered) - 1)]
+
+    def _wait_for_primary(self) -> float:
+        delay = self.current_delay()
+        deadline = current_deadline()
+        # Never wait past the deadline; the hedge would be pointless by then.
+        return deadline.cap(delay) if deadline is not None else delay
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the counters and the current delay as a dictionary."""
+        with self._lock:
+            counters = {"requests": self.requests, "hedged": self.hedged, "wins": self.wins}
+        counters["delay"] = self.current_delay()
+        return counters
+
+    def __repr__(self) -> str:
+        return f"HedgePolicy({self.stats()})"
+
+
+def hedged_call(primary: Callable[[threading.Event], T], secondary: Callable[[threading.Event], T],
+                policy: HedgePolicy, executor: Executor) -> T:
+    """
+    Run `primary`, hedged by `secondary`, on `executor` threads.
+
+    Both callables receive a `threading.Event` that is set once the other one has
+    won; they should stop (e.g. not retry) when it is set. Each runs in a copy of
+    the caller's context, so traces and deadlines carry over.
+
+    Args:
+        primary (callable): Request to the primary endpoint.
+        secondary (callable): The same request to the secondary endpoint.
+        policy (HedgePolicy): Hedge delay and counters.
+        executor (Executor): Thread pool running the requests.
+
+    Returns:
+        The first successful result.
+
+    Raises:
+        Exception: The primary's error if both requests fail.
+    """
+    policy._count("requests")
+    cancel_primary, cancel_secondary = threading.Event(), threading.Event()
+    started = time.monotonic()
+    first = executor.submit(contextvars.copy_context().run, primary, cancel_primary)
+    done, _ = wait([first], timeout=policy._wait_for_primary())
+    if done:
+        if first.exception() is None:
+            policy.record(time.monotonic() - started)
+        return first.result()
+
+    policy._count("hedged")
+    second = executor.submit(contextvars.copy_context().run, secondary, cancel_secondary)
+    cancels = {first: cancel_primary, second: cancel_secondary}
+    pending = {first, second}
+    errors = {}
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            error = future.exception()
+            if error is not None:
+                errors[future] = error
+                continue
+            for loser in pending:
+                cancels[loser].set()
+                loser.cancel()
+            if future is second:
+                policy._count("wins")
+            else:
+                policy.record(time.monotonic() - started)
+            return future.result()
+    raise errors.get(first) or errors[second]
+
+
+async def ahedged_call(primary: Callable[[], Awaitable[T]], secondary: Callable[[], Awaitable[T]],
+                       policy: HedgePolicy) -> T:
+    """
+    Await `primary`, hedged by `secondary`, cancelling the losing task.
+
+    Args:
+        primary (callable): Coroutine function requesting the primary endpoint.
+        secondary (callable): Coroutine function requesting the secondary endpoint.
+        policy (HedgePolicy): Hedge delay and counters.
+
+    Returns:
+        The first successful result.
+
+    Raises:
+        Exception: The primary's error if both requests fail.
+    """
+    policy._count("requests")
+    started = time.monotonic()
+    first = asyncio.ensure_future(primary())
+    tasks = [first]
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=policy._wait_for_primary())
+        if done:
+            if first.exception() is None:
+                policy.record(time.monotonic() - started)
+            return first.result()
+
+        policy._count("hedged")
+        second = asyncio.ensure_future(secondary())
+        tasks.append(second)
+        pending = set(tasks)
+        errors = {}
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                error = task.exception()
+                if error is not None:
+                    errors[task] = error
+                    continue
+                if task is second:
+                    policy._count("wins")
+                else:
+                    policy.record(time.monotonic() - started)
+                return task.result()
+        raise errors.get(first) or errors[second]
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
@@ -0,0 +1,174 @@
+"""
+Instrumentation Module for Cognita SDK
+
+This module records per-request timings and sizes for the query pipeline and hands
+them to user-supplied hooks, e.g. to export them as metrics.
+
+Features:
+- `RequestTrace`: request ID, per-stage durations (validate, cache, http, parse,
+  format, summarize), payload sizes and outcome of one query.
+- `stage(name)`: context manager timing a stage of the trace active in the current
+  thread or asyncio task; it does nothing when no trace is active.
+- `record_stage(name, seconds)` / `record_size(name, size)`: add a duration measured
+  elsewhere (e.g. on a worker) or a payload size to the current trace.
+- `Instrumentation`: starts traces and calls registered hooks when they finish.
+"""
+
+import contextvars
+import logging
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_current_trace: "contextvars.ContextVar[Optional[RequestTrace]]" = contextvars.ContextVar(
+    "cognita_current_trace", default=None
+)
+
+
+class RequestTrace:
+    """
+    Timings and sizes collected while executing one query.
+
+    Attributes:
+        request_id (str): Unique identifier of the request.
+        query (str): The query as passed by the caller.
+        stages (dict): Seconds spent per stage, in the order the stages ran.
+        sizes (dict): Byte counts such as `request_bytes` and `response_bytes`.
+        status (str): "ok" or "error" once finished, "pending" before.
+        error (str): Exception type name when the request failed.
+        duration (float): Total seconds from start to finish.
+    """
+
+    def __init__(self, query: str, request_id: Optional[str] = None):
+        self.request_id = request_id or uuid.uuid4().hex[:16]
+        self.query = query
+        self.stages: Dict[str, float] = {}
+        self.sizes: Dict[str, int] = {}
+        self.status = "pending"
+        self.error: Optional[str] = None
+        self.duration = 0.0
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as stage `name` (repeated stages accumulate)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - start
+
+    def record_stage(self, name: str, seconds: float) -> None:
+        """Add `seconds` to stage `name`, for stages timed outside the trace's context."""
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def record_size(self, name: str, size: int) -> None:
+        """Record a payload size in bytes."""
+        self.sizes[name] = self.sizes.get(name, 0) + size
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        """Mark the trace as finished."""
+        self.duration = time.perf_counter() - self._started
+        self.status = "ok" if error is None else "error"
+        self.error = type(error).__name__ if error is not None else None
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the trace as a plain dictionary."""
+        return {
+            "request_id": self.request_id,
+            "query": self.query,
+            "status": self.status,
+            "error": self.error,
+            "duration": self.duration,
+            "stages": dict(self.stages),
+            "sizes": dict(self.sizes),
+        }
+
+    def __repr__(self) -> str:
+        return f"RequestTrace({self.as_dict()})"
+
+
+def current_trace() -> Optional[RequestTrace]:
+    """Return the trace active in the current thread or asyncio task, if any."""
+    return _current_trace.get()
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Time the enclosed block as stage `name` of the current trace, if any."""
+    trace = _current_trace.get()
+    if trace is None:
+        yield
+    else:
+        with trace.stage(name):
+            yield
+
+
+def record_stage(name: str, seconds: float) -> None:
+    """Add `seconds` to stage `name` of the current trace, if any."""
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.record_stage(name, seconds)
+
+
+def record_size(name: str, size: int) -> None:
+    """Record a payload size on the current trace, if any."""
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.record_size(name, size)
+
+
+class Instrumentation:
+    """
+    Starts request traces and delivers finished ones to hooks.
+
+    Hooks are callables taking a `RequestTrace`. Exceptions raised by a hook are
+    logged and otherwise ignored so that metrics export can never fail a query.
+    """
+
+    def __init__(self):
+        self.hooks: List[Callable[[RequestTrace], None]] = []
+
+    def add_hook(self, hook: Callable[[RequestTrace], None]) -> None:
+        """Register a callable receiving every finished trace."""
+        self.hooks.append(hook)
+
+    def remove_hook(self, hook: Callable[[RequestTrace], None]) -> None:
+        """Unregister a hook added with `add_hook`."""
+        self.hooks.remove(hook)
+
+    @contextmanager
+    def trace(self, query: str) -> Iterator[RequestTrace]:
+        """
+        Trace the enclosed block as one request.
+
+        The trace is active (see `current_trace`) inside the block, finished when
+        the block exits and then passed to every hook.
+
+        Args:
+            query (str): The query being executed.
+
+        Yields:
+            RequestTrace: The active trace.
+        """
+        trace = RequestTrace(query)
+        token = _current_trace.set(trace)
+        error = None
+        try:
+            yield trace
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            _current_trace.reset(token)
+            trace.finish(error)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Request trace: %s", trace.as_dict())
+            for hook in list(self.hooks):
+                try:
+                    hook(trace)
+                except Exception:
+                    logger.exception("Instrumentation hook %r failed", hook)
@@ -0,0 +1,305 @@
+"""
+Research Jobs Module for Cognita SDK
+
+This module tracks long-running research jobs. Instead of holding one blocking
+connection open per query until the research finishes, a query is submitted as a
+job (`DeepResearchAPI.submit_job`) and a single background poller checks the status
+of every outstanding job, resolving a `concurrent.futures.Future` per job.
+
+Features:
+- `JobHandle`: identifier and initial status of a submitted job.
+- `JobPoller`: one thread multiplexing status checks for any number of jobs, ordered
+  by due time in a heap so idle jobs cost nothing between polls.
+- Adaptive polling: intervals grow geometrically while a job's status is unchanged,
+  reset when it changes, and follow the server's `poll_after` hint when present.
+- Per-job timeouts, checked before every poll, and tolerance of transient polling
+  errors. Each status check has its own deadline, so a hung request delays the
+  other jobs (and `close`) by at most `poll_timeout`.
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import nullcontext
+from typing import Any, Dict, List, Optional, Tuple
+from .deadline import deadline_scope
+from .errors import APIError, CircuitOpenError, JobFailedError
+
+logger = logging.getLogger(__name__)
+
+#: Job states after which the job is no longer polled.
+FAILED_STATES = frozenset({"failed", "error", "cancelled"})
+COMPLETED_STATE = "completed"
+
+
+class JobHandle:
+    """
+    Handle of a research job submitted with `DeepResearchAPI.submit_job`.
+
+    Attributes:
+        job_id (str): Server-assigned job identifier.
+        query (str): The submitted query.
+        status (str): Status reported at submission (usually "pending").
+        poll_after (float): Server hint for the first status check, in seconds, or None.
+        submitted_at (float): `time.time()` at submission.
+    """
+
+    __slots__ = ("job_id", "query", "status", "poll_after", "submitted_at")
+
+    def __init__(self, job_id: str, query: str, status: str = "pending",
+                 poll_after: Optional[float] = None):
+        self.job_id = job_id
+        self.query = query
+        self.status = status
+        self.poll_after = poll_after
+        self.submitted_at = time.time()
+
+    @classmethod
+    def from_response(cls, response: Dict[str, Any], query: str) -> "JobHandle":
+        """
+        Build a handle from the job submission response.
+
+        Args:
+            response (dict): Response of the jobs endpoint.
+            query (str): The submitted query.
+
+        Returns:
+            JobHandle: The job handle.
+
+        Raises:
+            APIError: If the response does not contain a job ID.
+        """
+        job_id = response.get("job_id") or response.get("id")
+        if not job_id:
+            raise APIError("Job submission response has no job ID")
+        return cls(str(job_id), query, response.get("status", "pending"),
+                   _as_seconds(response.get("poll_after")))
+
+    def __repr__(self) -> str:
+        return f"JobHandle(job_id={self.job_id!r}, status={self.status!r})"
+
+
+def _as_seconds(value: Any) -> Optional[float]:
+    try:
+        return max(float(value), 0.0) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class _TrackedJob:
+    """Polling state of one job."""
+
+    __slots__ = ("handle", "future", "interval", "deadline", "errors", "status")
+
+    def __init__(self, handle: JobHandle, future: Future, interval: float,
+                 deadline: Optional[float]):
+        self.handle = handle
+        self.future = future
+        self.interval = interval
+        self.deadline = deadline
+        self.errors = 0
+        self.status = handle.status
+
+
+class JobPoller:
+    """
+    Polls the status of many research jobs from a single background thread.
+
+    `track(handle)` returns a future that resolves to the job's raw research
+    response, or fails with `JobFailedError` when the job fails or times out (or with
+    the last `APIError` after `max_poll_errors` consecutive polling failures).
+    Polls are issued one at a time over the API client's pooled connections, so
+    thousands of outstanding jobs need neither thousands of threads nor sockets.
+    Each poll runs under a deadline of `poll_timeout` seconds, and a job past its
+    timeout is failed before it is polled again, even while polls fail or the
+    jobs endpoint's circuit is open.
+
+    Cancelling a returned future stops polling that job.
+    """
+
+    def __init__(self, api, min_interval: float = 1.0, max_interval: float = 30.0,
+                 backoff: float = 1.5, timeout: float = 0.0, max_poll_errors: int = 5,
+                 poll_timeout: float = 10.0):
+        """
+        Args:
+            api (DeepResearchAPI): Client used for `get_job_status` calls.
+            min_interval (float): Seconds before the first poll and after a status change.
+            max_interval (float): Upper bound for the interval between polls of a job.
+            backoff (float): Factor applied to the interval while the status is unchanged.
+            timeout (float): Seconds after which a job is given up (0 waits forever).
+            max_poll_errors (int): Consecutive failed polls tolerated per job.
+            poll_timeout (float): Seconds allowed per status check, retries included
+                (0 leaves it to the client's own deadline).
+        """
+        if min_interval <= 0 or max_interval < min_interval:
+            raise ValueError("require 0 < min_interval <= max_interval")
+        self.api = api
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = max(backoff, 1.0)
+        self.timeout = timeout
+        self.max_poll_errors = max(max_poll_errors, 1)
+        self.poll_timeout = poll_timeout
+        self.polls = 0
+        self._heap: List[Tuple[float, int, _TrackedJob]] = []
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    @classmethod
+    def from_config(cls, api, config) -> "JobPoller":
+        """Build a poller from the `JOB_POLL_*` and `JOB_TIMEOUT` settings."""
+        return cls(
+            api,
+            min_interval=getattr(config, "JOB_POLL_MIN_INTERVAL", 1.0),
+            max_interval=getattr(config, "JOB_POLL_MAX_INTERVAL", 30.0),
+            backoff=getattr(config, "JOB_POLL_BACKOFF", 1.5),
+            timeout=getattr(config, "JOB_TIMEOUT", 0.0),
+            poll_timeout=getattr(config, "JOB_POLL_TIMEOUT", 10.0),
+        )
+
+    @property
+    def pending(self) -> int:
+        """Number of jobs waiting for their next status check."""
+        with self._cond:
+            return len(self._heap)
+
+    def track(self, handle: JobHandle) -> Future:
+        """
+        Start polling a job.
+
+        Args:
+            handle (JobHandle): Handle returned by `submit_job`.
+
+        Returns:
+            Future: Resolves to the job's raw research response.
+
+        Raises:
+            APIError: If the poller has been closed.
+        """
+        future: Future = Future()
+        first = handle.poll_after if handle.poll_after is not None else self.min_interval
+        now = time.monotonic()
+        job = _TrackedJob(handle, future, self.min_interval,
+                          now + self.timeout if self.timeout else None)
+        with self._cond:
+            if self._closed:
+                raise APIError("Job poller has been closed")
+            self._schedule(job, now + min(first, self.max_interval))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="cognita-job-poller",
+                                                daemon=True)
+                self._thread.start()
+        return future
+
+    def _schedule(self, job: _TrackedJob, due: float) -> None:
+        # Caller holds self._cond.
+        heapq.heappush(self._heap, (due, next(self._counter), job))
+        if self._heap[0][2] is job:
+            self._cond.notify()
+
+    def _reschedule(self, job: _TrackedJob, delay: float) -> None:
+        now = time.monotonic()
+        if job.deadline is not None:
+            # Wake up by the job's deadline so it times out on time.
+            delay = min(delay, max(job.deadline - now, 0.0))
+        with self._cond:
+            if not self._closed:
+                self._schedule(job, now + delay)
+                return
+        job.future.cancel()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._closed:
+                    now = time.monotonic()
+                    if self._heap and self._heap[0][0] <= now:
+                        break
+                    self._cond.wait(self._heap[0][0] - now if self._heap else None)
+                if self._closed:
+                    return
+                _, _, job = heapq.heappop(self._heap)
+            if not job.future.cancelled():
+                self._poll(job)
+
+    def _poll(self, job: _TrackedJob) -> None:
+        """Check one job and resolve or reschedule it."""
+        job_id = job.handle.job_id
+        if job.deadline is not None and time.monotonic() >= job.deadline:
+            self._fail(job, JobFailedError(job_id, f"timed out after {self.timeout:g}s"))
+            return
+        self.polls += 1
+        scope = deadline_scope(total=self.poll_timeout) if self.poll_timeout > 0 else nullcontext()
+        try:
+            with scope:
+                status = self.api.get_job_status(job_id)
+        except CircuitOpenError as e:
+            self._reschedule(job, max(e.retry_in, job.interval))
+            return
+        except APIError as e:
+            job.errors += 1
+            if job.errors >= self.max_poll_errors:
+                logger.error("Giving up on job %s after %d failed polls: %s", job_id, job.errors, e)
+                self._fail(job, e)
+            else:
+                job.interval = min(job.interval * self.backoff, self.max_interval)
+                self._reschedule(job, job.interval)
+            return
+        except Exception as e:
+            logger.exception("Unexpected error polling job %s", job_id)
+            self._fail(job, e)
+            return
+        job.errors = 0
+
+        state = str(status.get("status", "pending")).lower() if isinstance(status, dict) else None
+        job.handle.status = state
+        if state == COMPLETED_STATE:
+            result = status.get("result")
+            if isinstance(result, dict):
+                if not job.future.done():
+                    job.future.set_result(result)
+            else:
+                self._fail(job, JobFailedError(job_id, "completed without a result"))
+        elif state is None or state in FAILED_STATES:
+            reason = status.get("error") if isinstance(status, dict) else None
+            self._fail(job, JobFailedError(job_id, reason or f"status {state or 'invalid'}"))
+        elif job.deadline is not None and time.monotonic() >= job.deadline:
+            self._fail(job, JobFailedError(job_id, f"timed out after {self.timeout:g}s"))
+        else:
+            hint = _as_seconds(status.get("poll_after"))
+            if hint is not None:
+                job.interval = min(max(hint, self.min_interval), self.max_interval)
+            elif state != job.status:
+                job.interval = self.min_interval
+            else:
+                job.interval = min(job.interval * self.backoff, self.max_interval)
+            job.status = state
+            self._reschedule(job, job.interval)
+
+    @staticmethod
+    def _fail(job: _TrackedJob, error: BaseException) -> None:
+        if not job.future.done():
+            job.future.set_exception(error)
+
+    def close(self) -> None:
+        """Stop polling and cancel the futures of unfinished jobs."""
+        with self._cond:
+            self._closed = True
+            jobs, self._heap = [entry[2] for entry in self._heap], []
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        for job in jobs:
+            job.future.cancel()
+
+    def __enter__(self) -> "JobPoller":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
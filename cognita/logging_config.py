@@ -2,34 +2,45 @@
 """
 Logging Configuration Module
 
-This module sets up a standardized logging configuration for the Cognita SDK.
-It ensures that logs are recorded in both a log file and the console,
-making debugging and monitoring easier.
+This module provides a standardized logging setup for applications using the
+Cognita SDK. Importing it has no side effects; call `configure_logging()` to
+install the handlers.
 
 Features:
-- Logs are saved to `cognita.log`.
+- Logs can be saved to a file such as `cognita.log`.
 - Logs are displayed in the console for real-time monitoring.
 - Log format includes timestamp, log level, and message.
 - Supports INFO level logging by default.
 """
 
 import logging
+from typing import Optional
 
-# Configure logging settings
-logging.basicConfig(
-    level=logging.INFO,  # Set log level to INFO
-    format='%(asctime)s - %(levelname)s - %(message)s',  # Log format
-    handlers=[
-        logging.FileHandler("cognita.log"),  # Save logs to a file
-        logging.StreamHandler()  # Print logs to console
-    ]
-)
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
 
 # Create a logger instance
 logger = logging.getLogger("CognitaSDK")
 
+
+def configure_logging(level: int = logging.INFO, log_file: Optional[str] = "cognita.log",
+                      fmt: str = LOG_FORMAT) -> None:
+    """
+    Configure root logging with a console handler and an optional file handler.
+
+    Args:
+        level (int): Log level, INFO by default.
+        log_file (str, optional): File to also write logs to; None logs to the console only.
+        fmt (str): Log record format.
+    """
+    handlers = [logging.StreamHandler()]  # Print logs to console
+    if log_file:
+        handlers.append(logging.FileHandler(log_file))  # Save logs to a file
+    logging.basicConfig(level=level, format=fmt, handlers=handlers)
+
+
 # Example log messages (for testing purposes)
 if __name__ == "__main__":
+    configure_logging()
     logger.info("Logging system initialized.")
     logger.warning("This is a warning message.")
     logger.error("This is an error message.")
@@ -0,0 +1,161 @@
+"""
+Micro-Batching Module for Cognita SDK
+
+This module packs many individual queries into few HTTP requests. Queries submitted
+from any thread are collected for a short window (or until a size limit is reached),
+sent together through the API's batch endpoint, and the per-query results are handed
+back to the individual callers through futures.
+
+Features:
+- `MicroBatcher`: size- and time-bounded collection of queries, with a bounded
+  number of batches in flight.
+- Duplicate queries inside one batch are sent once and fanned out to every caller.
+- A failing batch fails the futures of all its queries; an error reported for a
+  single item only fails that query's future.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from .errors import APIError
+
+logger = logging.getLogger(__name__)
+
+BatchSender = Callable[[Sequence[str]], Sequence[Union[Dict[str, Any], BaseException]]]
+
+
+class MicroBatcher:
+    """
+    Collects queries into batches and de-multiplexes the results.
+
+    A batch is sent as soon as `max_batch_size` distinct queries are waiting, or
+    `max_wait` seconds after its first query arrived, whichever comes first.
+
+    Attributes:
+        batches (int): Number of batches sent.
+        submitted (int): Number of queries submitted.
+    """
+
+    def __init__(self, send: BatchSender, max_batch_size: int = 20, max_wait: float = 0.01,
+                 max_in_flight: int = 4):
+        """
+        Args:
+            send (callable): Sends a list of queries and returns one raw response or
+                exception per query, in order (e.g. `DeepResearchAPI.submit_batch_request`).
+            max_batch_size (int): Maximum distinct queries per batch.
+            max_wait (float): Seconds to wait for more queries after the first one.
+            max_in_flight (int): Maximum batches being sent concurrently.
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.send = send
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.batches = 0
+        self.submitted = 0
+        self._pending: Dict[str, List[Future]] = {}
+        self._first_at = 0.0
+        self._cond = threading.Condition()
+        self._executor = ThreadPoolExecutor(max_workers=max(max_in_flight, 1),
+                                            thread_name_prefix="cognita-batch")
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    @classmethod
+    def from_config(cls, send: BatchSender, config) -> "MicroBatcher":
+        """Build a batcher from the `BATCH_*` settings."""
+        return cls(
+            send,
+            max_batch_size=getattr(config, "BATCH_MAX_SIZE", 20),
+            max_wait=getattr(config, "BATCH_WINDOW", 0.01),
+            max_in_flight=getattr(config, "BATCH_MAX_IN_FLIGHT", 4),
+        )
+
+    def submit(self, query: str) -> Future:
+        """
+        Queue a query for the next batch.
+
+        Args:
+            query (str): Validated research query.
+
+        Returns:
+            Future: Resolves to the query's raw API response.
+
+        Raises:
+            APIError: If the batcher has been closed.
+        """
+        future: Future = Future()
+        with self._cond:
+            if self._closed:
+                raise APIError("Micro-batcher has been closed")
+            if not self._pending:
+                self._first_at = time.monotonic()
+            self._pending.setdefault(query, []).append(future)
+            self.submitted += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="cognita-batcher", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+        return future
+
+    def _take(self) -> List[Tuple[str, List[Future]]]:
+        # Caller holds self._cond. Dicts keep insertion order, so queries go out FIFO.
+        batch = []
+        for query in list(self._pending)[:self.max_batch_size]:
+            batch.append((query, self._pending.pop(query)))
+        if self._pending:
+            self._first_at = time.monotonic()
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if self._pending:
+                        remaining = self._first_at + self.max_wait - time.monotonic()
+                        if len(self._pending) >= self.max_batch_size or remaining <= 0 or self._closed:
+                            break
+                        self._cond.wait(remaining)
+                    elif self._closed:
+                        return
+                    else:
+                        self._cond.wait()
+                batch = self._take()
+                self.batches += 1
+            self._executor.submit(self._dispatch, batch)
+
+    def _dispatch(self, batch: List[Tuple[str, List[Future]]]) -> None:
+        """Send one batch and resolve the futures of its queries."""
+        queries = [query for query, _ in batch]
+        try:
+            results = list(self.send(queries))
+            if len(results) != len(queries):
+                raise APIError(f"Batch response has {len(results)} results for {len(queries)} queries")
+        except Exception as e:
+            logger.error("Batch of %d queries failed: %s", len(queries), e)
+            results = [e] * len(queries)
+        for (_, futures), result in zip(batch, results):
+            for future in futures:
+                if future.set_running_or_notify_cancel():
+                    if isinstance(result, BaseException):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+
+    def close(self) -> None:
+        """Send the queries still waiting, then stop the batcher."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "MicroBatcher":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -0,0 +1,357 @@
+"""
+Mock Deep Research Server for Cognita SDK
+
+This module provides a local stand-in for the Deep Research API, used by the test
+suite and the benchmarks to exercise real HTTP connections, serialization and
+concurrency without calling the production service.
+
+Features:
+- Serves `POST /research` on a background thread (HTTP/1.1 with keep-alive).
+- Configurable latency, payload size (number of sources) and error rate.
+- Streams NDJSON or server-sent events when the request asks for `"stream": true`.
+- Batches: `POST /research/batch` answers every item of `{"requests": [...]}`;
+  items with an empty query get a per-item error.
+- Long-running jobs: `POST /research/jobs` and `GET /research/jobs/<id>`, with
+  jobs completing `job_duration` seconds after submission.
+- Conditional refreshes: `/research` responses carry an `ETag` that changes with
+  `revision`; a matching `If-None-Match` gets "304 Not Modified", and a stale one
+  sent with a `since` field gets a delta holding only the newer sources.
+- Counts requests and connections so tests can assert on client behaviour.
+
+Run it standalone with:
+
+    python -m cognita.mock_server --port 8080 --latency 0.05 --sources 20
+"""
+
+import argparse
+import itertools
+import json
+import random
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional
+from urllib.parse import unquote
+
+
+def build_response(query: str, num_sources: int, revision: int = 0) -> Dict[str, Any]:
+    """
+    Build a deterministic research response for `query`.
+
+    Args:
+        query (str): The research query.
+        num_sources (int): Number of sources to include.
+        revision (int): Number of updates published since the first revision; each
+            adds one source.
+
+    Returns:
+        dict: Response body in the Deep Research API format.
+    """
+    crc = zlib.crc32(query.encode("utf-8"))
+    sources = [
+        {
+            "title": f"Source {index} on {query}",
+            "url": f"https://example.org/{crc}/{index}",
+            "confidence": round(1.0 - index / (num_sources + 1), 4),
+        }
+        for index in range(num_sources)
+    ]
+    sources.extend(
+        {"title": f"Update {update} on {query}", "url": f"https://example.org/{crc}/update-{update}",
+         "confidence": 0.5}
+        for update in range(1, revision + 1)
+    )
+    return {
+        "summary": f"Mock summary for: {query}" + (f" (revision {revision})" if revision else ""),
+        "sources": sources,
+        "confidence_score": 0.9,
+    }
+
+
+def _etag(num_sources: int, revision: int) -> str:
+    return f'"{num_sources}-{revision}"'
+
+
+def _etag_revision(etag: Optional[str], num_sources: int) -> Optional[int]:
+    """Return the revision an ETag of ours was issued for, or None."""
+    if not etag:
+        return None
+    sources, _, revision = etag.strip('"').partition("-")
+    if sources != str(num_sources) or not revision.isdigit():
+        return None
+    return int(revision)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without TCP_NODELAY every response
+    # would wait out the client's delayed ACK and dominate the measured latency.
+    disable_nagle_algorithm = True
+    server: "_Server"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # Keep test and benchmark output quiet.
+        pass
+
+    def setup(self) -> None:
+        super().setup()
+        self.server.owner._count("connections")
+
+    def _read_json(self) -> Dict[str, Any]:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b"{}"
+        return json.loads(body or b"{}")
+
+    def _send_json(self, status: int, body: Any, headers: Optional[Dict[str, str]] = None) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_chunk(self, data: bytes) -> None:
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        self.wfile.flush()
+
+    def _stream(self, response: Dict[str, Any], sse: bool) -> None:
+        owner = self.server.owner
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream" if sse else "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        events = [{"type": "source", "source": source} for source in response["sources"]]
+        events.append({"type": "summary", "text": response["summary"]})
+        events.append({"type": "confidence", "confidence_score": response["confidence_score"]})
+        events.append({"type": "done"})
+        for event in events:
+            line = json.dumps(event)
+            self._send_chunk((f"data: {line}\n\n" if sse else line + "\n").encode("utf-8"))
+            if owner.stream_interval:
+                time.sleep(owner.stream_interval)
+        self._send_chunk(b"")
+
+    def _admit(self) -> bool:
+        """Count, authenticate, delay and possibly fail the request; True to serve it."""
+        owner = self.server.owner
+        owner._count("requests")
+        if self.headers.get("Authorization") != f"Bearer {owner.api_key}":
+            self._send_json(401, {"error": "unauthorized"})
+            return False
+        if owner.latency:
+            time.sleep(owner.latency * random.uniform(1.0 - owner.jitter, 1.0 + owner.jitter))
+        if owner.error_rate and random.random() < owner.error_rate:
+            owner._count("errors")
+            self._send_json(503, {"error": "unavailable"}, {"Retry-After": "0"})
+            return False
+        return True
+
+    def do_GET(self) -> None:
+        owner = self.server.owner
+        path = self.path.rstrip("/")
+        if not self._admit():
+            return
+        if "/research/jobs/" in path:
+            status = owner._job_status(unquote(path.rsplit("/", 1)[1]))
+            if status is None:
+                self._send_json(404, {"error": "unknown job"})
+            else:
+                self._send_json(200, status)
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def do_POST(self) -> None:
+        owner = self.server.owner
+        try:
+            payload = self._read_json()
+        except ValueError:
+            owner._count("requests")
+            self._send_json(400, {"error": "invalid JSON"})
+            return
+        if not self._admit():
+            return
+
+        path = self.path.rstrip("/")
+        if path.endswith("/research/batch"):
+            owner._count("batches")
+            self._send_json(200, {"results": [
+                {"id": item.get("id"), "error": "query is empty"} if not item.get("query") else
+                {"id": item.get("id"), "result": build_response(item["query"], min(
+                    owner.num_sources, item.get("parameters", {}).get("max_results", owner.num_sources)))}
+                for item in payload.get("requests", [])
+            ]})
+        elif path.endswith("/research/jobs"):
+            self._send_json(202, owner._create_job(payload.get("query", "")))
+        elif path.endswith("/research"):
+            revision = owner.revision
+            response = build_response(payload.get("query", ""), owner.num_sources, revision)
+            if payload.get("stream"):
+                self._stream(response, owner.stream_format == "sse")
+                return
+            etag = _etag(owner.num_sources, revision)
+            known = _etag_revision(self.headers.get("If-None-Match"), owner.num_sources)
+            if known == revision:
+                owner._count("not_modified")
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+            elif known is not None and known < revision and payload.get("since"):
+                owner._count("deltas")
+                self._send_json(200, {
+                    "delta": True,
+                    "summary": response["summary"],
+                    "sources": response["sources"][owner.num_sources + known:],
+                }, {"ETag": etag})
+            else:
+                self._send_json(200, response, {"ETag": etag})
+        else:
+            self._send_json(404, {"error": "not found"})
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # The socketserver default backlog of 5 drops connection bursts from
+    # concurrent clients, which then stall for a SYN retransmit.
+    request_queue_size = 128
+    owner: "MockResearchServer"
+
+
+class MockResearchServer:
+    """
+    Local HTTP server imitating the Deep Research API.
+
+    Example:
+        with MockResearchServer(latency=0.01, num_sources=5) as server:
+            config.API_BASE_URL = server.url
+            ...
+
+    Attributes:
+        url (str): Base URL to use as `API_BASE_URL` once started.
+        stats (dict): Counters for `requests`, `connections`, `errors`, `batches`,
+            `not_modified` and `deltas`.
+        jobs (int): Number of jobs submitted so far.
+        revision (int): Current revision of every research result; increment it to
+            publish one more source per query.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, api_key: str = "mock-key",
+                 latency: float = 0.0, jitter: float = 0.0, num_sources: int = 5,
+                 error_rate: float = 0.0, stream_format: str = "ndjson",
+                 stream_interval: float = 0.0, job_duration: float = 0.0, revision: int = 0):
+        """
+        Args:
+            host (str): Interface to bind.
+            port (int): Port to bind; 0 picks a free port.
+            api_key (str): Bearer token the server accepts.
+            latency (float): Seconds to wait before answering each request.
+            jitter (float): Relative latency variation (0.2 means +/-20%).
+            num_sources (int): Number of sources per response (controls payload size).
+            error_rate (float): Fraction of requests answered with 503.
+            stream_format (str): "ndjson" or "sse" for streamed responses.
+            stream_interval (float): Seconds between streamed events.
+            job_duration (float): Seconds a job stays "running" before completing.
+            revision (int): Initial revision of the research results.
+        """
+        self.host = host
+        self.port = port
+        self.api_key = api_key
+        self.latency = latency
+        self.jitter = jitter
+        self.num_sources = num_sources
+        self.error_rate = error_rate
+        self.stream_format = stream_format
+        self.stream_interval = stream_interval
+        self.job_duration = job_duration
+        self.revision = revision
+        self.stats = {"requests": 0, "connections": 0, "errors": 0, "batches": 0,
+                      "not_modified": 0, "deltas": 0}
+        self._jobs: Dict[str, Any] = {}
+        self._job_ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._server: Optional[_Server] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self.stats[name] = self.stats.get(name, 0) + amount
+
+    def _create_job(self, query: str) -> Dict[str, Any]:
+        with self._lock:
+            job_id = f"job-{next(self._job_ids)}"
+            self._jobs[job_id] = (query, time.monotonic() + self.job_duration)
+        return {"job_id": job_id, "status": "pending"}
+
+    def _job_status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        query, ready_at = job
+        if time.monotonic() < ready_at:
+            return {"job_id": job_id, "status": "running"}
+        return {"job_id": job_id, "status": "completed",
+                "result": build_response(query, self.num_sources)}
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def jobs(self) -> int:
+        with self._lock:
+            return len(self._jobs)
+
+    def start(self) -> "MockResearchServer":
+        """Start serving on a background thread."""
+        self._server = _Server((self.host, self.port), _Handler)
+        self._server.owner = self
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server and close its socket."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "MockResearchServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+
+def main(argv=None) -> None:
+    """Run the mock server in the foreground."""
+    parser = argparse.ArgumentParser(description="Local mock Deep Research API server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--api-key", default="mock-key")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--sources", type=int, default=5)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--stream-format", choices=("ndjson", "sse"), default="ndjson")
+    parser.add_argument("--job-duration", type=float, default=0.0)
+    args = parser.parse_args(argv)
+
+    server = MockResearchServer(args.host, args.port, args.api_key, args.latency, args.jitter,
+                                args.sources, args.error_rate, args.stream_format,
+                                job_duration=args.job_duration)
+    server.start()
+    print(f"Mock Deep Research API listening on {server.url} (API key: {args.api_key})")
+    try:
+        server._thread.join()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
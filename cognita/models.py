@@ -0,0 +1,236 @@
+"""
+Result Model Module for Cognita SDK
+
+This module provides compact, typed representations of research results. They are
+built once, directly from the raw API response, and avoid the per-result dictionary
+overhead when many results are kept in memory for aggregation.
+
+Features:
+- `Source`: a single cited source (`__slots__`, no per-instance dict).
+- `ResearchResult`: summary, sources and confidence of one query, with `to_dict()`
+  returning the same structure as `summarize_results` for backward compatibility.
+- `ResultCollection`: column-oriented container for large numbers of results.
+"""
+
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+_SOURCE_FIELDS = ("title", "url", "doi", "confidence")
+
+
+class Source:
+    """
+    A source cited by a research result.
+
+    Sources arrive either as plain strings or as objects with `title`, `url`, `doi`
+    and `confidence` keys; any other keys are kept in `extra`. `to_raw()` returns the
+    source in its original shape.
+    """
+
+    __slots__ = ("title", "url", "doi", "confidence", "extra", "_bare")
+
+    def __init__(self, title: Optional[str] = None, url: Optional[str] = None,
+                 doi: Optional[str] = None, confidence: Optional[float] = None,
+                 extra: Optional[Dict[str, Any]] = None):
+        self.title = title
+        self.url = url
+        self.doi = doi
+        self.confidence = confidence
+        self.extra = extra
+        self._bare = False
+
+    @classmethod
+    def from_raw(cls, raw: Union[str, Dict[str, Any]]) -> "Source":
+        """
+        Build a source from an item of the API's `sources` list.
+
+        Args:
+            raw (str or dict): Source as returned by the API.
+
+        Returns:
+            Source: The typed source.
+        """
+        if isinstance(raw, dict):
+            extra = {key: value for key, value in raw.items() if key not in _SOURCE_FIELDS}
+            return cls(raw.get("title"), raw.get("url"), raw.get("doi"),
+                       raw.get("confidence"), extra or None)
+        source = cls(title=str(raw))
+        source._bare = True
+        return source
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the non-empty fields (and extra keys) as a dictionary."""
+        data = {field: getattr(self, field) for field in _SOURCE_FIELDS
+                if getattr(self, field) is not None}
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def to_raw(self) -> Union[str, Dict[str, Any]]:
+        """Return the source in the shape it had in the API response."""
+        return self.title if self._bare else self.to_dict()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Source):
+            return NotImplemented
+        return self.to_raw() == other.to_raw()
+
+    def __hash__(self) -> int:
+        return hash((self.title, self.url, self.doi))
+
+    def __repr__(self) -> str:
+        return f"Source({self.to_raw()!r})"
+
+
+class ResearchResult:
+    """
+    Typed research result.
+
+    Attributes:
+        summary (str): Research summary.
+        sources (tuple): Cited `Source` objects.
+        confidence (float): Confidence score reported by the API.
+        query (str): The validated query, when known.
+        stages (dict): Outputs of the agent's post-processing stages, or None.
+    """
+
+    __slots__ = ("summary", "sources", "confidence", "query", "stages")
+
+    def __init__(self, summary: str = "", sources: Tuple[Source, ...] = (),
+                 confidence: float = 0.0, query: Optional[str] = None,
+                 stages: Optional[Dict[str, Any]] = None):
+        self.summary = summary
+        self.sources = sources
+        self.confidence = confidence
+        self.query = query
+        self.stages = stages
+
+    @classmethod
+    def from_response(cls, raw_data: Dict[str, Any], query: Optional[str] = None) -> "ResearchResult":
+        """
+        Build a result directly from a raw API response.
+
+        Args:
+            raw_data (dict): Raw API response.
+            query (str, optional): The query that produced the response.
+
+        Returns:
+            ResearchResult: The typed result.
+        """
+        return cls(
+            raw_data.get("summary", ""),
+            tuple(Source.from_raw(source) for source in raw_data.get("sources", ())),
+            raw_data.get("confidence_score", 0.0),
+            query,
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], query: Optional[str] = None) -> "ResearchResult":
+        """
+        Build a result from a `format_response` or `summarize_results` dictionary.
+
+        Args:
+            data (dict): Formatted (`summary`) or summarized (`final_summary`) results.
+            query (str, optional): The query that produced the results.
+
+        Returns:
+            ResearchResult: The typed result.
+        """
+        summary = data["final_summary"] if "final_summary" in data else data.get("summary", "")
+        return cls(
+            summary,
+            tuple(Source.from_raw(source) for source in data.get("sources", ())),
+            data.get("confidence", 0.0),
+            query,
+        )
+
+    def with_stages(self, stages: Dict[str, Any]) -> "ResearchResult":
+        """Return a copy of the result carrying post-processing stage outputs."""
+        return ResearchResult(self.summary, self.sources, self.confidence, self.query, stages)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the result in the structure produced by `summarize_results`."""
+        return {
+            "final_summary": self.summary,
+            "sources": [source.to_raw() for source in self.sources],
+            "confidence": self.confidence,
+        }
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ResearchResult):
+            return NotImplemented
+        return (self.summary, self.sources, self.confidence, self.query) == \
+            (other.summary, other.sources, other.confidence, other.query)
+
+    def __repr__(self) -> str:
+        return (f"ResearchResult(query={self.query!r}, confidence={self.confidence}, "
+                f"sources={len(self.sources)})")
+
+
+class ResultCollection:
+    """
+    Column-oriented container for many research results.
+
+    Each field is kept in its own column (confidence scores in a packed
+    `array('d')`), so a collection of tens of thousands of results costs no
+    per-result object. Indexing or iterating materializes `ResearchResult` views.
+    """
+
+    __slots__ = ("queries", "summaries", "sources", "confidences")
+
+    def __init__(self, results: Iterable[Union[ResearchResult, Dict[str, Any]]] = ()):
+        """
+        Args:
+            results (iterable): `ResearchResult` objects or summarized result dicts.
+        """
+        self.queries: List[Optional[str]] = []
+        self.summaries: List[str] = []
+        self.sources: List[Tuple[Source, ...]] = []
+        self.confidences = array("d")
+        self.extend(results)
+
+    def append(self, result: Union[ResearchResult, Dict[str, Any]]) -> None:
+        """Add a `ResearchResult` or a summarized result dictionary."""
+        if not isinstance(result, ResearchResult):
+            result = ResearchResult.from_dict(result)
+        self.queries.append(result.query)
+        self.summaries.append(result.summary)
+        self.sources.append(result.sources)
+        self.confidences.append(result.confidence)
+
+    def extend(self, results: Iterable[Union[ResearchResult, Dict[str, Any]]]) -> None:
+        """Add several results."""
+        for result in results:
+            self.append(result)
+
+    def filter(self, min_confidence: float) -> "ResultCollection":
+        """Return a new collection with the results scoring at least `min_confidence`."""
+        selected = ResultCollection()
+        for index, confidence in enumerate(self.confidences):
+            if confidence >= min_confidence:
+                selected.append(self[index])
+        return selected
+
+    def mean_confidence(self) -> float:
+        """Average confidence score (0.0 for an empty collection)."""
+        return sum(self.confidences) / len(self.confidences) if self.confidences else 0.0
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Return every result in the structure produced by `summarize_results`."""
+        return [result.to_dict() for result in self]
+
+    def to_table(self) -> "ResultTable":
+        """Return the results as a NumPy-backed `cognita.table.ResultTable`."""
+        from .table import ResultTable
+        return ResultTable.from_results(self)
+
+    def __len__(self) -> int:
+        return len(self.confidences)
+
+    def __getitem__(self, index: int) -> ResearchResult:
+        return ResearchResult(self.summaries[index], self.sources[index],
+                              self.confidences[index], self.queries[index])
+
+    def __iter__(self) -> Iterator[ResearchResult]:
+        for index in range(len(self)):
+            yield self[index]
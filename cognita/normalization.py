@@ -0,0 +1,250 @@
+"""
+Query Normalization Module for Cognita SDK
+
+This module recognizes research queries that ask the same thing in different words,
+so the agent can answer them from the cache instead of calling the API again.
+"Recent advancements in quantum computing?" and "recent advances in quantum
+computing" canonicalize to the same string; longer queries that differ by a word
+are found by a MinHash/LSH similarity index.
+
+Features:
+- `canonicalize_query`: casefolding, Unicode and punctuation normalization,
+  stopword removal and light suffix stemming. Question words, directional
+  prepositions, tense and modal auxiliaries and "and"/"or" are kept.
+- `NearDuplicateIndex`: bounded in-memory MinHash index with locality-sensitive
+  hashing (banding), so a lookup only compares against a handful of candidates.
+  Queries are shingled into ordered word n-grams, so reordered words or a
+  different question word make queries dissimilar.
+- `QUERY_MATCHING_MODES`: "exact", "canonical" and "similar" agent cache matching.
+
+Only the standard library is used.
+"""
+
+import hashlib
+import random
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+QUERY_MATCHING_MODES = ("exact", "canonical", "similar")
+
+# Only words that never change what is asked are stopwords. Interrogatives (how,
+# what, when, where, which, who, why), directional prepositions (to, from, into),
+# auxiliaries carrying tense or modality (did, will, should, can, ...) and the
+# connectives "and"/"or" are kept: "Why/How does smoking cause cancer", "flights to
+# Paris from London" and "flights from Paris to London", or "Did/Will inflation
+# rise" ask different things.
+STOPWORDS: FrozenSet[str] = frozenset("""
+a about an any are as at be being by for i in is it its me my of on our please so
+some tell than that the their them there these this those we with you your
+""".split())
+
+_NON_WORD = re.compile(r"[\W_]+", re.UNICODE)
+# Longest suffixes first; replacement, and the minimum stem length left behind.
+_SUFFIXES: Tuple[Tuple[str, str], ...] = (
+    ("ational", "ate"), ("ements", ""), ("ations", ""), ("ement", ""), ("ments", ""),
+    ("ation", ""), ("ment", ""), ("ings", ""), ("ness", ""), ("ies", "y"), ("ing", ""),
+    ("ers", ""), ("es", ""), ("ed", ""), ("er", ""), ("ly", ""), ("s", ""),
+)
+_MIN_STEM = 3
+# Mersenne prime for the universal hash family used by MinHash.
+_PRIME = (1 << 61) - 1
+
+
+def stem(word: str) -> str:
+    """
+    Strip a common English suffix from a word.
+
+    This is deliberately lighter than a full Porter stemmer: it only needs to map
+    inflections of one word to the same token ("advances", "advancements" and
+    "advanced" all become "advanc").
+    """
+    for suffix, replacement in _SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= _MIN_STEM:
+            if suffix == "s" and word.endswith("ss"):
+                return word
+            return word[:-len(suffix)] + replacement
+    return word
+
+
+def query_tokens(query: str) -> List[str]:
+    """
+    Split a query into canonical tokens.
+
+    Args:
+        query (str): Research query.
+
+    Returns:
+        list: Stemmed, casefolded tokens without stopwords, in query order. If
+        every word is a stopword, the unstemmed words are returned instead.
+    """
+    text = unicodedata.normalize("NFKC", query).casefold()
+    words = _NON_WORD.sub(" ", text).split()
+    tokens = [stem(word) for word in words if word not in STOPWORDS]
+    return tokens or words
+
+
+def canonicalize_query(query: str) -> str:
+    """
+    Return the canonical form of a query.
+
+    Queries that differ only in case, punctuation, stopwords or word inflection
+    have the same canonical form.
+
+    Args:
+        query (str): Research query.
+
+    Returns:
+        str: Space-separated canonical tokens.
+    """
+    return " ".join(query_tokens(query))
+
+
+def _shingles(tokens: List[str], ngram: int) -> Set[int]:
+    """
+    Hash the ordered word n-grams of a query, with start and end markers.
+
+    Unlike a bag of words, the set depends on word order and on every word, so
+    "Why does smoking cause cancer" and "How does smoking cause cancer", or the
+    same words in another order, share few shingles.
+    """
+    bounded = ["\x02"] + tokens + ["\x03"]
+    size = min(ngram, len(bounded))
+    grams = {"\x1f".join(bounded[i:i + size]) for i in range(len(bounded) - size + 1)}
+    return {int.from_bytes(hashlib.blake2b(gram.encode("utf-8"), digest_size=8).digest(), "big")
+            for gram in grams}
+
+
+class NearDuplicateIndex:
+    """
+    Finds previously seen queries similar to a new one.
+
+    Each query is reduced to the set of ordered n-grams of its canonical tokens
+    and summarized by a MinHash signature of `num_perm` values. The signature is
+    split into `bands` bands; queries sharing any band land in the same bucket and
+    become candidates, whose similarity is then estimated from the full signatures.
+    Lookups therefore cost one signature computation plus a few comparisons, not a
+    scan of every stored query.
+
+    The index keeps the `capacity` most recently added queries.
+
+    Example:
+        index = NearDuplicateIndex(threshold=0.7)
+        index.add("key-1", "Impact of rising ocean temperatures on coral reef ecosystems in the Pacific")
+        index.find("Impact of rising ocean temperatures on coral reef ecosystems across the Pacific")
+        # -> ("key-1", 0.77)
+    """
+
+    def __init__(self, threshold: float = 0.8, num_perm: int = 64, bands: int = 16,
+                 capacity: int = 10000, ngram: int = 2, seed: int = 1):
+        """
+        Args:
+            threshold (float): Minimum estimated Jaccard similarity of a match.
+            num_perm (int): MinHash signature length.
+            bands (int): LSH bands; must divide `num_perm`. More bands find more
+                candidates at lower similarity.
+            capacity (int): Maximum queries kept; the oldest are dropped first.
+            ngram (int): Number of consecutive words per shingle.
+            seed (int): Seed of the hash family, fixed so signatures are reproducible.
+
+        Raises:
+            ValueError: If the parameters are inconsistent.
+        """
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError("threshold must be in (0, 1]")
+        if num_perm < 1 or bands < 1 or num_perm % bands:
+            raise ValueError("bands must divide num_perm")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.capacity = capacity
+        self.ngram = ngram
+        rng = random.Random(seed)
+        self._params = [(rng.randrange(1, _PRIME), rng.randrange(0, _PRIME)) for _ in range(num_perm)]
+        self._signatures: "OrderedDict[str, Tuple[int, ...]]" = OrderedDict()
+        self._buckets: List[Dict[Tuple[int, ...], Set[str]]] = [{} for _ in range(bands)]
+        self._lock = threading.Lock()
+
+    def signature(self, query: str) -> Tuple[int, ...]:
+        """Return the MinHash signature of a query."""
+        shingles = _shingles(query_tokens(query), self.ngram)
+        if not shingles:
+            return (_PRIME,) * self.num_perm
+        return tuple(min((a * x + b) % _PRIME for x in shingles) for a, b in self._params)
+
+    def _bands(self, signature: Tuple[int, ...]):
+        rows = self.rows
+        for band in range(self.bands):
+            yield band, signature[band * rows:(band + 1) * rows]
+
+    def add(self, key: str, query: str) -> None:
+        """
+        Remember a query under a key (typically its cache key).
+
+        Args:
+            key (str): Identifier returned by `find` for matching queries.
+            query (str): The query text.
+        """
+        signature = self.signature(query)
+        with self._lock:
+            self._remove(key)
+            self._signatures[key] = signature
+            for band, values in self._bands(signature):
+                self._buckets[band].setdefault(values, set()).add(key)
+            while len(self._signatures) > self.capacity:
+                self._remove(next(iter(self._signatures)))
+
+    def _remove(self, key: str) -> None:
+        # Caller holds self._lock.
+        signature = self._signatures.pop(key, None)
+        if signature is None:
+            return
+        for band, values in self._bands(signature):
+            bucket = self._buckets[band].get(values)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band][values]
+
+    def discard(self, key: str) -> None:
+        """Forget a key, e.g. after its cached result expired."""
+        with self._lock:
+            self._remove(key)
+
+    def find(self, query: str) -> Optional[Tuple[str, float]]:
+        """
+        Return the most similar remembered query.
+
+        Args:
+            query (str): The new query.
+
+        Returns:
+            tuple: `(key, similarity)` of the best match with an estimated Jaccard
+            similarity of at least `threshold`, or None.
+        """
+        signature = self.signature(query)
+        best: Optional[Tuple[str, float]] = None
+        with self._lock:
+            candidates: Set[str] = set()
+            for band, values in self._bands(signature):
+                candidates.update(self._buckets[band].get(values, ()))
+            for key in candidates:
+                other = self._signatures[key]
+                similarity = sum(1 for x, y in zip(signature, other) if x == y) / self.num_perm
+                if similarity >= self.threshold and (best is None or similarity > best[1]):
+                    best = (key, similarity)
+        return best
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._signatures
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __repr__(self) -> str:
+        return f"NearDuplicateIndex(queries={len(self)}, threshold={self.threshold})"
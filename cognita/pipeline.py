@@ -0,0 +1,365 @@
+"""
+Post-processing Pipeline Module for Cognita SDK
+
+This module runs user-registered post-processing stages (extraction, scoring,
+enrichment, ...) on the summarized results of a query. Stages declare the inputs
+they depend on, so stages that do not depend on each other run at the same time
+instead of one after the other in the caller.
+
+Features:
+- `Stage`: a named function with its dependencies and an execution kind:
+  - "cpu": runs on a shared thread pool (a stage that is the only one ready runs
+    in the calling thread);
+  - "process": runs on a process pool, for pure-Python work that holds the GIL;
+    the function, its inputs and its output must be picklable;
+  - "io": a coroutine function awaited on the event loop (a plain function runs
+    on the thread pool). Synchronous runs await it on a worker thread.
+- `Pipeline`: registry and dependency-driven scheduler of stages, with a
+  synchronous `run` and an asyncio `arun`.
+- Memoization: stage outputs are kept per query and its results, so a cached or
+  unchanged result is not post-processed again.
+- Per-stage timings on the active request trace (as "pipeline.<name>") and as
+  aggregate counters in `Pipeline.stats()`.
+
+Stage functions receive one positional argument per dependency, in the order
+they are listed in `requires`. Besides other stages, they can depend on the
+pipeline inputs `"query"` (the validated query) and `"results"` (the summarized
+results).
+"""
+
+import asyncio
+import contextvars
+import hashlib
+import inspect
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+from .cache import MemoryCache
+from .deadline import current_deadline
+from .errors import DeadlineExceededError, ProcessingError
+from .instrumentation import record_stage
+from .serialization import JSONSerializer, get_serializer
+
+PIPELINE_INPUTS = ("query", "results")
+STAGE_KINDS = ("cpu", "process", "io")
+
+
+def _timed(func: Callable[..., Any], args: Tuple[Any, ...]) -> Tuple[Any, float]:
+    """Call `func(*args)` and return its output with the seconds it took."""
+    start = time.perf_counter()
+    output = func(*args)
+    if inspect.isawaitable(output):
+        output = asyncio.run(_wait_for(output))
+    return output, time.perf_counter() - start
+
+
+async def _wait_for(awaitable: Any) -> Any:
+    return await awaitable
+
+
+async def _atimed(func: Callable[..., Any], args: Tuple[Any, ...]) -> Tuple[Any, float]:
+    """Await `func(*args)` and return its output with the seconds it took."""
+    start = time.perf_counter()
+    output = await func(*args)
+    return output, time.perf_counter() - start
+
+
+class Stage:
+    """
+    One post-processing step.
+
+    Attributes:
+        name (str): Name of the stage; its output is available under this name.
+        func (callable): Function computing the output from the dependencies.
+        requires (tuple): Names of the pipeline inputs and stages it depends on.
+        kind (str): "cpu", "process" or "io".
+        memoize (bool): Whether the output may be reused for the same query and results.
+    """
+
+    __slots__ = ("name", "func", "requires", "kind", "memoize")
+
+    def __init__(self, name: str, func: Callable[..., Any], requires: Sequence[str] = ("results",),
+                 kind: str = "cpu", memoize: bool = True):
+        self.name = name
+        self.func = func
+        self.requires = tuple(requires)
+        self.kind = kind
+        self.memoize = memoize
+
+    def __repr__(self) -> str:
+        return f"Stage({self.name!r}, requires={self.requires!r}, kind={self.kind!r})"
+
+
+class Pipeline:
+    """
+    Runs registered stages as soon as their dependencies are available.
+
+    A stage can only depend on pipeline inputs and stages registered before it, so
+    registration order is a valid execution order and cycles cannot occur.
+
+    Usage:
+        pipeline = Pipeline()
+        pipeline.add_stage("keywords", extract_keywords)
+        pipeline.add_stage("score", score_sources, requires=("results", "keywords"))
+        outputs = pipeline.run({"query": query, "results": results})
+
+    Executors are created on first use and shut down by `close`.
+    """
+
+    def __init__(self, workers: int = 4, processes: int = 0, memo_size: int = 1024,
+                 serializer: Optional[JSONSerializer] = None):
+        """
+        Args:
+            workers (int): Threads running "cpu" stages and plain "io" functions.
+            processes (int): Worker processes for "process" stages; 0 uses the
+                number of CPUs.
+            memo_size (int): Queries whose stage outputs are memoized; 0 disables
+                memoization.
+            serializer (JSONSerializer, optional): Serializer used to fingerprint the
+                pipeline inputs for memoization. Defaults to the standard library.
+        """
+        self.stages: Dict[str, Stage] = {}
+        self.workers = max(1, workers)
+        self.processes = processes
+        self.memo = MemoryCache(max_entries=memo_size) if memo_size > 0 else None
+        self.serializer = serializer or JSONSerializer()
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._threads: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config) -> "Pipeline":
+        """Build a pipeline from the `PIPELINE_*` and `JSON_BACKEND` settings."""
+        return cls(
+            workers=getattr(config, "PIPELINE_WORKERS", 4),
+            processes=getattr(config, "PIPELINE_PROCESSES", 0),
+            memo_size=getattr(config, "PIPELINE_MEMO_SIZE", 1024),
+            serializer=get_serializer(getattr(config, "JSON_BACKEND", "auto")),
+        )
+
+    def add_stage(self, name: str, func: Callable[..., Any], requires: Sequence[str] = ("results",),
+                  kind: str = "cpu", memoize: bool = True) -> Stage:
+        """
+        Register a stage.
+
+        Args:
+            name (str): Name of the stage's output.
+            func (callable): Function called with one argument per dependency. For
+                "io" stages it may be a coroutine function.
+            requires (sequence): Pipeline inputs ("query", "results") and names of
+                previously registered stages.
+            kind (str): "cpu", "process" or "io".
+            memoize (bool): Reuse the output for the same query and results. Stages
+                with side effects or time-dependent outputs should pass False.
+
+        Returns:
+            Stage: The registered stage.
+
+        Raises:
+            ValueError: If the name is taken, a dependency is unknown or the kind
+                is not supported.
+        """
+        if name in self.stages or name in PIPELINE_INPUTS:
+            raise ValueError(f"pipeline stage {name!r} already exists")
+        if kind not in STAGE_KINDS:
+            raise ValueError(f"unknown stage kind: {kind}")
+        unknown = [dep for dep in requires if dep not in self.stages and dep not in PIPELINE_INPUTS]
+        if unknown:
+            raise ValueError(f"stage {name!r} depends on unknown stages: {', '.join(unknown)}")
+        stage = Stage(name, func, requires, kind, memoize)
+        with self._lock:
+            self.stages[name] = stage
+            self._stats[name] = {"runs": 0, "memo_hits": 0, "errors": 0, "seconds": 0.0, "last": None}
+        return stage
+
+    def run(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run every stage on `inputs`, in parallel where dependencies allow.
+
+        Args:
+            inputs (dict): Values of the pipeline inputs ("query", "results").
+
+        Returns:
+            dict: Output of every stage, keyed by stage name.
+
+        Raises:
+            DeadlineExceededError: If the active deadline passes while stages run.
+            ProcessingError: If a stage raises; the original exception is chained.
+        """
+        memo_key, values, reused = self._plan(inputs)
+        pending = [stage for stage in self.stages.values() if stage.name not in values]
+        running: Dict[Future, Stage] = {}
+        deadline = current_deadline()
+        try:
+            while pending or running:
+                ready = [stage for stage in pending if all(dep in values for dep in stage.requires)]
+                for stage in ready:
+                    pending.remove(stage)
+                    self._check_deadline(deadline, stage.name)
+                    args = tuple(values[dep] for dep in stage.requires)
+                    if stage.kind == "cpu" and len(ready) == 1 and not running:
+                        # Nothing else can run meanwhile, so skip the thread hand-off.
+                        values[stage.name] = self._finish(stage, self._inline(stage, args))
+                        break
+                    running[self._submit(stage, args)] = stage
+                if not running:
+                    continue
+                done, _ = wait(running, timeout=deadline.remaining() if deadline else None,
+                               return_when=FIRST_COMPLETED)
+                if not done:
+                    raise DeadlineExceededError(f"stage {next(iter(running.values())).name}",
+                                                deadline.total)
+                for future in done:
+                    stage = running.pop(future)
+                    values[stage.name] = self._finish(stage, future)
+        finally:
+            for future in running:
+                future.cancel()
+        return self._outputs(memo_key, values, reused)
+
+    async def arun(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Asyncio counterpart of `run`: "io" coroutines are awaited on the running
+        loop and the other stages run on the executors without blocking it.
+        """
+        memo_key, values, reused = self._plan(inputs)
+        pending = [stage for stage in self.stages.values() if stage.name not in values]
+        running: Dict[asyncio.Future, Stage] = {}
+        deadline = current_deadline()
+        loop = asyncio.get_running_loop()
+        try:
+            while pending or running:
+                for stage in [stage for stage in pending if all(dep in values for dep in stage.requires)]:
+                    pending.remove(stage)
+                    self._check_deadline(deadline, stage.name)
+                    args = tuple(values[dep] for dep in stage.requires)
+                    if stage.kind == "io" and inspect.iscoroutinefunction(stage.func):
+                        future = asyncio.ensure_future(_atimed(stage.func, args))
+                    else:
+                        future = asyncio.wrap_future(self._submit(stage, args), loop=loop)
+                    running[future] = stage
+                done, _ = await asyncio.wait(running, timeout=deadline.remaining() if deadline else None,
+                                             return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    raise DeadlineExceededError(f"stage {next(iter(running.values())).name}",
+                                                deadline.total)
+                for future in done:
+                    stage = running.pop(future)
+                    values[stage.name] = self._finish(stage, future)
+        finally:
+            for future in running:
+                future.cancel()
+        return self._outputs(memo_key, values, reused)
+
+    def _plan(self, inputs: Dict[str, Any]) -> Tuple[Optional[str], Dict[str, Any], Dict[str, Any]]:
+        """
+        Look up memoized outputs for `inputs`.
+
+        Returns:
+            tuple: `(memo_key, values, reused)`: the memo key (None when the inputs
+            cannot be fingerprinted or memoization is off), the inputs plus reusable
+            outputs, and the reused outputs alone.
+        """
+        values = dict(inputs)
+        reused: Dict[str, Any] = {}
+        memo_key = self._memo_key(inputs)
+        memoized = self.memo.get(memo_key) if memo_key is not None else None
+        if memoized:
+            for stage in self.stages.values():
+                # An output is only reusable if everything it was computed from is too.
+                if (stage.memoize and stage.name in memoized
+                        and all(dep in values for dep in stage.requires)):
+                    values[stage.name] = reused[stage.name] = memoized[stage.name]
+            with self._lock:
+                for name in reused:
+                    self._stats[name]["memo_hits"] += 1
+        return memo_key, values, reused
+
+    def _memo_key(self, inputs: Dict[str, Any]) -> Optional[str]:
+        if self.memo is None or not any(stage.memoize for stage in self.stages.values()):
+            return None
+        try:
+            material = self.serializer.dumps([[name, inputs[name]] for name in sorted(inputs)])
+        except (TypeError, ValueError):
+            return None
+        return hashlib.blake2b(material, digest_size=16).hexdigest()
+
+    def _outputs(self, memo_key: Optional[str], values: Dict[str, Any],
+                 reused: Dict[str, Any]) -> Dict[str, Any]:
+        outputs = {name: values[name] for name in self.stages}
+        if memo_key is not None and len(reused) < len(outputs):
+            self.memo.set(memo_key, {name: output for name, output in outputs.items()
+                                     if self.stages[name].memoize})
+        return outputs
+
+    def _submit(self, stage: Stage, args: Tuple[Any, ...]) -> Future:
+        if stage.kind == "process":
+            return self._get_process_pool().submit(_timed, stage.func, args)
+        # Copy the context so stages see the caller's deadline and request trace.
+        context = contextvars.copy_context()
+        return self._get_threads().submit(context.run, _timed, stage.func, args)
+
+    def _inline(self, stage: Stage, args: Tuple[Any, ...]) -> Future:
+        future: Future = Future()
+        try:
+            future.set_result(_timed(stage.func, args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def _finish(self, stage: Stage, future: Any) -> Any:
+        """Record the outcome of a stage and return its output."""
+        try:
+            output, seconds = future.result()
+        except Exception as e:
+            with self._lock:
+                self._stats[stage.name]["errors"] += 1
+            raise ProcessingError(f"Pipeline stage {stage.name!r} failed: {e}") from e
+        record_stage(f"pipeline.{stage.name}", seconds)
+        with self._lock:
+            stats = self._stats[stage.name]
+            stats["runs"] += 1
+            stats["seconds"] += seconds
+            stats["last"] = seconds
+        return output
+
+    @staticmethod
+    def _check_deadline(deadline, name: str) -> None:
+        if deadline is not None:
+            deadline.check(f"stage {name}")
+
+    def _get_threads(self) -> Executor:
+        with self._lock:
+            if self._threads is None:
+                self._threads = ThreadPoolExecutor(max_workers=self.workers,
+                                                   thread_name_prefix="cognita-pipeline")
+            return self._threads
+
+    def _get_process_pool(self) -> Executor:
+        with self._lock:
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(max_workers=self.processes or None)
+            return self._process_pool
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return per-stage counters: `runs`, `memo_hits`, `errors`, total `seconds`
+        and the duration of the `last` run.
+        """
+        with self._lock:
+            return {name: dict(stats) for name, stats in self._stats.items()}
+
+    def close(self) -> None:
+        """Shut down the executors; running stages are allowed to finish."""
+        with self._lock:
+            threads, processes = self._threads, self._process_pool
+            self._threads = self._process_pool = None
+        if threads is not None:
+            threads.shutdown(wait=True)
+        if processes is not None:
+            processes.shutdown(wait=True)
+
+    def __repr__(self) -> str:
+        return f"Pipeline(stages={list(self.stages)!r})"
@@ -0,0 +1,354 @@
+"""
+Rate Limiting Module for Cognita SDK
+
+This module keeps API traffic within the provider's quota. A token bucket limits the
+request rate and a concurrency limiter caps the number of requests in flight. Both
+can be shared by every client in a process, and the file-backed bucket coordinates
+several processes on one host.
+
+Features:
+- `TokenBucket`: thread-safe in-process token bucket (requests/second plus burst).
+- `FileTokenBucket`: token bucket whose state lives in a lock-protected file, so
+  worker processes on the same host draw from one shared quota.
+- `ConcurrencyLimiter`: bounded number of simultaneous requests, shared by threads
+  and coroutines; free slots are handed to waiters in arrival order.
+- `shared_limiters`: per-process registry so agents with the same settings share limits.
+"""
+
+import asyncio
+import os
+import struct
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+from .errors import ConfigError
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill continuously at `rate` per second up to `burst`. Each request takes
+    one token; when the bucket is empty the caller is told how long to wait and the
+    token is reserved, so waiting callers are served in arrival order.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        """
+        Args:
+            rate (float): Sustained requests per second.
+            burst (float, optional): Bucket capacity. Defaults to `max(rate, 1)`.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.burst = float(burst) if burst else max(self.rate, 1.0)
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Take `tokens` from the bucket, going into debt if necessary.
+
+        Returns:
+            float: Seconds the caller must wait before using the reservation.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            return max(-self._tokens / self.rate, 0.0)
+
+    def refund(self, tokens: float = 1.0) -> None:
+        """Return tokens taken by an abandoned reservation."""
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + tokens)
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until a token is available.
+
+        Args:
+            timeout (float, optional): Maximum seconds to wait.
+
+        Returns:
+            bool: True once a token was acquired, False if it would take longer than `timeout`.
+        """
+        wait = self.reserve()
+        if timeout is not None and wait > timeout:
+            self.refund()
+            return False
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
+    async def acquire_async(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for a token without blocking the event loop.
+
+        The reservation is refunded if the wait would exceed `timeout` or the
+        waiting task is cancelled, so abandoned waits leave the bucket as it was.
+
+        Args:
+            timeout (float, optional): Maximum seconds to wait.
+
+        Returns:
+            bool: True once a token was acquired, False if it would take longer than `timeout`.
+        """
+        wait = self.reserve()
+        if timeout is not None and wait > timeout:
+            self.refund()
+            return False
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self.refund()
+                raise
+        return True
+
+
+class FileTokenBucket(TokenBucket):
+    """
+    Token bucket shared between processes through a small state file.
+
+    The bucket state (tokens and last update time) is stored in `path` and every
+    update happens under an exclusive `flock`, so all processes using the same path
+    draw from one quota. Wall-clock time is used because monotonic clocks are not
+    comparable across processes. Only available on POSIX systems.
+    """
+
+    _STATE = struct.Struct("<dd")
+
+    def __init__(self, path: str, rate: float, burst: Optional[float] = None):
+        """
+        Args:
+            path (str): State file shared by the cooperating processes.
+            rate (float): Sustained requests per second across all processes.
+            burst (float, optional): Bucket capacity. Defaults to `max(rate, 1)`.
+
+        Raises:
+            ConfigError: If file locking is not supported on this platform.
+        """
+        super().__init__(rate, burst)
+        try:
+            import fcntl
+        except ImportError as e:
+            raise ConfigError("FileTokenBucket requires fcntl (POSIX only)") from e
+        self._fcntl = fcntl
+        self.path = path
+
+    def _update(self, delta: float) -> float:
+        # A fresh descriptor per update: flock locks belong to the open file
+        # description, which forked processes would otherwise share.
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            self._fcntl.flock(fd, self._fcntl.LOCK_EX)
+            now = time.time()
+            data = os.pread(fd, self._STATE.size, 0)
+            if len(data) == self._STATE.size:
+                tokens, updated = self._STATE.unpack(data)
+                tokens = min(self.burst, tokens + max(now - updated, 0.0) * self.rate)
+            else:
+                tokens = self.burst
+            tokens = min(self.burst, tokens + delta)
+            os.pwrite(fd, self._STATE.pack(tokens, now), 0)
+            return tokens
+        finally:
+            os.close(fd)
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        with self._lock:
+            remaining = self._update(-tokens)
+        return max(-remaining / self.rate, 0.0)
+
+    def refund(self, tokens: float = 1.0) -> None:
+        with self._lock:
+            self._update(tokens)
+
+
+class _Waiter:
+    """A thread (`event`) or coroutine (`loop` and `future`) waiting for a slot."""
+
+    __slots__ = ("granted", "event", "loop", "future")
+
+    def __init__(self, event: Optional[threading.Event] = None,
+                 loop: Optional[asyncio.AbstractEventLoop] = None,
+                 future: Optional[asyncio.Future] = None):
+        self.granted = False
+        self.event = event
+        self.loop = loop
+        self.future = future
+
+    def grant(self) -> bool:
+        """Hand a slot to the waiter; False if its event loop is gone."""
+        self.granted = True
+        if self.event is not None:
+            self.event.set()
+            return True
+        try:
+            self.loop.call_soon_threadsafe(_wake, self.future)
+        except RuntimeError:
+            self.granted = False
+            return False
+        return True
+
+
+def _wake(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class ConcurrencyLimiter:
+    """
+    Cap on the number of requests in flight.
+
+    Use as a context manager around a request (`with limiter:`), or with
+    `async with limiter:` from coroutines. Threads and coroutines (on any event
+    loop) wait in one queue; `release` hands the slot straight to the oldest
+    waiter, so nobody polls.
+    """
+
+    def __init__(self, max_concurrent: int):
+        """
+        Args:
+            max_concurrent (int): Maximum simultaneous requests.
+        """
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+        self.max_concurrent = max_concurrent
+        self._lock = threading.Lock()
+        self._available = max_concurrent
+        self._waiters: Deque[_Waiter] = deque()
+        self.in_flight = 0
+
+    def _try_acquire(self) -> bool:
+        # Caller holds self._lock. Queued waiters go first.
+        if self._available and not self._waiters:
+            self._available -= 1
+            self.in_flight += 1
+            return True
+        return False
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Block until a slot is free; returns False if `timeout` elapses first."""
+        with self._lock:
+            if self._try_acquire():
+                return True
+            if timeout is not None and timeout <= 0:
+                return False
+            waiter = _Waiter(event=threading.Event())
+            self._waiters.append(waiter)
+        waiter.event.wait(timeout)
+        with self._lock:
+            if waiter.granted:
+                return True
+            self._waiters.remove(waiter)
+            return False
+
+    def release(self) -> None:
+        """
+        Free a slot taken by `acquire`.
+
+        Raises:
+            ValueError: If no slot is taken.
+        """
+        with self._lock:
+            if self.in_flight <= 0:
+                raise ValueError("release() without a matching acquire()")
+            self._release()
+
+    def _release(self) -> None:
+        # Caller holds self._lock. The slot stays in flight when a waiter takes it.
+        while self._waiters:
+            if self._waiters.popleft().grant():
+                return
+        self._available += 1
+        self.in_flight -= 1
+
+    async def acquire_async(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for a free slot without blocking the event loop.
+
+        Args:
+            timeout (float, optional): Maximum seconds to wait.
+
+        Returns:
+            bool: True once a slot was taken, False if `timeout` elapsed first.
+        """
+        with self._lock:
+            if self._try_acquire():
+                return True
+            if timeout is not None and timeout <= 0:
+                return False
+            loop = asyncio.get_running_loop()
+            waiter = _Waiter(loop=loop, future=loop.create_future())
+            self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter.future, timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            with self._lock:
+                if waiter.granted:
+                    # Granted just as the wait ended: pass the slot on.
+                    self._release()
+                else:
+                    self._waiters.remove(waiter)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            return False
+        return True
+
+    def __enter__(self) -> "ConcurrencyLimiter":
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.release()
+
+    async def __aenter__(self) -> "ConcurrencyLimiter":
+        await self.acquire_async()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        self.release()
+
+
+_registry: Dict[Tuple, Tuple[Optional[TokenBucket], Optional[ConcurrencyLimiter]]] = {}
+_registry_lock = threading.Lock()
+
+
+def shared_limiters(config) -> Tuple[Optional[TokenBucket], Optional[ConcurrencyLimiter]]:
+    """
+    Return the process-wide limiters for the configured API settings.
+
+    Clients created from configurations with the same base URL and limits share the
+    same limiter instances, so several agents in one process stay within a single
+    quota. Uses `API_RATE_LIMIT`, `API_RATE_BURST`, `API_RATE_LIMIT_FILE` and
+    `API_MAX_CONCURRENT_REQUESTS`; a value of 0 disables the corresponding limiter.
+
+    Args:
+        config (Config): Configuration object.
+
+    Returns:
+        tuple: `(rate_limiter, concurrency_limiter)`, either of which may be None.
+    """
+    rate = getattr(config, "API_RATE_LIMIT", 0) or 0
+    burst = getattr(config, "API_RATE_BURST", 0) or None
+    path = getattr(config, "API_RATE_LIMIT_FILE", "") or ""
+    max_concurrent = getattr(config, "API_MAX_CONCURRENT_REQUESTS", 0) or 0
+    key = (config.API_BASE_URL, rate, burst, path, max_concurrent)
+    with _registry_lock:
+        limiters = _registry.get(key)
+        if limiters is None:
+            if rate and path:
+                rate_limiter = FileTokenBucket(path, rate, burst)
+            elif rate:
+                rate_limiter = TokenBucket(rate, burst)
+            else:
+                rate_limiter = None
+            concurrency_limiter = ConcurrencyLimiter(max_concurrent) if max_concurrent else None
+            limiters = _registry[key] = (rate_limiter, concurrency_limiter)
+        return limiters
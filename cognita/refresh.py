@@ -0,0 +1,229 @@
+"""
+Incremental Refresh Module for Cognita SDK
+
+Standing queries that are re-run on a schedule mostly get back the result they
+already have. This module keeps, per query, the validators of the last response
+(ETag, Last-Modified and a hash of the body) next to the raw response itself, so
+the next fetch can be conditional and only what changed has to be transferred
+and parsed.
+
+Features:
+- `RefreshState`: validators and last raw response of one query, convertible to a
+  plain dictionary so any `ResultCache` can hold it.
+- `conditional_request(state)`: the `If-None-Match` / `If-Modified-Since` headers
+  and the `since` payload field of a refresh request.
+- `apply_response(...)`: turns the API's answer into the next state:
+  - "304 Not Modified" reuses the stored response;
+  - a delta body (`"delta": true`) is merged into it;
+  - a full body whose hash matches the stored one is not parsed again.
+- `merge_delta`: merges new, changed and removed sources into a previous response,
+  matching sources by `cognita.aggregation.source_fingerprint`.
+- `create_state_store(config)`: in-memory or SQLite storage for the states.
+
+A delta body carries only the new or changed sources, the sources to drop under
+`removed` (as URLs, DOIs or source objects), and any top-level fields (summary,
+confidence) that changed:
+
+    {"delta": true, "sources": [...], "removed": ["https://...", ...], "summary": "..."}
+"""
+
+import hashlib
+import time
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+from .aggregation import source_fingerprint
+from .cache import MemoryCache, ResultCache, SQLiteCache
+from .errors import APIError
+from .instrumentation import stage
+
+REFRESH_OUTCOMES = ("full", "delta", "unchanged")
+
+# Delta bookkeeping fields that are not part of the merged response.
+_DELTA_FIELDS = ("delta", "sources", "removed")
+
+
+def content_hash(body: bytes) -> str:
+    """Return a short hash identifying a response body."""
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+class RefreshState:
+    """
+    What is known about the last response for one query.
+
+    Attributes:
+        etag (str): `ETag` header of the last response, or None.
+        last_modified (str): `Last-Modified` header of the last response, or None.
+        content_hash (str): Hash of the last full response body, or None after a delta.
+        fetched_at (float): `time.time()` of the last fetch.
+        response (dict): The raw response, with every delta merged in.
+        outcome (str): How the last fetch went: "full", "delta" or "unchanged".
+    """
+
+    __slots__ = ("etag", "last_modified", "content_hash", "fetched_at", "response", "outcome")
+
+    def __init__(self, response: Dict[str, Any], etag: Optional[str] = None,
+                 last_modified: Optional[str] = None, content_hash: Optional[str] = None,
+                 fetched_at: Optional[float] = None, outcome: str = "full"):
+        self.response = response
+        self.etag = etag
+        self.last_modified = last_modified
+        self.content_hash = content_hash
+        self.fetched_at = fetched_at if fetched_at is not None else time.time()
+        self.outcome = outcome
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the state as a JSON-serializable dictionary."""
+        return {
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "content_hash": self.content_hash,
+            "fetched_at": self.fetched_at,
+            "response": self.response,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "RefreshState":
+        """Rebuild a state stored with `to_dict`."""
+        return cls(data["response"], data.get("etag"), data.get("last_modified"),
+                   data.get("content_hash"), data.get("fetched_at"), outcome="full")
+
+    def __repr__(self) -> str:
+        return (f"RefreshState(outcome={self.outcome!r}, etag={self.etag!r}, "
+                f"sources={len(self.response.get('sources') or [])})")
+
+
+def conditional_request(state: Optional[RefreshState]) -> Tuple[Dict[str, str], Dict[str, Any]]:
+    """
+    Return the extra headers and payload fields of a refresh request.
+
+    Args:
+        state (RefreshState, optional): State of the previous fetch; None for a first fetch.
+
+    Returns:
+        tuple: `(headers, fields)`. `fields` holds `since`, the previous fetch time as
+        an ISO 8601 UTC timestamp, for servers that answer with a delta.
+    """
+    if state is None:
+        return {}, {}
+    headers = {}
+    if state.etag:
+        headers["If-None-Match"] = state.etag
+    if state.last_modified:
+        headers["If-Modified-Since"] = state.last_modified
+    since = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(state.fetched_at))
+    return headers, {"since": since}
+
+
+def merge_delta(previous: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Merge a delta response into a previous raw response.
+
+    Sources of the delta replace the previous source with the same fingerprint or
+    are appended; sources listed under `removed` are dropped. Other top-level fields
+    of the delta overwrite the previous ones.
+
+    Args:
+        previous (dict): Previous raw response.
+        delta (dict): Delta response.
+
+    Returns:
+        dict: A new merged response; `previous` is not modified.
+    """
+    merged = {key: value for key, value in previous.items() if key != "sources"}
+    merged.update((key, value) for key, value in delta.items() if key not in _DELTA_FIELDS)
+
+    removed = {_removed_fingerprint(source) for source in delta.get("removed") or []}
+    changed: Dict[Any, Any] = {}
+    added: List[Any] = []
+    for source in delta.get("sources") or []:
+        fingerprint = source_fingerprint(source)
+        if fingerprint is None:
+            added.append(source)
+        else:
+            changed[fingerprint] = source
+
+    sources = []
+    for source in previous.get("sources") or []:
+        fingerprint = source_fingerprint(source)
+        if fingerprint in removed:
+            continue
+        sources.append(changed.pop(fingerprint, source) if fingerprint is not None else source)
+    sources.extend(changed.values())
+    sources.extend(added)
+    merged["sources"] = sources
+    return merged
+
+
+def _removed_fingerprint(source: Any) -> Optional[int]:
+    """Fingerprint an entry of `removed`; bare strings are DOIs or URLs, not titles."""
+    if isinstance(source, str):
+        key = source.strip()
+        if key.lower().startswith(("10.", "doi:")) or "doi.org/" in key.lower():
+            return source_fingerprint({"doi": key})
+        return source_fingerprint({"url": key})
+    return source_fingerprint(source)
+
+
+def apply_response(previous: Optional[RefreshState], status: int, headers: Mapping[str, str],
+                   body: bytes, loads: Callable[[bytes], Any]) -> RefreshState:
+    """
+    Build the state following a refresh request.
+
+    Args:
+        previous (RefreshState, optional): State the request was made with.
+        status (int): HTTP status of the response.
+        headers (mapping): Response headers (case-insensitive lookup).
+        body (bytes): Raw response body.
+        loads (callable): JSON decoder for `body`.
+
+    Returns:
+        RefreshState: The new state, with `outcome` telling whether the body was a
+        full response, a delta, or unchanged.
+
+    Raises:
+        APIError: If the server answered "not modified" or with a delta although no
+            previous response is known.
+        ValueError: If the body is not valid JSON.
+    """
+    etag = headers.get("ETag")
+    last_modified = headers.get("Last-Modified")
+    if status == 304:
+        if previous is None:
+            raise APIError("304 Not Modified for a query without a stored response")
+        return RefreshState(previous.response, etag or previous.etag,
+                            last_modified or previous.last_modified, previous.content_hash,
+                            outcome="unchanged")
+    digest = content_hash(body)
+    if previous is not None and digest == previous.content_hash:
+        return RefreshState(previous.response, etag, last_modified, digest, outcome="unchanged")
+    with stage("parse"):
+        response = loads(body)
+    if isinstance(response, dict) and response.get("delta"):
+        if previous is None:
+            raise APIError("Delta response for a query without a stored response")
+        return RefreshState(merge_delta(previous.response, response), etag, last_modified,
+                            None, outcome="delta")
+    return RefreshState(response, etag, last_modified, digest, outcome="full")
+
+
+def create_state_store(config) -> ResultCache:
+    """
+    Build the storage for refresh states.
+
+    States never expire: a scheduled query typically comes back after its cached
+    result has expired, which is exactly when its state is needed.
+
+    Uses `REFRESH_STATE_PATH` (a SQLite file; empty keeps states in memory) and
+    `REFRESH_MAX_STATES`.
+
+    Args:
+        config (Config): Configuration object.
+
+    Returns:
+        ResultCache: Store mapping cache keys to `RefreshState.to_dict()` values.
+    """
+    max_entries = getattr(config, "REFRESH_MAX_STATES", 1024)
+    path = getattr(config, "REFRESH_STATE_PATH", "")
+    if path:
+        return SQLiteCache(path, max_entries=max_entries)
+    return MemoryCache(max_entries=max_entries)
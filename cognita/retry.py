@@ -0,0 +1,225 @@
+"""
+Retry and Circuit Breaker Module for Cognita SDK
+
+This module decides when a failed Deep Research API call should be retried and
+guards each endpoint with a circuit breaker, so callers fail fast while the upstream
+service is unhealthy instead of piling on more requests.
+
+Features:
+- `RetryPolicy`: capped exponential backoff with full jitter, `Retry-After` support
+  and an overall retry deadline.
+- Classification of transient failures (timeouts, connection errors, 408/425/429/5xx)
+  versus permanent ones (other 4xx responses).
+- `CircuitBreaker`: closed / open / half-open breaker with state exposed for monitoring.
+"""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+# Status codes worth retrying: the request may succeed if sent again later.
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a `Retry-After` header value.
+
+    Args:
+        value (str): Header value, either delay-seconds or an HTTP date.
+
+    Returns:
+        float: Seconds to wait, or None if the header is missing or malformed.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if retry_at is None:
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+class RetryPolicy:
+    """
+    Retry policy for API calls.
+
+    Attributes:
+        max_attempts (int): Total attempts per call, including the first one.
+        backoff_base (float): Delay in seconds before the first retry.
+        backoff_cap (float): Upper bound for a single delay.
+        jitter (bool): Randomize delays ("full jitter") to avoid synchronized retries.
+        respect_retry_after (bool): Wait at least as long as the server's `Retry-After`.
+        deadline (float): Overall seconds allowed for all attempts, or None for no limit.
+    """
+
+    def __init__(self, max_attempts: int = 3, backoff_base: float = 0.5, backoff_cap: float = 30.0,
+                 jitter: bool = True, respect_retry_after: bool = True,
+                 deadline: Optional[float] = None):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.jitter = jitter
+        self.respect_retry_after = respect_retry_after
+        self.deadline = deadline
+
+    @classmethod
+    def from_config(cls, config) -> "RetryPolicy":
+        """Build a policy from the `API_RETRY_*` configuration settings."""
+        return cls(
+            max_attempts=getattr(config, "API_RETRY_MAX_ATTEMPTS", 3),
+            backoff_base=getattr(config, "API_RETRY_BACKOFF_BASE", 0.5),
+            backoff_cap=getattr(config, "API_RETRY_BACKOFF_CAP", 30.0),
+            jitter=getattr(config, "API_RETRY_JITTER", True),
+            respect_retry_after=getattr(config, "API_RETRY_RESPECT_RETRY_AFTER", True),
+            deadline=getattr(config, "API_RETRY_DEADLINE", None) or None,
+        )
+
+    @staticmethod
+    def is_retryable_status(status_code: int) -> bool:
+        """Whether an HTTP status code indicates a transient failure."""
+        return status_code in RETRYABLE_STATUS_CODES
+
+    def compute_delay(self, attempt: int, retry_after: Optional[float] = None) -> Optional[float]:
+        """
+        Compute how long to wait before the next attempt.
+
+        Args:
+            attempt (int): Number of attempts made so far (1 after the first failure).
+            retry_after (float, optional): Server-provided `Retry-After` in seconds.
+
+        Returns:
+            float: Seconds to sleep, or None if the server asked for a longer wait
+            than `backoff_cap` allows, in which case the call should give up.
+        """
+        delay = min(self.backoff_cap, self.backoff_base * (2 ** (attempt - 1)))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        if self.respect_retry_after and retry_after is not None:
+            if retry_after > self.backoff_cap:
+                return None
+            delay = max(delay, retry_after)
+        return delay
+
+    def can_retry(self, attempt: int, delay: Optional[float], started: float) -> bool:
+        """
+        Whether another attempt is allowed.
+
+        Args:
+            attempt (int): Number of attempts made so far.
+            delay (float): Delay returned by `compute_delay`.
+            started (float): `time.monotonic()` value when the call started.
+        """
+        if attempt >= self.max_attempts or delay is None:
+            return False
+        if self.deadline is not None and time.monotonic() + delay - started > self.deadline:
+            return False
+        return True
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker guarding a single endpoint.
+
+    The breaker starts closed. After `failure_threshold` consecutive failures it opens
+    and rejects calls for `reset_timeout` seconds. It then goes half-open and lets a
+    single probe through: success closes it again, failure re-opens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Args:
+            failure_threshold (int): Consecutive failures that open the breaker.
+            reset_timeout (float): Seconds to stay open before allowing a probe.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self.total_failures = 0
+        self.total_rejections = 0
+
+    @property
+    def state(self) -> str:
+        """Current state: "closed", "open" or "half_open"."""
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Whether a call may be attempted now. Rejections are counted."""
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            self.total_rejections += 1
+            return False
+
+    def record_success(self) -> None:
+        """Record a successful call, closing the breaker."""
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the breaker when the threshold is reached."""
+        with self._lock:
+            self._failures += 1
+            self.total_failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """
+        Give up a half-open probe without recording an outcome, e.g. when the call
+        ran out of time or was cancelled before the endpoint answered, so that the
+        next call can probe instead.
+        """
+        with self._lock:
+            self._probe_in_flight = False
+
+    def retry_in(self) -> float:
+        """Seconds until an open breaker allows a probe (0 when not open)."""
+        with self._lock:
+            if self._current_state() != self.OPEN:
+                return 0.0
+            return max(self.reset_timeout - (time.monotonic() - self._opened_at), 0.0)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the breaker state and counters for monitoring."""
+        with self._lock:
+            return {
+                "state": self._current_state(),
+                "consecutive_failures": self._failures,
+                "total_failures": self.total_failures,
+                "total_rejections": self.total_rejections,
+            }
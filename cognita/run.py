@@ -0,0 +1,376 @@
+"""
+Query Runner Module for Cognita SDK
+
+This module runs very large query files through a pool of worker processes, so
+response parsing and post-processing scale with the number of cores instead of
+being bound by one interpreter's GIL.
+
+Features:
+- Streams queries from a JSONL file; each line is a JSON string or an object with
+  a query field and an optional ID field.
+- Every worker process holds its own `CognitaAgent` (and so its own pooled
+  `DeepResearchAPI`) and runs the queries of a chunk on a few threads.
+- Backpressure: only a bounded number of chunks are queued at any time, so memory
+  stays flat however long the input is.
+- Streaming JSONL output, flushed after each chunk. The output doubles as the
+  checkpoint: a rerun skips the IDs already written, so a crashed run resumes
+  without querying them again. Retrying failed IDs replaces their records.
+- Results are archived to the `RESULT_STORE_PATH` store by the parent process, the
+  store's single writer; workers never open it but encode the store records, so
+  the parent only appends bytes.
+- `python -m cognita.run` and the `cognita-run` console script.
+
+Each output line is `{"id", "query", "ok", "result"}` on success or
+`{"id", "query", "ok", "error", "error_type"}` on failure.
+"""
+
+import argparse
+import copy
+import json
+import logging
+import multiprocessing.util
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from .errors import ProcessingError
+from .serialization import get_serializer
+from .store import ResultStore, encode_record
+from .utils import validate_query
+
+logger = logging.getLogger(__name__)
+
+QueryItem = Tuple[str, str]
+
+# Per-process agent created by the pool initializer.
+_worker_agent = None
+
+
+def iter_queries(path: str, query_field: str = "query", id_field: str = "id") -> Iterator[QueryItem]:
+    """
+    Stream `(id, query)` pairs from a JSONL file.
+
+    Args:
+        path (str): Input file with one JSON string or object per line.
+        query_field (str): Field holding the query in object lines.
+        id_field (str): Field holding the ID in object lines. Lines without it are
+            identified by their line number.
+
+    Yields:
+        tuple: `(id, query)`, both strings.
+
+    Raises:
+        ProcessingError: If a line is not valid JSON or has no query.
+    """
+    serializer = get_serializer()
+    with open(path, "rb") as handle:
+        for number, line in enumerate(handle, 1):
+            if not line.strip():
+                continue
+            try:
+                item = serializer.loads(line)
+            except ValueError as e:
+                raise ProcessingError(f"{path}:{number}: invalid JSON") from e
+            if isinstance(item, str):
+                yield str(number), item
+                continue
+            query = item.get(query_field) if isinstance(item, dict) else None
+            if not isinstance(query, str):
+                raise ProcessingError(f"{path}:{number}: no {query_field!r} field")
+            yield str(item.get(id_field, number)), query
+
+
+def _chunks(items: Iterable[QueryItem], size: int) -> Iterator[List[QueryItem]]:
+    chunk: List[QueryItem] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def load_checkpoint(output_path: str, retry_failed: bool = False) -> Set[str]:
+    """
+    Return the IDs already written to an output file.
+
+    A trailing partial line left by a crash is truncated so appending resumes on a
+    line boundary.
+
+    Args:
+        output_path (str): Output file of a previous run.
+        retry_failed (bool): Leave out IDs whose recorded outcome is a failure, so
+            they are queried again. Their failure records are removed from the
+            file, so each ID keeps a single record.
+
+    Returns:
+        set: IDs that should be skipped.
+    """
+    done: Set[str] = set()
+    if not os.path.exists(output_path):
+        return done
+    serializer = get_serializer()
+    complete = 0
+    retried = 0
+    with open(output_path, "rb") as handle:
+        for line in handle:
+            if not line.endswith(b"\n"):
+                break
+            complete += len(line)
+            try:
+                record = serializer.loads(line)
+            except ValueError:
+                logger.warning("Skipping unreadable line in %s", output_path)
+                continue
+            if record.get("ok") or not retry_failed:
+                done.add(str(record.get("id")))
+            else:
+                retried += 1
+    if retried:
+        logger.info("Removing %d failed records from %s to retry them", retried, output_path)
+        _drop_failed(output_path, serializer)
+    elif complete != os.path.getsize(output_path):
+        logger.warning("Truncating partial record at the end of %s", output_path)
+        with open(output_path, "r+b") as handle:
+            handle.truncate(complete)
+    return done
+
+
+def _drop_failed(output_path: str, serializer) -> None:
+    """Rewrite an output file with only its complete, successful records."""
+    temporary = output_path + ".tmp"
+    with open(output_path, "rb") as source, open(temporary, "wb") as target:
+        for line in source:
+            if not line.endswith(b"\n"):
+                break
+            try:
+                keep = bool(serializer.loads(line).get("ok"))
+            except ValueError:
+                keep = False
+            if keep:
+                target.write(line)
+    os.replace(temporary, output_path)
+
+
+def _worker_config(config):
+    """
+    Return `config` without a result store: a store has a single writer, so the
+    parent archives the results instead of every worker appending to it.
+    """
+    if not getattr(config, "RESULT_STORE_PATH", ""):
+        return config
+    if getattr(config, "frozen", False):
+        return config.replace(RESULT_STORE_PATH="")
+    config = copy.copy(config)
+    config.RESULT_STORE_PATH = ""
+    return config
+
+
+def _init_worker(config) -> None:
+    """Create the agent used by every chunk processed in this worker process."""
+    global _worker_agent
+    from .agent import CognitaAgent
+    _worker_agent = CognitaAgent(config)
+    # Pool workers leave through os._exit, which skips atexit handlers; finalizers
+    # with an exit priority still run.
+    multiprocessing.util.Finalize(None, _close_worker, exitpriority=10)
+
+
+def _close_worker() -> None:
+    global _worker_agent
+    if _worker_agent is not None:
+        _worker_agent.close()
+        _worker_agent = None
+
+
+def _run_chunk(chunk: List[QueryItem], threads: int,
+               archive: bool = False) -> Tuple[bytes, List[Tuple[bytes, bytes]], int, int]:
+    """
+    Execute one chunk of queries in a worker process.
+
+    Args:
+        chunk (list): `(id, query)` pairs.
+        threads (int): Queries in flight.
+        archive (bool): Also encode a result store record per successful query.
+
+    Returns:
+        tuple: `(jsonl, records, succeeded, failed)` where `jsonl` holds one encoded
+        output line per query and `records` the `encode_record` output of each
+        successful one, so all encoding happens off the parent process.
+    """
+    serializer = _worker_agent.api.serializer
+    run = _worker_agent.execute_batch([query for _, query in chunk], max_concurrency=threads,
+                                      ordered=True)
+    lines = []
+    records: List[Tuple[bytes, bytes]] = []
+    succeeded = failed = 0
+    for outcome in run:
+        item_id, query = chunk[outcome.index]
+        if outcome.ok:
+            succeeded += 1
+            record: Dict[str, Any] = {"id": item_id, "query": query, "ok": True,
+                                      "result": outcome.result}
+            if archive:
+                records.append(encode_record(outcome.result, query=validate_query(query),
+                                             serializer=serializer))
+        else:
+            failed += 1
+            record = {"id": item_id, "query": query, "ok": False, "error": str(outcome.error),
+                      "error_type": type(outcome.error).__name__}
+        lines.append(serializer.dumps(record))
+    lines.append(b"")
+    return b"\n".join(lines), records, succeeded, failed
+
+
+class RunStats:
+    """
+    Statistics of a `run_queries` call.
+
+    Attributes:
+        submitted (int): Queries sent to the workers.
+        succeeded (int): Queries that completed successfully.
+        failed (int): Queries whose outcome is an error.
+        skipped (int): Queries skipped because the checkpoint already had them.
+        wall_time (float): Seconds the run took.
+    """
+
+    def __init__(self):
+        self.submitted = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.skipped = 0
+        self.wall_time = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Completed queries per second of wall time."""
+        done = self.succeeded + self.failed
+        return done / self.wall_time if self.wall_time else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the statistics as a plain dictionary."""
+        return {
+            "submitted": self.submitted,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "wall_time": self.wall_time,
+            "throughput": self.throughput,
+        }
+
+    def __repr__(self) -> str:
+        return f"RunStats({self.as_dict()})"
+
+
+def run_queries(input_path: str, output_path: str, config=None, processes: Optional[int] = None,
+                threads: int = 8, chunk_size: int = 32, max_pending: Optional[int] = None,
+                resume: bool = True, retry_failed: bool = False, query_field: str = "query",
+                id_field: str = "id") -> RunStats:
+    """
+    Run every query of a JSONL file on a process pool and append the outcomes to a
+    JSONL file. When `RESULT_STORE_PATH` is set, successful results are archived
+    there by this process.
+
+    Args:
+        input_path (str): Query file (see `iter_queries`).
+        output_path (str): Output JSONL file; appended to, and used as checkpoint.
+        config (Config, optional): Configuration sent to the workers. Defaults to
+            `Config()` read from the environment.
+        processes (int, optional): Worker processes. Defaults to the CPU count.
+        threads (int): Queries in flight per worker process.
+        chunk_size (int): Queries sent to a worker at a time.
+        max_pending (int, optional): Chunks queued or running at once. Defaults to
+            twice the number of processes.
+        resume (bool): Skip IDs already present in `output_path`.
+        retry_failed (bool): When resuming, run previously failed IDs again.
+        query_field (str): Query field of object lines.
+        id_field (str): ID field of object lines.
+
+    Returns:
+        RunStats: Statistics of the run.
+    """
+    if config is None:
+        from .config import Config
+        config = Config()
+    processes = processes or os.cpu_count() or 1
+    max_pending = max_pending or 2 * processes
+    if chunk_size < 1 or threads < 1:
+        raise ValueError("chunk_size and threads must be at least 1")
+
+    stats = RunStats()
+    started = time.perf_counter()
+    done = load_checkpoint(output_path, retry_failed) if resume else set()
+
+    def remaining() -> Iterator[QueryItem]:
+        for item in iter_queries(input_path, query_field, id_field):
+            if item[0] in done:
+                stats.skipped += 1
+            else:
+                yield item
+
+    directory = os.path.dirname(os.path.abspath(output_path))
+    os.makedirs(directory, exist_ok=True)
+    store_path = getattr(config, "RESULT_STORE_PATH", "")
+    store = ResultStore(store_path) if store_path else None
+
+    pending: Set[Future] = set()
+    with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker,
+                             initargs=(_worker_config(config),)) as pool, \
+            open(output_path, "ab" if resume else "wb") as output:
+
+        def drain(block_until_below: int) -> None:
+            nonlocal pending
+            while len(pending) > block_until_below:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    lines, records, succeeded, failed = future.result()
+                    output.write(lines)
+                    output.flush()
+                    for digest, payload in records:
+                        store.append_encoded(digest, payload)
+                    stats.succeeded += succeeded
+                    stats.failed += failed
+                logger.info("%d queries done, %d failed", stats.succeeded + stats.failed, stats.failed)
+
+        try:
+            for chunk in _chunks(remaining(), chunk_size):
+                drain(max_pending - 1)
+                pending.add(pool.submit(_run_chunk, chunk, threads, store is not None))
+                stats.submitted += len(chunk)
+            drain(0)
+        finally:
+            if store is not None:
+                store.close()
+
+    stats.wall_time = time.perf_counter() - started
+    return stats
+
+
+def main(argv=None) -> int:
+    """Command-line entry point of `python -m cognita.run` and `cognita-run`."""
+    parser = argparse.ArgumentParser(description="Run a JSONL file of research queries on a process pool")
+    parser.add_argument("input", help="JSONL file of queries (strings or objects)")
+    parser.add_argument("output", help="JSONL file the outcomes are appended to")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--threads", type=int, default=8, help="queries in flight per process")
+    parser.add_argument("--chunk-size", type=int, default=32)
+    parser.add_argument("--max-pending", type=int, default=None, help="chunks queued at once")
+    parser.add_argument("--query-field", default="query")
+    parser.add_argument("--id-field", default="id")
+    parser.add_argument("--no-resume", action="store_true", help="overwrite the output instead of resuming")
+    parser.add_argument("--retry-failed", action="store_true", help="rerun failed queries when resuming")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    stats = run_queries(args.input, args.output, processes=args.processes, threads=args.threads,
+                        chunk_size=args.chunk_size, max_pending=args.max_pending,
+                        resume=not args.no_resume, retry_failed=args.retry_failed,
+                        query_field=args.query_field, id_field=args.id_field)
+    print(json.dumps(stats.as_dict(), indent=2))
+    return 1 if stats.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+"""
+Serialization Module for Cognita SDK
+
+This module provides the JSON encoder/decoder used for API request and response
+bodies. Large source lists make JSON parsing one of the most expensive steps of a
+query, so a faster library is used when it is installed.
+
+Features:
+- `JSONSerializer`: standard library backend. It encodes to UTF-8 bytes and
+  accepts raw bytes, but `json` decodes them to a `str` before parsing (and
+  memoryviews are copied to bytes first), so each response is held twice.
+- `OrjsonSerializer`: `orjson` backend (pip install cognita[fast]) which encodes to
+  bytes natively and parses bytes, bytearrays and memoryviews without copying them.
+- `get_serializer`: selects a backend by name ("auto", "orjson" or "json").
+"""
+
+import json
+from typing import Any, Dict, Union
+from .errors import ConfigError
+
+Buffer = Union[bytes, bytearray, memoryview, str]
+
+
+class JSONSerializer:
+    """
+    JSON serializer backed by the standard library `json` module.
+
+    `dumps` returns compact UTF-8 bytes ready to be sent as a request body and
+    `loads` accepts the raw response bytes, leaving encoding detection to `json`,
+    which decodes them to an intermediate `str` before parsing. Decoding errors
+    raise `ValueError`.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encode `obj` as JSON.
+
+        Args:
+            obj: JSON-serializable object.
+
+        Returns:
+            bytes: UTF-8 encoded JSON document.
+        """
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    def loads(self, data: Buffer) -> Any:
+        """
+        Decode a JSON document.
+
+        Args:
+            data (bytes, bytearray, memoryview or str): The JSON document.
+
+        Returns:
+            The decoded object.
+
+        Raises:
+            ValueError: If `data` is not valid JSON.
+        """
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class OrjsonSerializer(JSONSerializer):
+    """JSON serializer backed by `orjson`."""
+
+    name = "orjson"
+
+    def __init__(self):
+        """
+        Raises:
+            ConfigError: If `orjson` is not installed.
+        """
+        try:
+            import orjson
+        except ImportError as e:
+            raise ConfigError(
+                "orjson is required for the orjson JSON backend (pip install cognita[fast])"
+            ) from e
+        self._orjson = orjson
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj)
+
+    def loads(self, data: Buffer) -> Any:
+        # orjson reads bytes, bytearray and memoryview buffers in place.
+        return self._orjson.loads(data)
+
+
+_BACKENDS = {"json": JSONSerializer, "orjson": OrjsonSerializer}
+_instances: Dict[str, JSONSerializer] = {}
+
+
+def get_serializer(backend: str = "auto") -> JSONSerializer:
+    """
+    Return the serializer for `backend`.
+
+    Serializers are stateless, so one instance per backend is shared.
+
+    Args:
+        backend (str): "orjson", "json", or "auto" to use `orjson` when it is
+            installed and the standard library otherwise.
+
+    Returns:
+        JSONSerializer: The selected serializer.
+
+    Raises:
+        ConfigError: If the backend is unknown or its library is not installed.
+    """
+    backend = (backend or "auto").lower()
+    serializer = _instances.get(backend)
+    if serializer is not None:
+        return serializer
+    if backend == "auto":
+        try:
+            serializer = OrjsonSerializer()
+        except ConfigError:
+            serializer = JSONSerializer()
+    elif backend in _BACKENDS:
+        serializer = _BACKENDS[backend]()
+    else:
+        raise ConfigError(f"Unknown JSON backend: {backend!r} (expected 'auto', 'orjson' or 'json')")
+    _instances[backend] = serializer
+    return serializer
@@ -0,0 +1,156 @@
+"""
+Request Coalescing Module for Cognita SDK
+
+This module implements "single-flight" request coalescing: while a call for a given
+key is in progress, further callers with the same key wait for that call instead of
+starting their own, and every waiter receives its result or its exception.
+
+Features:
+- `SingleFlight` for thread-based callers.
+- `AsyncSingleFlight` for asyncio callers. The call runs in its own task, so
+  cancelling the caller that started it does not fail the others.
+- A `coalesced` counter reporting how many calls were served by another caller's request.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict
+
+
+class _Call:
+    """State of one in-flight call shared by all of its waiters."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class _Flight:
+    """An in-flight coroutine call and the number of callers awaiting it."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Future):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls with the same key across threads.
+
+    Attributes:
+        calls (int): Number of calls that actually executed the function.
+        coalesced (int): Number of calls that waited on another caller instead.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Any, _Call] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    def do(self, key: Any, func: Callable[[], Any]) -> Any:
+        """
+        Run `func` unless a call for `key` is already in flight, then share its outcome.
+
+        Args:
+            key: Hashable identifier of the request.
+            func (callable): Zero-argument function performing the request.
+
+        Returns:
+            The value returned by `func` (for this caller or the one it joined).
+
+        Raises:
+            Exception: Whatever `func` raised, re-raised in every waiting caller.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self.calls += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+        else:
+            try:
+                call.result = func()
+            except BaseException as e:
+                call.error = e
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.done.set()
+
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct keys currently being fetched."""
+        return len(self._calls)
+
+
+class AsyncSingleFlight:
+    """
+    Coalesce concurrent coroutine calls with the same key on one event loop.
+
+    Attributes:
+        calls (int): Number of calls that actually awaited the coroutine function.
+        coalesced (int): Number of calls that awaited another caller's result instead.
+    """
+
+    def __init__(self):
+        self._flights: Dict[Any, _Flight] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(self, key: Any, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await `func()` unless a call for `key` is already in flight, then share its outcome.
+
+        The call runs in a task of its own that every caller awaits through
+        `asyncio.shield`: a cancelled caller stops waiting while the others still
+        get the outcome. The call is cancelled once no caller awaits it anymore.
+
+        Args:
+            key: Hashable identifier of the request.
+            func (callable): Zero-argument coroutine function performing the request.
+
+        Returns:
+            The value produced by `func` (for this caller or the one it joined).
+
+        Raises:
+            Exception: Whatever `func` raised, re-raised in every waiting caller.
+        """
+        flight = self._flights.get(key)
+        if flight is not None:
+            self.coalesced += 1
+        else:
+            flight = self._flights[key] = _Flight(asyncio.ensure_future(func()))
+            flight.task.add_done_callback(lambda _: self._forget(key, flight))
+            self.calls += 1
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                flight.task.cancel()
+
+    def _forget(self, key: Any, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct keys currently being fetched."""
+        return len(self._flights)
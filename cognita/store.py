@@ -0,0 +1,550 @@
+"""
+Result Store Module for Cognita SDK
+
+This module archives research results on disk in a format that can be reopened
+instantly, however many results it holds. Results are appended to a
+length-prefixed binary log; a companion index file holds one fixed-size entry per
+record (timestamp, log offset, length and key hash), and a key file holds an
+on-disk hash table from key hash to the latest position. All three files are
+memory-mapped, so opening a store reads nothing and records are decoded on demand.
+
+Features:
+- `ResultStore`: append-only store with O(1) access by position, O(1) lookups by
+  key through the memory-mapped key table (nothing is loaded into memory), and
+  time-range queries by binary search over the time-ordered index.
+- Lazy iteration: records are decoded one at a time straight from the mapped log.
+- Crash tolerance: index entries pointing past the end of the log (a torn write)
+  are ignored when the store is reopened.
+- `StoredResult`: a record with its position, key, query, timestamp and result.
+- `encode_record`: encodes a record ahead of time, e.g. in a worker process, so
+  the writer only appends bytes (`ResultStore.append_encoded`).
+
+A store has a single writer; several processes may read it concurrently.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from .errors import ProcessingError
+from .serialization import JSONSerializer, get_serializer
+
+_MAGIC = b"CGRSIDX1"
+_LENGTH = struct.Struct("<I")
+# timestamp, log offset, payload length, 16-byte key hash
+_ENTRY = struct.Struct("<dQI16s")
+_KEYS_MAGIC = b"CGRSKEY1"
+# magic, slot count, used slots, index entries covered
+_KEYS_HEADER = struct.Struct("<8sQQQ")
+# key hash, position + 1 (0 marks an empty slot)
+_SLOT = struct.Struct("<16sQ")
+_MIN_SLOTS = 1024
+
+
+def _key_hash(key: str) -> bytes:
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+
+
+def encode_record(result: Dict[str, Any], query: Optional[str] = None, key: Optional[str] = None,
+                  serializer: Optional[JSONSerializer] = None) -> Tuple[bytes, bytes]:
+    """
+    Encode a record for `ResultStore.append_encoded`.
+
+    Args:
+        result (dict): The result to archive.
+        query (str, optional): The query that produced the result.
+        key (str, optional): Lookup key; defaults to `query`.
+        serializer (JSONSerializer, optional): Record encoder. Defaults to the
+            fastest installed backend.
+
+    Returns:
+        tuple: `(key hash, payload)`.
+
+    Raises:
+        ValueError: If no key can be derived.
+    """
+    key = key if key is not None else query
+    if key is None:
+        raise ValueError("a key or query is required")
+    payload = (serializer or get_serializer()).dumps({"key": key, "query": query, "result": result})
+    return _key_hash(key), payload
+
+
+def _probe(buffer, capacity: int, digest: bytes) -> int:
+    """Return the offset of `digest`'s slot, or of the empty slot where it belongs."""
+    mask = capacity - 1
+    slot = int.from_bytes(digest[:8], "little") & mask
+    while True:
+        offset = _KEYS_HEADER.size + slot * _SLOT.size
+        stored, value = _SLOT.unpack_from(buffer, offset)
+        if value == 0 or stored == digest:
+            return offset
+        slot = (slot + 1) & mask
+
+
+class _KeyTable:
+    """
+    On-disk open-addressing hash table from key hash to latest record position.
+
+    The writing handle adds every index entry after writing it; `covered` is the
+    number of index entries the table reflects, so readers only scan the index
+    entries appended since (usually none). The table is kept at most half full;
+    growing writes a larger table to a new file that atomically replaces the old
+    one, which readers notice through `stale()`.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+        self._mm: Optional[mmap.mmap] = None
+        self.open()
+
+    def open(self) -> None:
+        """(Re)map the table file, creating an empty table if there is none."""
+        self.close()
+        try:
+            handle = open(self.path, "r+b")
+        except FileNotFoundError:
+            self._write(_MIN_SLOTS, {}, 0, replace=False)
+            handle = open(self.path, "r+b")
+        self._file = handle
+        self._inode = os.fstat(handle.fileno()).st_ino
+        self._mm = mmap.mmap(handle.fileno(), 0)
+        magic, self.capacity, _, _ = _KEYS_HEADER.unpack_from(self._mm, 0)
+        if magic != _KEYS_MAGIC or len(self._mm) != _KEYS_HEADER.size + self.capacity * _SLOT.size:
+            self.close()
+            raise ProcessingError(f"{self.path} is not a result store key table")
+
+    def _write(self, capacity: int, positions: Dict[bytes, int], covered: int, replace: bool) -> None:
+        """Write a new table file holding `positions` and install it at `path`."""
+        buffer = bytearray(_KEYS_HEADER.size + capacity * _SLOT.size)
+        _KEYS_HEADER.pack_into(buffer, 0, _KEYS_MAGIC, capacity, len(positions), covered)
+        for digest, position in positions.items():
+            _SLOT.pack_into(buffer, _probe(buffer, capacity, digest), digest, position + 1)
+        temporary = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporary, "wb") as handle:
+            handle.write(buffer)
+        if replace:
+            os.replace(temporary, self.path)
+            return
+        try:
+            # Creates the table only if no other handle created it meanwhile.
+            os.link(temporary, self.path)
+        except FileExistsError:
+            pass
+        finally:
+            os.remove(temporary)
+
+    @property
+    def covered(self) -> int:
+        return _KEYS_HEADER.unpack_from(self._mm, 0)[3]
+
+    def stale(self) -> bool:
+        """Whether the table file was replaced since it was mapped."""
+        try:
+            return os.stat(self.path).st_ino != self._inode
+        except FileNotFoundError:
+            return False
+
+    def lookup(self, digest: bytes) -> Optional[int]:
+        value = _SLOT.unpack_from(self._mm, _probe(self._mm, self.capacity, digest))[1]
+        return value - 1 if value else None
+
+    def add(self, digest: bytes, position: int) -> None:
+        """Record `position` as the latest one of `digest` (writer only)."""
+        offset = _probe(self._mm, self.capacity, digest)
+        used = _KEYS_HEADER.unpack_from(self._mm, 0)[2]
+        if _SLOT.unpack_from(self._mm, offset)[1] == 0:
+            used += 1
+        _SLOT.pack_into(self._mm, offset, digest, position + 1)
+        _KEYS_HEADER.pack_into(self._mm, 0, _KEYS_MAGIC, self.capacity, used, position + 1)
+        if 2 * used > self.capacity:
+            self.reset(self.positions(), position + 1)
+
+    def reset(self, positions: Dict[bytes, int], covered: int) -> None:
+        """Replace the table by one holding exactly `positions` (writer only)."""
+        # At most a quarter full, so the table grows again only after doubling.
+        capacity = _MIN_SLOTS
+        while capacity < 4 * len(positions):
+            capacity *= 2
+        self._write(capacity, positions, covered, replace=True)
+        self.open()
+
+    def positions(self) -> Dict[bytes, int]:
+        """Every key hash in the table with its latest position."""
+        positions = {}
+        for slot in range(self.capacity):
+            digest, value = _SLOT.unpack_from(self._mm, _KEYS_HEADER.size + slot * _SLOT.size)
+            if value:
+                positions[digest] = value - 1
+        return positions
+
+    def flush(self) -> None:
+        self._mm.flush()
+
+    def close(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+            self._file.close()
+            self._mm = self._file = None
+
+
+class StoredResult:
+    """
+    A result read from a `ResultStore`.
+
+    Attributes:
+        index (int): Position of the record in the store.
+        key (str): Lookup key the result was stored under.
+        query (str): The query that produced the result, if recorded.
+        timestamp (float): `time.time()` at which the result was appended.
+        result (dict): The stored result.
+    """
+
+    __slots__ = ("index", "key", "query", "timestamp", "result")
+
+    def __init__(self, index: int, key: str, query: Optional[str], timestamp: float,
+                 result: Dict[str, Any]):
+        self.index = index
+        self.key = key
+        self.query = query
+        self.timestamp = timestamp
+        self.result = result
+
+    def __repr__(self) -> str:
+        return f"StoredResult(index={self.index}, key={self.key!r}, timestamp={self.timestamp})"
+
+
+class ResultStore:
+    """
+    Append-only, memory-mapped archive of research results.
+
+    The store consists of `<path>.log` (records), `<path>.idx` (index) and
+    `<path>.keys` (key table). Each appended result gets the next position;
+    timestamps never decrease, which keeps the index sorted by time.
+
+    Example:
+        with ResultStore("archive/results") as store:
+            store.append(result, query=topic)
+            latest = store.get(topic)
+            for record in store.range(start=time.time() - 86400):
+                ...
+    """
+
+    def __init__(self, path: str, serializer: Optional[JSONSerializer] = None):
+        """
+        Open or create a store.
+
+        Args:
+            path (str): Base path; `.log` and `.idx` are appended to it.
+            serializer (JSONSerializer, optional): Record encoder. Defaults to the
+                fastest installed backend.
+
+        Raises:
+            ProcessingError: If the index file is not a result store index.
+        """
+        self.path = path
+        self.log_path = path + ".log"
+        self.index_path = path + ".idx"
+        self.serializer = serializer or get_serializer()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._log = open(self.log_path, "a+b")
+        self._index = open(self.index_path, "a+b")
+        if os.fstat(self._index.fileno()).st_size == 0:
+            self._index.write(_MAGIC)
+            self._index.flush()
+        else:
+            self._index.seek(0)
+            if self._index.read(len(_MAGIC)) != _MAGIC:
+                self._log.close()
+                self._index.close()
+                raise ProcessingError(f"{self.index_path} is not a result store index")
+        self._log_mm: Optional[mmap.mmap] = None
+        self._index_mm: Optional[mmap.mmap] = None
+        self.keys_path = path + ".keys"
+        try:
+            self._keys = _KeyTable(self.keys_path)
+        except ProcessingError:
+            self._log.close()
+            self._index.close()
+            raise
+        self._count = self._valid_entries()
+        self._last_timestamp = self._timestamp(self._count - 1) if self._count else 0.0
+
+    def _valid_entries(self) -> int:
+        """Number of index entries whose record lies entirely within the log."""
+        index_size = os.fstat(self._index.fileno()).st_size
+        count = (index_size - len(_MAGIC)) // _ENTRY.size
+        log_size = os.fstat(self._log.fileno()).st_size
+        # Only the tail can be torn; walk back until an entry fits in the log.
+        while count:
+            _, offset, length, _ = self._entry(count - 1)
+            if offset + _LENGTH.size + length <= log_size:
+                break
+            count -= 1
+        return count
+
+    @staticmethod
+    def _remap(mapped: Optional[mmap.mmap], handle, needed: int) -> mmap.mmap:
+        """Return a read-only map of `handle` covering at least `needed` bytes."""
+        if mapped is not None and len(mapped) >= needed:
+            return mapped
+        if mapped is not None:
+            mapped.close()
+        handle.flush()
+        return mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _index_map(self) -> mmap.mmap:
+        self._index_mm = self._remap(self._index_mm, self._index,
+                                     len(_MAGIC) + self._count * _ENTRY.size)
+        return self._index_mm
+
+    def _log_map(self, needed: int) -> mmap.mmap:
+        self._log_mm = self._remap(self._log_mm, self._log, needed)
+        return self._log_mm
+
+    def _entry(self, position: int) -> Tuple[float, int, int, bytes]:
+        offset = len(_MAGIC) + position * _ENTRY.size
+        self._index_mm = self._remap(self._index_mm, self._index, offset + _ENTRY.size)
+        return _ENTRY.unpack_from(self._index_mm, offset)
+
+    def _timestamp(self, position: int) -> float:
+        return self._entry(position)[0]
+
+    def append(self, result: Dict[str, Any], query: Optional[str] = None,
+               key: Optional[str] = None, timestamp: Optional[float] = None) -> int:
+        """
+        Append a result to the store.
+
+        Args:
+            result (dict): The result to archive, e.g. an `execute_query` return value.
+            query (str, optional): The query that produced the result.
+            key (str, optional): Lookup key; defaults to `query`.
+            timestamp (float, optional): Record time; defaults to now. Timestamps
+                must not decrease.
+
+        Returns:
+            int: Position of the new record.
+
+        Raises:
+            ValueError: If no key can be derived or `timestamp` is older than the last record.
+        """
+        digest, payload = encode_record(result, query, key, self.serializer)
+        return self.append_encoded(digest, payload, timestamp)
+
+    def append_encoded(self, digest: bytes, payload: bytes, timestamp: Optional[float] = None) -> int:
+        """
+        Append a record encoded by `encode_record`, without decoding it.
+
+        Args:
+            digest (bytes): Key hash returned by `encode_record`.
+            payload (bytes): Payload returned by `encode_record`.
+            timestamp (float, optional): Record time; defaults to now. Timestamps
+                must not decrease.
+
+        Returns:
+            int: Position of the new record.
+
+        Raises:
+            ValueError: If `timestamp` is older than the last record.
+        """
+        with self._lock:
+            self._sync_keys()
+            if timestamp is None:
+                timestamp = max(time.time(), self._last_timestamp)
+            elif timestamp < self._last_timestamp:
+                raise ValueError("timestamps must not decrease")
+            self._log.seek(0, os.SEEK_END)
+            offset = self._log.tell()
+            self._log.write(_LENGTH.pack(len(payload)))
+            self._log.write(payload)
+            self._log.flush()
+            # The record is in the log before the index points at it.
+            self._index.seek(0, os.SEEK_END)
+            expected = len(_MAGIC) + self._count * _ENTRY.size
+            if self._index.tell() != expected:
+                # Drop a torn entry left over from an interrupted write.
+                self._index.truncate(expected)
+            self._index.write(_ENTRY.pack(timestamp, offset, len(payload), digest))
+            self._index.flush()
+            position = self._count
+            self._count += 1
+            self._last_timestamp = timestamp
+            self._keys.add(digest, position)
+        return position
+
+    def _sync_keys(self) -> None:
+        """
+        Bring the key table up to date with the index before appending.
+
+        The table lags behind after an interrupted append, or when the store was
+        written without one; it is ahead when a torn index entry was dropped.
+        """
+        if self._keys.stale():
+            self._keys.open()
+        covered = self._keys.covered
+        if covered > self._count:
+            positions = {self._entry(position)[3]: position for position in range(self._count)}
+            self._keys.reset(positions, self._count)
+        for position in range(covered, self._count):
+            self._keys.add(self._entry(position)[3], position)
+
+    def refresh(self) -> int:
+        """
+        Pick up records appended by another process since the store was opened.
+
+        Returns:
+            int: Number of new records.
+        """
+        with self._lock:
+            if self._keys.stale():
+                self._keys.open()
+            count = self._valid_entries()
+            added = count - self._count
+            if added > 0:
+                self._count = count
+                self._last_timestamp = self._timestamp(count - 1)
+            return max(added, 0)
+
+    def flush(self) -> None:
+        """Flush both files to the operating system and disk."""
+        with self._lock:
+            for handle in (self._log, self._index):
+                handle.flush()
+                os.fsync(handle.fileno())
+            self._keys.flush()
+
+    def _read(self, position: int) -> StoredResult:
+        timestamp, offset, length, _ = self._entry(position)
+        log = self._log_map(offset + _LENGTH.size + length)
+        start = offset + _LENGTH.size
+        if _LENGTH.unpack_from(log, offset)[0] != length:
+            raise ProcessingError(f"Corrupt record {position} in {self.log_path}")
+        with memoryview(log) as view:
+            record = self.serializer.loads(view[start:start + length])
+        return StoredResult(position, record["key"], record.get("query"), timestamp, record["result"])
+
+    def __getitem__(self, position: int) -> StoredResult:
+        with self._lock:
+            if position < 0:
+                position += self._count
+            if not 0 <= position < self._count:
+                raise IndexError("ResultStore index out of range")
+            return self._read(position)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _tail(self) -> range:
+        """Positions of the records not yet in the key table, newest first."""
+        covered = self._keys.covered
+        if covered < self._count and self._keys.stale():
+            # The writer grew the table into a new file.
+            self._keys.open()
+            covered = self._keys.covered
+        return range(self._count - 1, min(covered, self._count) - 1, -1)
+
+    def _find(self, digest: bytes) -> Optional[int]:
+        # Caller holds self._lock.
+        for position in self._tail():
+            if self._entry(position)[3] == digest:
+                return position
+        position = self._keys.lookup(digest)
+        if position is not None and position >= self._count:
+            # Another handle appended the key's latest record since our last refresh.
+            self.refresh()
+            if position >= self._count:
+                return None
+        return position
+
+    def get(self, key: str) -> Optional[StoredResult]:
+        """
+        Return the most recent result stored under `key`.
+
+        The key is looked up in the memory-mapped key table, so a lookup costs a
+        few slot probes and one record read whatever the size of the store.
+
+        Returns:
+            StoredResult: The record, or None if the key is unknown.
+        """
+        with self._lock:
+            position = self._find(_key_hash(key))
+            if position is None:
+                return None
+            record = self._read(position)
+        return record if record.key == key else None
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def _bisect(self, timestamp: float, right: bool) -> int:
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            value = self._timestamp(middle)
+            if value < timestamp or (right and value == timestamp):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def range(self, start: Optional[float] = None, end: Optional[float] = None) -> Iterator[StoredResult]:
+        """
+        Iterate lazily over the results appended in `[start, end)`.
+
+        The bounds are located by binary search over the index, so only matching
+        records are read.
+
+        Args:
+            start (float, optional): Earliest timestamp (inclusive).
+            end (float, optional): Latest timestamp (exclusive).
+
+        Yields:
+            StoredResult: Matching records in append order.
+        """
+        with self._lock:
+            first = self._bisect(start, right=False) if start is not None else 0
+            last = self._bisect(end, right=False) if end is not None else self._count
+        for position in range(first, last):
+            with self._lock:
+                record = self._read(position)
+            yield record
+
+    def __iter__(self) -> Iterator[StoredResult]:
+        return self.range()
+
+    def keys(self) -> List[str]:
+        """Distinct keys in the store (reads the latest record of every key)."""
+        with self._lock:
+            latest = {digest: position for digest, position in self._keys.positions().items()
+                      if position < self._count}
+            for position in reversed(self._tail()):
+                latest[self._entry(position)[3]] = position
+            positions = sorted(latest.values())
+        return [self[position].key for position in positions]
+
+    def close(self) -> None:
+        """Close the mapped views and files."""
+        with self._lock:
+            for mapped in (self._log_mm, self._index_mm):
+                if mapped is not None:
+                    mapped.close()
+            self._log_mm = self._index_mm = None
+            self._log.close()
+            self._index.close()
+            self._keys.close()
+
+    def __enter__(self) -> "ResultStore":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"ResultStore(path={self.path!r}, results={self._count})"
@@ -0,0 +1,334 @@
+"""
+Result Table Module for Cognita SDK
+
+This module provides a NumPy-backed table for analysing large numbers of research
+results on the client side. Confidence scores and per-source numeric fields live in
+contiguous arrays, so re-thresholding, percentile statistics and score
+normalization are single vectorized operations instead of loops over dictionaries.
+
+Features:
+- `ResultTable`: columnar results with a `float64` confidence column and the
+  sources of all results flattened into CSR-style arrays (`source_offsets`).
+- Vectorized filtering at any confidence threshold, for results and for sources.
+- Percentiles, summary statistics, min-max / z-score / rank normalization and
+  weighted scoring with `argpartition`-based top-k.
+
+NumPy is an optional dependency (pip install cognita[numpy]); it is imported when a
+table is created.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+from .errors import ConfigError
+from .models import ResearchResult, ResultCollection, Source
+
+NORMALIZATIONS = ("minmax", "zscore", "rank")
+
+
+def _import_numpy():
+    """Import `numpy` on demand so the rest of the SDK does not require it."""
+    try:
+        import numpy
+    except ImportError as e:
+        raise ConfigError("numpy is required for ResultTable (pip install cognita[numpy])") from e
+    return numpy
+
+
+def _object_array(np, values: Sequence[Any]):
+    # Filling a preallocated array keeps tuples/lists as elements instead of new axes.
+    array = np.empty(len(values), dtype=object)
+    array[:] = list(values)
+    return array
+
+
+def _source_confidence(source: Any) -> float:
+    if isinstance(source, Source):
+        value = source.confidence
+    elif isinstance(source, dict):
+        value = source.get("confidence")
+    else:
+        value = None
+    try:
+        return float(value) if value is not None else float("nan")
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+class ResultTable:
+    """
+    Columnar table of research results backed by NumPy arrays.
+
+    Example:
+        table = ResultTable.from_results(agent.execute_query(q) for q in topics)
+        strong = table.filter(0.85)
+        print(table.percentile([50, 95]), strong.describe())
+        best = table.top(10, source_weight=0.5)
+
+    Attributes:
+        queries (numpy.ndarray): Query of each result (None when unknown), dtype object.
+        summaries (numpy.ndarray): Summary of each result, dtype object.
+        confidences (numpy.ndarray): `float64` confidence of each result.
+        sources (numpy.ndarray): `Source` objects of all results, flattened in result
+            order, dtype object.
+        source_confidences (numpy.ndarray): `float64` confidence of each flattened
+            source (NaN when the source has none).
+        source_offsets (numpy.ndarray): `int64` array of length `len(table) + 1`;
+            the sources of result `i` are `sources[source_offsets[i]:source_offsets[i + 1]]`.
+    """
+
+    def __init__(self, queries: Sequence[Optional[str]], summaries: Sequence[str], confidences,
+                 sources: Sequence[Any], source_confidences, source_offsets):
+        """
+        Build a table from prepared columns; use `from_results` for result objects.
+
+        Raises:
+            ConfigError: If NumPy is not installed.
+            ValueError: If the column lengths do not match.
+        """
+        np = _import_numpy()
+        self._np = np
+        self.queries = _object_array(np, queries)
+        self.summaries = _object_array(np, summaries)
+        self.confidences = np.ascontiguousarray(confidences, dtype=np.float64)
+        self.sources = _object_array(np, sources)
+        self.source_confidences = np.ascontiguousarray(source_confidences, dtype=np.float64)
+        self.source_offsets = np.ascontiguousarray(source_offsets, dtype=np.int64)
+        if not (len(self.queries) == len(self.summaries) == len(self.confidences)
+                == len(self.source_offsets) - 1):
+            raise ValueError("result columns must have the same length")
+        if len(self.sources) != len(self.source_confidences) or self.source_offsets[-1] != len(self.sources):
+            raise ValueError("source columns do not match source_offsets")
+
+    @classmethod
+    def from_results(cls, results: Iterable[Union[ResearchResult, Dict[str, Any]]]) -> "ResultTable":
+        """
+        Build a table from `ResearchResult` objects or summarized result dictionaries.
+
+        Args:
+            results (iterable): Results, e.g. `execute_query` return values or a
+                `ResultCollection`.
+
+        Returns:
+            ResultTable: The table.
+
+        Raises:
+            ConfigError: If NumPy is not installed.
+        """
+        np = _import_numpy()
+        queries, summaries, sources = [], [], []
+        confidences, source_confidences, offsets = [], [], [0]
+        for result in results:
+            if not isinstance(result, ResearchResult):
+                result = ResearchResult.from_dict(result)
+            queries.append(result.query)
+            summaries.append(result.summary)
+            confidences.append(result.confidence)
+            for source in result.sources:
+                sources.append(source)
+                source_confidences.append(_source_confidence(source))
+            offsets.append(len(sources))
+        return cls(queries, summaries, np.array(confidences, dtype=np.float64), sources,
+                   np.array(source_confidences, dtype=np.float64), np.array(offsets, dtype=np.int64))
+
+    @property
+    def source_counts(self):
+        """`int64` array with the number of sources of each result."""
+        return self._np.diff(self.source_offsets)
+
+    def _source_owner(self):
+        """Index of the owning result for every flattened source."""
+        return self._np.repeat(self._np.arange(len(self)), self.source_counts)
+
+    def mask(self, min_confidence: float):
+        """Boolean array selecting the results scoring at least `min_confidence`."""
+        return self.confidences >= min_confidence
+
+    def select(self, selector) -> "ResultTable":
+        """
+        Return a new table with the rows chosen by a boolean mask or index array.
+
+        Args:
+            selector (numpy.ndarray): Boolean mask of length `len(table)` or row indices.
+
+        Returns:
+            ResultTable: The selected rows, sources included.
+        """
+        np = self._np
+        selector = np.asarray(selector)
+        rows = np.flatnonzero(selector) if selector.dtype == bool else selector.astype(np.int64)
+        counts = self.source_counts[rows]
+        offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        # Flat source positions of the selected rows, gathered without a Python loop.
+        starts = np.repeat(self.source_offsets[:-1][rows] - offsets[:-1], counts)
+        positions = starts + np.arange(offsets[-1], dtype=np.int64)
+        return ResultTable(self.queries[rows], self.summaries[rows], self.confidences[rows],
+                           self.sources[positions], self.source_confidences[positions], offsets)
+
+    def filter(self, min_confidence: float, min_source_confidence: Optional[float] = None) -> "ResultTable":
+        """
+        Re-threshold the results without querying the API again.
+
+        Args:
+            min_confidence (float): Keep results scoring at least this.
+            min_source_confidence (float, optional): Additionally drop sources scoring
+                below this; sources without a confidence are kept.
+
+        Returns:
+            ResultTable: The filtered table.
+        """
+        table = self.select(self.mask(min_confidence))
+        if min_source_confidence is None:
+            return table
+        np = self._np
+        keep = ~(table.source_confidences < min_source_confidence)
+        counts = np.bincount(table._source_owner()[keep], minlength=len(table))
+        offsets = np.zeros(len(table) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        return ResultTable(table.queries, table.summaries, table.confidences,
+                           table.sources[keep], table.source_confidences[keep], offsets)
+
+    def percentile(self, q: Union[float, Sequence[float]], sources: bool = False):
+        """
+        Percentiles of the result (or source) confidences.
+
+        Args:
+            q (float or sequence): Percentile(s) between 0 and 100.
+            sources (bool): Use the source confidences (ignoring missing ones).
+
+        Returns:
+            float or numpy.ndarray: The percentile value(s); NaN for an empty table.
+        """
+        values = self.source_confidences if sources else self.confidences
+        values = values[~self._np.isnan(values)]
+        if values.size == 0:
+            return self._np.full(self._np.shape(q), self._np.nan) if self._np.ndim(q) else float("nan")
+        return self._np.percentile(values, q)
+
+    def describe(self) -> Dict[str, float]:
+        """Count, mean, standard deviation, min, p50, p90, p99 and max of the confidences."""
+        np = self._np
+        if len(self) == 0:
+            return {"count": 0}
+        p50, p90, p99 = np.percentile(self.confidences, [50, 90, 99])
+        return {
+            "count": len(self),
+            "mean": float(self.confidences.mean()),
+            "std": float(self.confidences.std()),
+            "min": float(self.confidences.min()),
+            "p50": float(p50),
+            "p90": float(p90),
+            "p99": float(p99),
+            "max": float(self.confidences.max()),
+        }
+
+    def normalize(self, method: str = "minmax", values=None):
+        """
+        Normalize scores across the table.
+
+        Args:
+            method (str): "minmax" (to [0, 1]), "zscore" (mean 0, std 1) or "rank"
+                (percentile rank in [0, 1], ties averaged).
+            values (numpy.ndarray, optional): Scores to normalize; defaults to the
+                result confidences.
+
+        Returns:
+            numpy.ndarray: Normalized `float64` scores (zeros for constant input).
+
+        Raises:
+            ValueError: If `method` is unknown.
+        """
+        np = self._np
+        values = self.confidences if values is None else np.asarray(values, dtype=np.float64)
+        if method not in NORMALIZATIONS:
+            raise ValueError(f"method must be one of {', '.join(NORMALIZATIONS)}")
+        if values.size == 0:
+            return values.copy()
+        if method == "minmax":
+            low, span = values.min(), np.ptp(values)
+            return (values - low) / span if span else np.zeros_like(values)
+        if method == "zscore":
+            std = values.std()
+            return (values - values.mean()) / std if std else np.zeros_like(values)
+        order = values.argsort(kind="mergesort")
+        ranks = np.empty(values.size, dtype=np.float64)
+        ranks[order] = np.arange(values.size, dtype=np.float64)
+        # Average the ranks of tied values.
+        _, inverse, counts = np.unique(values, return_inverse=True, return_counts=True)
+        sums = np.bincount(inverse, weights=ranks)
+        ranks = sums[inverse] / counts[inverse]
+        return ranks / (values.size - 1) if values.size > 1 else np.zeros_like(values)
+
+    def mean_source_confidence(self):
+        """Mean confidence of each result's sources (NaN when none have a confidence)."""
+        np = self._np
+        valid = ~np.isnan(self.source_confidences)
+        owners = self._source_owner()[valid]
+        totals = np.bincount(owners, weights=self.source_confidences[valid], minlength=len(self))
+        counts = np.bincount(owners, minlength=len(self))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return totals / counts
+
+    def scores(self, confidence_weight: float = 1.0, source_weight: float = 0.0,
+               count_weight: float = 0.0, normalize: Optional[str] = "minmax"):
+        """
+        Weighted score of every result.
+
+        The score is the weighted sum of the result confidence, the mean source
+        confidence (0 when unknown) and `log1p` of the number of sources, each
+        normalized with `normalize` first (None uses the raw values).
+
+        Returns:
+            numpy.ndarray: `float64` scores.
+        """
+        np = self._np
+        components = (
+            (confidence_weight, self.confidences),
+            (source_weight, np.nan_to_num(self.mean_source_confidence())),
+            (count_weight, np.log1p(self.source_counts.astype(np.float64))),
+        )
+        total = np.zeros(len(self), dtype=np.float64)
+        for weight, values in components:
+            if weight:
+                total += weight * (self.normalize(normalize, values) if normalize else values)
+        return total
+
+    def top(self, k: int, **weights: float) -> "ResultTable":
+        """
+        Return the `k` best results by `scores(**weights)`, best first.
+
+        Uses `argpartition`, so only the selected rows are sorted.
+        """
+        np = self._np
+        scores = self.scores(**weights) if weights else self.confidences
+        k = min(k, len(self))
+        if k <= 0:
+            return self.select(np.zeros(0, dtype=np.int64))
+        best = np.argpartition(-scores, k - 1)[:k]
+        return self.select(best[np.argsort(-scores[best], kind="mergesort")])
+
+    def __len__(self) -> int:
+        return len(self.confidences)
+
+    def __getitem__(self, index: int) -> ResearchResult:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ResultTable index out of range")
+        start, end = self.source_offsets[index], self.source_offsets[index + 1]
+        return ResearchResult(self.summaries[index], tuple(self.sources[start:end]),
+                              float(self.confidences[index]), self.queries[index])
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def to_collection(self) -> ResultCollection:
+        """Return the rows as a `ResultCollection`."""
+        return ResultCollection(self)
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Return every result in the structure produced by `summarize_results`."""
+        return [result.to_dict() for result in self]
+
+    def __repr__(self) -> str:
+        return f"ResultTable(results={len(self)}, sources={len(self.sources)})"
@@ -8,11 +8,16 @@ Features:
 - Query validation to ensure meaningful research queries.
 - Response formatting for standardizing API results.
 - Summarization function for processing final results.
+- Incremental parsing of streamed (NDJSON or server-sent events) responses.
 """
 
-from typing import Dict, Any
+import json
+from typing import Dict, Any, AsyncIterable, AsyncIterator, Callable, Iterable, Iterator, Union
 from .errors import ProcessingError
 
+# Kinds of events produced by `stream_format_response`.
+STREAM_EVENT_TYPES = ("source", "summary", "confidence")
+
 def validate_query(query: str) -> str:
     """
     Validate and sanitize research query.
@@ -78,3 +83,177 @@ def summarize_results(results: Dict[str, Any]) -> Dict[str, Any]:
         "sources": results.get("sources", []),
         "confidence": results.get("confidence", 0.0)
     }
+
+
+def _decode_line(line: Union[str, bytes]) -> str:
+    if isinstance(line, bytes):
+        line = line.decode("utf-8")
+    return line.rstrip("\r\n")
+
+def _strip_line(line: Union[str, bytes]) -> Union[str, bytes]:
+    # NDJSON lines stay bytes so the JSON decoder can parse them without a str copy.
+    return line.rstrip(b"\r\n") if isinstance(line, bytes) else line.rstrip("\r\n")
+
+def _parse_event(data: Union[str, bytes], loads: Callable[[Any], Any] = json.loads) -> Dict[str, Any]:
+    try:
+        event = loads(data)
+    except ValueError as e:
+        raise ProcessingError(f"Invalid stream event: {str(e)}")
+    if not isinstance(event, dict):
+        raise ProcessingError("Invalid stream event: expected a JSON object")
+    return event
+
+def iter_ndjson(lines: Iterable[Union[str, bytes]],
+                loads: Callable[[Any], Any] = json.loads) -> Iterator[Dict[str, Any]]:
+    """
+    Parse newline-delimited JSON into event dictionaries.
+
+    Args:
+        lines (iterable): Lines of the response body (str or bytes); blank lines are skipped.
+        loads (callable): JSON decoder accepting str or bytes.
+
+    Yields:
+        dict: One decoded JSON object per line.
+
+    Raises:
+        ProcessingError: If a line is not a JSON object.
+    """
+    for line in lines:
+        line = _strip_line(line)
+        if line.strip():
+            yield _parse_event(line, loads)
+
+class _SSEParser:
+    """Accumulates server-sent event fields and returns complete event payloads."""
+
+    def __init__(self):
+        self.data = []
+
+    def feed(self, line: str):
+        if not line:
+            return self.flush()
+        if line.startswith(":"):
+            return None
+        field, _, value = line.partition(":")
+        if field == "data":
+            self.data.append(value[1:] if value.startswith(" ") else value)
+        return None
+
+    def flush(self):
+        if not self.data:
+            return None
+        data, self.data = "\n".join(self.data), []
+        return data
+
+def iter_sse(lines: Iterable[Union[str, bytes]],
+             loads: Callable[[Any], Any] = json.loads) -> Iterator[Dict[str, Any]]:
+    """
+    Parse a server-sent events stream into event dictionaries.
+
+    Each event's `data:` lines are joined and decoded as JSON. Comment lines are
+    ignored and a `[DONE]` payload ends the stream.
+
+    Args:
+        lines (iterable): Lines of the response body (str or bytes).
+        loads (callable): JSON decoder accepting str or bytes.
+
+    Yields:
+        dict: One decoded JSON object per event.
+
+    Raises:
+        ProcessingError: If an event payload is not a JSON object.
+    """
+    parser = _SSEParser()
+    for line in lines:
+        data = parser.feed(_decode_line(line))
+        if data == "[DONE]":
+            return
+        if data is not None:
+            yield _parse_event(data, loads)
+    data = parser.flush()
+    if data is not None and data != "[DONE]":
+        yield _parse_event(data, loads)
+
+def _format_event(event: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Translate one raw stream event into formatted events."""
+    kind = event.get("type")
+    if kind == "source":
+        yield {"type": "source", "value": event.get("source", event.get("data"))}
+    elif kind == "summary":
+        yield {"type": "summary", "value": event.get("text", event.get("data", ""))}
+    elif kind == "confidence":
+        yield {"type": "confidence", "value": event.get("confidence_score", 0.0)}
+    elif kind is None:
+        # Events without a type carry partial fields of the regular response body.
+        if "summary" in event:
+            yield {"type": "summary", "value": event["summary"]}
+        for source in event.get("sources", ()):
+            yield {"type": "source", "value": source}
+        if "confidence_score" in event:
+            yield {"type": "confidence", "value": event["confidence_score"]}
+
+def stream_format_response(events: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """
+    Standardize streamed API events as they arrive.
+
+    Raw events of type "source", "summary" (a text fragment) and "confidence" are
+    turned into `{"type": ..., "value": ...}` dictionaries; untyped events holding
+    `summary`/`sources`/`confidence_score` fields are split the same way. Unknown
+    event types (e.g. "done" or keep-alives) are ignored.
+
+    Args:
+        events (iterable): Raw events from `iter_ndjson` or `iter_sse`.
+
+    Yields:
+        dict: Formatted events.
+    """
+    for event in events:
+        yield from _format_event(event)
+
+def collect_stream(events: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Fold formatted stream events into the structure returned by `format_response`.
+
+    Args:
+        events (iterable): Events produced by `stream_format_response`.
+
+    Returns:
+        dict: Structured research results including summary, sources, and confidence score
+    """
+    summary, sources, confidence = [], [], 0.0
+    for event in events:
+        if event["type"] == "source":
+            sources.append(event["value"])
+        elif event["type"] == "summary":
+            summary.append(event["value"])
+        elif event["type"] == "confidence":
+            confidence = event["value"]
+    return {"summary": "".join(summary), "sources": sources, "confidence": confidence}
+
+async def aiter_ndjson(lines: AsyncIterable[Union[str, bytes]],
+                      loads: Callable[[Any], Any] = json.loads) -> AsyncIterator[Dict[str, Any]]:
+    """Asynchronous counterpart of `iter_ndjson`."""
+    async for line in lines:
+        line = _strip_line(line)
+        if line.strip():
+            yield _parse_event(line, loads)
+
+async def aiter_sse(lines: AsyncIterable[Union[str, bytes]],
+                    loads: Callable[[Any], Any] = json.loads) -> AsyncIterator[Dict[str, Any]]:
+    """Asynchronous counterpart of `iter_sse`."""
+    parser = _SSEParser()
+    async for line in lines:
+        data = parser.feed(_decode_line(line))
+        if data == "[DONE]":
+            return
+        if data is not None:
+            yield _parse_event(data, loads)
+    data = parser.flush()
+    if data is not None and data != "[DONE]":
+        yield _parse_event(data, loads)
+
+async def astream_format_response(events: AsyncIterable[Dict[str, Any]]) -> AsyncIterator[Dict[str, Any]]:
+    """Asynchronous counterpart of `stream_format_response`."""
+    async for event in events:
+        for formatted in _format_event(event):
+            yield formatted
@@ -7,6 +7,7 @@ It demonstrates how to handle multiple research queries and process their result
 
 import logging
 from cognita import CognitaAgent, Config
+from cognita.aggregation import SourceIndex
 
 def main():
     # Setup logging for detailed debugging information
@@ -26,16 +27,20 @@ def main():
     ]
     
     aggregated_results = {}
+    # Sources cited by several topics are deduplicated and their confidence merged
+    source_index = SourceIndex(merge="noisy_or")
     
-    # Execute each research query and store the results
-    for topic in research_topics:
-        print(f"Executing query: {topic}")
-        try:
-            result = agent.execute_query(topic)
-            aggregated_results[topic] = result
-            print("Query completed successfully.")
-        except Exception as e:
-            print(f"Error executing query '{topic}': {e}")
+    # Execute the research queries concurrently; each outcome arrives as soon as
+    # its query completes, and a failing topic does not stop the others
+    run = agent.execute_batch(research_topics, max_concurrency=3)
+    for outcome in run:
+        if outcome.ok:
+            aggregated_results[outcome.query] = outcome.result
+            source_index.add_result(outcome.result)
+            print(f"Query completed successfully: {outcome.query}")
+        else:
+            print(f"Error executing query '{outcome.query}': {outcome.error}")
+    print(f"Batch statistics: {run.stats.as_dict()}")
     
     # Process aggregated results (e.g., summarizing or comparing responses)
     print("\nAggregated Research Results:")
@@ -43,5 +48,10 @@ def main():
         print(f"\nTopic: {topic}")
         print(result)
 
+    print(f"\nTop sources across all topics ({len(source_index)} distinct):")
+    for source in source_index.top(5):
+        print(f"- {source.get('title') or source.get('url')} "
+              f"(confidence {source['confidence']:.2f}, cited {source['occurrences']}x)")
+
 if __name__ == '__main__':
     main()
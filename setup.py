@@ -13,6 +13,14 @@ setup(
         "pytest",
         "setuptools"
     ],
+    extras_require={
+        "async": ["aiohttp"],
+        "fast": ["orjson"],
+        "numpy": ["numpy"],
+    },
+    entry_points={
+        "console_scripts": ["cognita-run=cognita.run:main"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from cognita.agent import CognitaAgent
 from cognita.errors import ProcessingError
@@ -48,3 +49,26 @@ def test_execute_query_invalid_query(dummy_agent):
     invalid_query = "short"
     with pytest.raises(ProcessingError):
         dummy_agent.execute_query(invalid_query)
+
+def test_aexecute_query_success(dummy_agent, monkeypatch):
+    """
+    Test that the async pipeline validates, submits and summarizes like the sync one.
+    """
+    async def fake_async_submit(query: str):
+        return {"summary": "Async summary", "sources": [], "confidence_score": 0.9}
+    monkeypatch.setattr(dummy_agent.async_api, "submit_research_request", fake_async_submit)
+
+    async def run():
+        return await asyncio.gather(
+            dummy_agent.aexecute_query("What are the latest advancements in AI?"),
+            dummy_agent.aexecute_query("How does photosynthesis convert light?"),
+        )
+
+    assert asyncio.run(run()) == [{"final_summary": "Async summary"}] * 2
+
+def test_aexecute_query_invalid_query(dummy_agent):
+    """
+    Test that the async pipeline rejects invalid queries before any API call.
+    """
+    with pytest.raises(ProcessingError):
+        asyncio.run(dummy_agent.aexecute_query("short"))
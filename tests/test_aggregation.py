@@ -0,0 +1,67 @@
+import pytest
+from cognita.aggregation import SourceIndex, dedupe_sources, normalize_url, source_fingerprint
+from cognita.models import ResearchResult, Source
+
+def test_fingerprint_normalizes_doi_url_and_title():
+    """
+    Test that spelling variants of the same source share a fingerprint.
+    """
+    assert source_fingerprint({"doi": "10.1000/XYZ"}) == \
+        source_fingerprint({"doi": "https://doi.org/10.1000/xyz", "url": "https://other.org"})
+    assert normalize_url("HTTPS://www.Example.org:443/paper/?utm_source=x&b=2&a=1#intro") == \
+        "//example.org/paper?a=1&b=2"
+    assert source_fingerprint({"url": "http://example.org/paper/"}) == \
+        source_fingerprint(Source(url="https://www.example.org/paper?utm_medium=mail"))
+    assert source_fingerprint("Deep Learning: A Review") == \
+        source_fingerprint({"title": "deep learning -- a review"})
+    assert source_fingerprint({"url": "https://example.org/a"}) != \
+        source_fingerprint({"url": "https://example.org/b"})
+    assert source_fingerprint({"confidence": 0.5}) is None
+
+@pytest.mark.parametrize("merge, expected", [("max", 0.8), ("mean", 0.6), ("noisy_or", 0.88)])
+def test_merge_strategies(merge, expected):
+    """
+    Test that repeated sources merge their confidence according to the strategy.
+    """
+    index = SourceIndex(merge=merge)
+    index.add({"url": "https://example.org/a", "confidence": 0.4})
+    index.add({"url": "http://example.org/a/", "confidence": 0.8})
+    assert len(index) == 1
+    entry = index.get({"url": "https://example.org/a"})
+    assert entry["confidence"] == pytest.approx(expected)
+    assert entry["occurrences"] == 2
+
+def test_add_result_and_top_k():
+    """
+    Test aggregation across result shapes and heap-based top-k ranking.
+    """
+    index = SourceIndex()
+    index.add_result({"final_summary": "s", "confidence": 0.3,
+                      "sources": ["Shared Paper", {"url": "https://a.org", "confidence": 0.9}]})
+    index.add_result(ResearchResult("s", (Source(title="shared paper"), Source(url="https://b.org")), 0.7))
+    index.add_result({"summary": "raw", "confidence_score": 0.5, "sources": [{"doi": "10.1/c"}]})
+    assert len(index) == 4
+    top = index.top(2)
+    assert [source.get("url", source.get("title")) for source in top] == ["https://a.org", "Shared Paper"]
+    assert top[1]["confidence"] == 0.7 and top[1]["occurrences"] == 2
+    assert "SHARED   paper" in index
+
+def test_capacity_bounds_memory_and_keeps_best():
+    """
+    Test that a bounded index evicts the lowest-scoring sources.
+    """
+    index = SourceIndex(capacity=100)
+    for number in range(10000):
+        index.add({"url": f"https://example.org/{number}", "confidence": (number % 1000) / 1000})
+    assert len(index) == 100
+    assert len(index._heap) <= 2 * 100 + 17
+    assert index.evicted == 9900
+    assert min(source["confidence"] for source in index) >= 0.9
+    assert index.top(1)[0]["confidence"] == 0.999
+
+def test_dedupe_sources_preserves_order():
+    """
+    Test order-preserving deduplication of a single sources list.
+    """
+    sources = ["Paper A", {"title": "paper a"}, {"url": "https://x.org"}, "Paper B", {"url": "https://X.org/"}]
+    assert dedupe_sources(sources) == ["Paper A", {"url": "https://x.org"}, "Paper B"]
@@ -0,0 +1,90 @@
+from cognita.balancer import LoadBalancer, parse_base_urls
+from cognita.config import Config
+from cognita.deep_research_api import DeepResearchAPI
+from cognita.mock_server import MockResearchServer
+
+# Dummy configuration object for testing
+class DummyConfig:
+    API_KEY = "mock-key"
+    API_BASE_URL = "http://unused"
+    API_TIMEOUT = 10
+    MAX_RESULTS = 5
+    MIN_CONFIDENCE = 0.8
+    API_RETRY_BACKOFF_BASE = 0.01
+    API_CIRCUIT_FAILURE_THRESHOLD = 2
+
+def test_parse_base_urls():
+    """
+    Test that API_BASE_URLS accepts lists and comma-separated strings.
+    """
+    config = DummyConfig()
+    assert parse_base_urls(config) == ["http://unused"]
+    config.API_BASE_URLS = "http://a/v1/, http://b/v1"
+    assert parse_base_urls(config) == ["http://a/v1", "http://b/v1"]
+
+    snapshot = Config.from_dict({"API_KEY": "key", "API_BASE_URLS": ["http://a", "http://b"]})
+    assert snapshot.API_BASE_URLS == ("http://a", "http://b")
+    assert snapshot.replace(MAX_RESULTS=3).API_BASE_URLS == ("http://a", "http://b")
+
+def test_strategies_prefer_fast_replicas():
+    """
+    Test that latency-aware strategies avoid slow or loaded replicas.
+    """
+    balancer = LoadBalancer(["http://a", "http://b"], strategy="ewma")
+    assert balancer.choose() == "http://a"
+    for url, latency in (("http://a", 0.2), ("http://b", 0.05)):
+        balancer.start(url)
+        balancer.finish(url, latency)
+    assert balancer.choose() == "http://b"
+    for _ in range(4):
+        balancer.start("http://b")
+    assert balancer.choose() == "http://a"
+    assert balancer.stats()["http://b"]["in_flight"] == 4
+
+    p2c = LoadBalancer(["http://a", "http://b", "http://c"], seed=7)
+    p2c.start("http://a")
+    p2c.finish("http://a", 1.0, failed=True)
+    picks = {p2c.choose() for _ in range(50)}
+    assert picks == {"http://b", "http://c"}
+    assert p2c.stats()["http://a"]["failures"] == 1
+
+    round_robin = LoadBalancer(["http://a", "http://b"], strategy="round_robin")
+    assert [round_robin.choose() for _ in range(4)] == ["http://a", "http://b"] * 2
+
+def test_cold_start_spreads_requests():
+    """
+    Test that replicas without latency samples share requests by in-flight count.
+    """
+    ewma = LoadBalancer(["http://a", "http://b", "http://c"], strategy="ewma")
+    picks = []
+    for _ in range(9):
+        picks.append(ewma.choose())
+        ewma.start(picks[-1])
+    assert picks == ["http://a", "http://b", "http://c"] * 3
+
+    p2c = LoadBalancer(["http://a", "http://b", "http://c"], seed=3)
+    for url in ("http://a", "http://b"):
+        p2c.start(url)
+        p2c.finish(url, 0.1)
+    for _ in range(30):
+        p2c.start(p2c.choose())
+    in_flight = [stats["in_flight"] for stats in p2c.stats().values()]
+    assert max(in_flight) - min(in_flight) <= 2
+
+def test_failover_to_healthy_replica():
+    """
+    Test that requests fail over from a failing replica and its breaker opens.
+    """
+    with MockResearchServer(error_rate=1.0) as broken, MockResearchServer() as healthy:
+        config = DummyConfig()
+        config.API_BASE_URLS = [broken.url, healthy.url]
+        config.API_BALANCER = "round_robin"
+        with DeepResearchAPI(config) as api:
+            for i in range(6):
+                assert api.submit_research_request(f"Research topic number {i}")["sources"]
+            stats = api.endpoint_stats()
+        assert stats[broken.url]["failures"] == 2
+        assert stats[broken.url]["state"] == "open"
+        assert stats[healthy.url] == {"latency": stats[healthy.url]["latency"], "in_flight": 0,
+                                      "requests": 6, "failures": 0, "state": "closed"}
+        assert healthy.stats["requests"] == 6
@@ -0,0 +1,75 @@
+import threading
+import pytest
+from cognita.agent import CognitaAgent
+from cognita.errors import APIError, ProcessingError
+
+# Dummy configuration object for testing
+class DummyConfig:
+    API_BASE_URL = "http://dummyapi.com"
+    API_KEY = "dummykey"
+    API_TIMEOUT = 10
+    MAX_RESULTS = 5
+    MIN_CONFIDENCE = 0.8
+
+@pytest.fixture
+def batch_agent(monkeypatch):
+    """
+    Fixture to create a CognitaAgent whose API records every submitted query.
+    """
+    agent = CognitaAgent(DummyConfig())
+    agent.submitted = []
+    lock = threading.Lock()
+
+    def fake_submit_research_request(query: str):
+        with lock:
+            agent.submitted.append(query)
+        if "fail" in query:
+            raise APIError("Simulated upstream failure")
+        if "crash" in query:
+            raise KeyError("summary")
+        return {"summary": f"Summary of {query}", "sources": [], "confidence_score": 0.9}
+    monkeypatch.setattr(agent.api, "submit_research_request", fake_submit_research_request)
+    return agent
+
+def test_execute_batch_captures_failures(batch_agent):
+    """
+    Test that failing and invalid queries are reported without aborting the batch.
+    """
+    queries = [
+        "What is the role of mitochondria?",
+        "This query will fail upstream",
+        "short",
+        "How do black holes evaporate?",
+        "This query will crash the client",
+    ]
+    run = batch_agent.execute_batch(queries, max_concurrency=2)
+    outcomes = {outcome.index: outcome for outcome in run}
+
+    assert outcomes[0].result["final_summary"] == "Summary of What is the role of mitochondria?"
+    assert isinstance(outcomes[1].error, APIError)
+    assert isinstance(outcomes[2].error, ProcessingError)
+    assert outcomes[3].ok
+    assert isinstance(outcomes[4].error, KeyError)
+    assert run.stats.total == 5
+    assert run.stats.succeeded == 2
+    assert run.stats.failed == 3
+    assert run.stats.rejected == 1
+    assert "short" not in batch_agent.submitted
+
+def test_execute_batch_deduplicates_and_orders(batch_agent):
+    """
+    Test that identical queries are submitted once and ordered mode keeps input order.
+    """
+    queries = [
+        "Impact of renewable energy on markets",
+        "  Impact of renewable energy on markets  ",
+        "Effects of microplastics on marine life",
+    ]
+    run = batch_agent.execute_batch(queries, ordered=True)
+    outcomes = list(run)
+
+    assert [outcome.index for outcome in outcomes] == [0, 1, 2]
+    assert outcomes[0].result == outcomes[1].result
+    assert sorted(batch_agent.submitted) == sorted(set(batch_agent.submitted))
+    assert len(batch_agent.submitted) == 2
+    assert run.stats.deduplicated == 1
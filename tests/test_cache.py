@@ -0,0 +1,97 @@
+import pytest
+from cognita.agent import CognitaAgent
+from cognita.cache import MemoryCache, ResultCache, SQLiteCache, make_cache_key
+
+# Dummy configuration object for testing
+class DummyConfig:
+    API_BASE_URL = "http://dummyapi.com"
+    API_KEY = "dummykey"
+    API_TIMEOUT = 10
+    MAX_RESULTS = 5
+    MIN_CONFIDENCE = 0.8
+
+def test_memory_cache_lru_and_ttl(monkeypatch):
+    """
+    Test that the memory cache evicts the least recently used entry and expires old ones.
+    """
+    now = [1000.0]
+    monkeypatch.setattr("cognita.cache.time.monotonic", lambda: now[0])
+    cache = MemoryCache(max_entries=2, ttl=60)
+
+    cache.set("a", {"v": 1})
+    cache.set("b", {"v": 2})
+    assert cache.get("a") == {"v": 1}
+    cache.set("c", {"v": 3})
+
+    assert cache.get("b") is None
+    assert cache.stats.evictions == 1
+
+    now[0] += 61
+    assert cache.get("a") is None
+    assert cache.stats.expirations == 1
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 2
+
+def test_memory_cache_values_are_isolated():
+    """
+    Test that callers cannot change cached entries, and incomplete backends are rejected.
+    """
+    cache = MemoryCache()
+    value = {"sources": [{"title": "A"}]}
+    cache.set("a", value)
+    value["sources"].append({"title": "B"})
+    cache.get("a")["sources"][0]["title"] = "changed"
+    assert cache.get("a") == {"sources": [{"title": "A"}]}
+
+    class GetOnlyCache(ResultCache):
+        def get(self, key):
+            return None
+    with pytest.raises(TypeError):
+        GetOnlyCache()
+
+def test_sqlite_cache_persists_and_evicts(tmp_path):
+    """
+    Test that the SQLite cache survives reopening and respects its entry limit.
+    """
+    path = str(tmp_path / "cache.sqlite3")
+    cache = SQLiteCache(path, max_entries=2)
+    cache.set("a", {"final_summary": "A"})
+    cache.set("b", {"final_summary": "B"})
+    cache.set("c", {"final_summary": "C"})
+    assert cache.stats.evictions == 1
+    cache.close()
+
+    reopened = SQLiteCache(path, max_entries=2)
+    assert len(reopened) == 2
+    assert reopened.get("c") == {"final_summary": "C"}
+    reopened.close()
+
+def test_agent_uses_cache_with_bypass_and_refresh(monkeypatch):
+    """
+    Test that repeated queries hit the cache unless bypassed or refreshed.
+    """
+    agent = CognitaAgent(DummyConfig(), cache=MemoryCache())
+    calls = []
+
+    def fake_submit_research_request(query: str):
+        calls.append(query)
+        return {"summary": f"Summary {len(calls)}", "sources": [], "confidence_score": 0.9}
+    monkeypatch.setattr(agent.api, "submit_research_request", fake_submit_research_request)
+
+    query = "What are the latest advancements in AI?"
+    first = agent.execute_query(query)
+    assert agent.execute_query("  " + query + "  ") == first
+    assert len(calls) == 1
+
+    assert agent.execute_query(query, use_cache=False)["final_summary"] == "Summary 2"
+    assert agent.execute_query(query)["final_summary"] == "Summary 1"
+    assert agent.execute_query(query, refresh=True)["final_summary"] == "Summary 3"
+    assert agent.execute_query(query)["final_summary"] == "Summary 3"
+    assert len(calls) == 3
+
+def test_cache_key_depends_on_parameters():
+    """
+    Test that request parameters are part of the cache key.
+    """
+    assert make_cache_key("query text", 5, 0.8) == make_cache_key("query text", 5, 0.8)
+    assert make_cache_key("query text", 5, 0.8) != make_cache_key("query text", 10, 0.8)
@@ -26,3 +26,63 @@ def test_config_missing_api_key(monkeypatch):
     monkeypatch.delenv("API_KEY", raising=False)
     with pytest.raises(ValueError):
         Config()
+
+def test_config_repr_redacts_api_key(monkeypatch):
+    """
+    Test that the configuration's representation does not leak the API key.
+    """
+    monkeypatch.setenv("API_KEY", "supersecret")
+    text = repr(Config())
+    assert "supersecret" not in text
+    assert "API_KEY=***" in text
+
+def test_config_from_dict_is_frozen(monkeypatch):
+    """
+    Test that dictionary-built configurations apply defaults and cannot be modified.
+    """
+    monkeypatch.setenv("MAX_RESULTS", "99")
+    config = Config.from_dict({"API_KEY": "dictkey", "MAX_RESULTS": 5, "API_POOL_BLOCK": True,
+                               "CUSTOM_SETTING": [1, 2]})
+    assert config.MAX_RESULTS == 5
+    assert config.API_POOL_BLOCK is True
+    assert config.API_TIMEOUT == 30
+    assert config.CUSTOM_SETTING == [1, 2]
+    assert config.frozen
+    with pytest.raises(AttributeError):
+        config.MAX_RESULTS = 7
+
+    changed = config.replace(MAX_RESULTS=7)
+    assert (changed.MAX_RESULTS, config.MAX_RESULTS) == (7, 5)
+    assert changed.API_KEY == "dictkey"
+    with pytest.raises(ValueError):
+        Config.from_dict({"MAX_RESULTS": 5})
+
+def test_config_from_dict_keeps_typed_values():
+    """
+    Test that typed values are validated as given instead of being re-parsed from strings.
+    """
+    config = Config.from_dict({"API_KEY": "k", "API_TIMEOUT": 2.5, "CACHE_TTL": 60,
+                               "API_BASE_URLS": "http://a, http://b", "API_KEEP_ALIVE": "off"})
+    assert config.API_TIMEOUT == 2.5
+    assert isinstance(config.CACHE_TTL, float)
+    assert config.API_BASE_URLS == ("http://a", "http://b")
+    assert config.API_KEEP_ALIVE is False
+    assert config.replace(API_TIMEOUT=5).API_BASE_URLS == ("http://a", "http://b")
+    for name, value in (("MAX_RESULTS", True), ("API_POOL_BLOCK", 1), ("API_BASE_URLS", [1]),
+                        ("API_BASE_URL", 3)):
+        with pytest.raises(ValueError, match=name):
+            Config.from_dict({"API_KEY": "k", name: value})
+
+def test_config_from_env_mapping_and_snapshot(monkeypatch):
+    """
+    Test that configurations can be read from a mapping and that the snapshot is cached.
+    """
+    config = Config.from_env({"API_KEY": "envkey", "API_KEEP_ALIVE": "off"})
+    assert config.API_KEEP_ALIVE is False
+    assert "_frozen" not in config.as_dict()
+
+    monkeypatch.setenv("API_KEY", "snapkey")
+    first = Config.snapshot(refresh=True)
+    monkeypatch.setenv("API_KEY", "otherkey")
+    assert Config.snapshot() is first
+    assert Config.snapshot(refresh=True).API_KEY == "otherkey"
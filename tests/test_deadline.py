@@ -0,0 +1,107 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from cognita.agent import CognitaAgent
+from cognita.deadline import check_deadline, current_deadline, deadline_scope
+from cognita.deep_research_api import AsyncDeepResearchAPI, DeepResearchAPI
+from cognita.errors import DeadlineExceededError
+from cognita.hedging import HedgePolicy, hedged_call
+from cognita.mock_server import MockResearchServer
+
+# Dummy configuration object for testing
+class DummyConfig:
+    API_KEY = "mock-key"
+    API_TIMEOUT = 10
+    MAX_RESULTS = 5
+    MIN_CONFIDENCE = 0.8
+    API_RETRY_BACKOFF_BASE = 0.05
+
+def test_nested_scopes_only_tighten():
+    """
+    Test that a nested deadline keeps the stricter budget and timeouts.
+    """
+    with deadline_scope(total=5.0, connect=1.0) as outer:
+        with deadline_scope(total=60.0, read=2.0) as inner:
+            assert current_deadline() is inner
+            assert inner.remaining() <= 5.0
+            assert inner.request_timeout(10.0, 10.0) == (1.0, 2.0)
+        assert current_deadline() is outer
+        check_deadline("format")
+    assert current_deadline() is None
+
+    with deadline_scope(total=0.0) as expired:
+        assert expired.request_timeout(10.0, 10.0) == (0.001, 0.001)
+        with pytest.raises(DeadlineExceededError, match="before format"):
+            check_deadline("format")
+
+def test_execute_query_deadline():
+    """
+    Test that a slow API call fails once the per-call deadline passes.
+    """
+    with MockResearchServer(latency=0.5) as server:
+        config = DummyConfig()
+        config.API_BASE_URL = server.url
+        with CognitaAgent(config) as agent:
+            started = time.monotonic()
+            with pytest.raises(DeadlineExceededError):
+                agent.execute_query("Recent advances in quantum computing", timeout=0.15)
+            assert time.monotonic() - started < 0.45
+
+def test_hedged_request_beats_slow_primary():
+    """
+    Test that a hedge to the secondary URL answers before a slow primary.
+    """
+    with MockResearchServer(latency=0.5) as slow, MockResearchServer() as fast:
+        config = DummyConfig()
+        config.API_BASE_URL = slow.url
+        config.API_HEDGE_URL = fast.url
+        config.API_HEDGE_DELAY = 0.05
+        with DeepResearchAPI(config) as api:
+            started = time.monotonic()
+            response = api.submit_research_request("Recent advances in quantum computing")
+            assert time.monotonic() - started < 0.4
+        assert response["sources"]
+        assert api.hedge_policy.stats()["hedged"] == api.hedge_policy.wins == 1
+        assert fast.stats["requests"] == 1
+
+def test_hedge_counters_are_exact_across_threads():
+    """
+    Test that hedge counters shared by many threads lose no increments.
+    """
+    policy = HedgePolicy(delay=0.0)
+
+    def slow(cancelled):
+        cancelled.wait(0.01)
+        return "primary"
+
+    with ThreadPoolExecutor(max_workers=32) as executor, ThreadPoolExecutor(max_workers=8) as callers:
+        results = list(callers.map(lambda _: hedged_call(slow, lambda cancelled: "secondary",
+                                                           policy, executor), range(400)))
+    stats = policy.stats()
+    assert stats["requests"] == 400
+    assert stats["wins"] == results.count("secondary") <= stats["hedged"] <= 400
+
+def test_async_hedged_request_beats_slow_primary():
+    """
+    Test that the async client hedges and cancels the losing request.
+    """
+    pytest.importorskip("aiohttp")
+    with MockResearchServer(latency=0.5) as slow, MockResearchServer() as fast:
+        config = DummyConfig()
+        config.API_BASE_URL = slow.url
+        config.API_HEDGE_URL = fast.url
+        config.API_HEDGE_DELAY = 0.05
+
+        async def run():
+            async with AsyncDeepResearchAPI(config) as api:
+                started = time.monotonic()
+                response = await api.submit_research_request("Recent advances in quantum computing")
+                elapsed = time.monotonic() - started
+                await asyncio.sleep(0.05)  # let the cancelled primary unwind
+                return response, elapsed, api.hedge_policy.wins, api.balancer.stats()
+
+        response, elapsed, wins, stats = asyncio.run(run())
+        assert response["sources"] and elapsed < 0.4 and wins == 1
+        # The cancelled primary attempt leaves no latency sample behind.
+        assert stats[slow.url]["in_flight"] == 0 and stats[slow.url]["latency"] is None
@@ -1,6 +1,9 @@
+import asyncio
+import json
+import threading
 import pytest
 import requests
-from cognita.deep_research_api import DeepResearchAPI
+from cognita.deep_research_api import DeepResearchAPI, AsyncDeepResearchAPI
 from cognita.errors import APIError
 
 # Dummy configuration object for testing
@@ -14,16 +17,13 @@ class DummyConfig:
 # Helper class to simulate responses from requests.post
 class FakeResponse:
     def __init__(self, json_data, status_code=200):
-        self._json_data = json_data
+        self.content = json.dumps(json_data).encode("utf-8")
         self.status_code = status_code
 
     def raise_for_status(self):
         if self.status_code >= 400:
             raise requests.exceptions.HTTPError(f"HTTP error: {self.status_code}")
 
-    def json(self):
-        return self._json_data
-
 def test_submit_research_request_success(monkeypatch):
     """
     Test that submit_research_request returns the correct response when the API call is successful.
@@ -31,14 +31,14 @@ def test_submit_research_request_success(monkeypatch):
     config = DummyConfig()
     api_client = DeepResearchAPI(config)
     
-    def fake_post(url, json, headers, timeout):
+    def fake_post(self, url, data, timeout):
         return FakeResponse({
             "summary": "Fake summary",
             "sources": ["Fake Source"],
             "confidence_score": 0.9
         }, status_code=200)
     
-    monkeypatch.setattr(requests, "post", fake_post)
+    monkeypatch.setattr(requests.Session, "post", fake_post)
     result = api_client.submit_research_request("A valid research query?")
     expected = {
         "summary": "Fake summary",
@@ -54,9 +54,51 @@ def test_submit_research_request_failure(monkeypatch):
     config = DummyConfig()
     api_client = DeepResearchAPI(config)
     
-    def fake_post(url, json, headers, timeout):
+    def fake_post(self, url, data, timeout):
         raise requests.exceptions.RequestException("Simulated network error")
     
-    monkeypatch.setattr(requests, "post", fake_post)
+    monkeypatch.setattr(requests.Session, "post", fake_post)
     with pytest.raises(APIError):
         api_client.submit_research_request("A valid research query?")
+
+def test_session_is_pooled_per_thread():
+    """
+    Test that a thread reuses its session and that all sessions share one connection pool.
+    """
+    api_client = DeepResearchAPI(DummyConfig())
+    main_session = api_client.session
+    assert api_client.session is main_session
+
+    sessions = []
+    worker = threading.Thread(target=lambda: sessions.append(api_client.session))
+    worker.start()
+    worker.join()
+
+    assert sessions[0] is not main_session
+    assert sessions[0].get_adapter("http://dummyapi.com") is main_session.get_adapter("http://dummyapi.com")
+    assert main_session.headers["Authorization"] == "Bearer dummykey"
+
+def test_context_manager_closes_client():
+    """
+    Test that leaving the context manager closes the client.
+    """
+    with DeepResearchAPI(DummyConfig()) as api_client:
+        api_client.session
+    with pytest.raises(APIError):
+        api_client.session
+
+def test_async_submit_research_request_failure():
+    """
+    Test that the async client raises an APIError when the endpoint is unreachable.
+    """
+    pytest.importorskip("aiohttp")
+    config = DummyConfig()
+    config.API_BASE_URL = "http://127.0.0.1:9"
+    config.API_RETRY_MAX_ATTEMPTS = 1
+
+    async def run():
+        async with AsyncDeepResearchAPI(config) as api_client:
+            await api_client.submit_research_request("A valid research query?")
+
+    with pytest.raises(APIError):
+        asyncio.run(run())
@@ -0,0 +1,27 @@
+import subprocess
+import sys
+
+def run_python(code):
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                          check=True).stdout.split()
+
+def test_import_is_lazy():
+    """
+    Test that importing the package does not load the HTTP client or dotenv.
+    """
+    loaded = run_python(
+        "import sys, cognita; "
+        "print(*[name for name in ('requests', 'dotenv', 'cognita.agent') if name in sys.modules])"
+    )
+    assert loaded == []
+
+def test_lazy_exports_resolve():
+    """
+    Test that the public names are importable and the config does not need dotenv.
+    """
+    loaded = run_python(
+        "import sys, cognita; from cognita import Config, ResearchResult; "
+        "Config.from_dict({'API_KEY': 'k'}); "
+        "print('dotenv' in sys.modules, cognita.CognitaAgent.__name__, 'CognitaAgent' in dir(cognita))"
+    )
+    assert loaded == ["False", "CognitaAgent", "True"]
@@ -0,0 +1,95 @@
+import json
+import logging
+import pytest
+import requests
+from cognita.agent import CognitaAgent
+from cognita.errors import APIError
+from cognita.instrumentation import Instrumentation, current_trace, stage
+
+# Dummy configuration object for testing
+class DummyConfig:
+    API_BASE_URL = "http://dummyapi.com"
+    API_KEY = "dummykey"
+    API_TIMEOUT = 10
+    MAX_RESULTS = 5
+    MIN_CONFIDENCE = 0.8
+
+# Helper classes to simulate responses from requests.Session.post
+class FakeRequest:
+    def __init__(self, body):
+        self.body = body
+
+class FakeResponse:
+    def __init__(self, json_data, request_body, status_code=200):
+        self.content = json.dumps(json_data).encode("utf-8")
+        self.request = FakeRequest(request_body)
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"HTTP error: {self.status_code}")
+
+def test_agent_traces_pipeline_stages(monkeypatch):
+    """
+    Test that a query produces a trace with stage timings and payload sizes.
+    """
+    def fake_post(self, url, data, timeout):
+        return FakeResponse({"summary": "Traced", "sources": [], "confidence_score": 0.9}, b"x" * 42)
+    monkeypatch.setattr(requests.Session, "post", fake_post)
+
+    agent = CognitaAgent(DummyConfig())
+    traces = []
+    agent.add_hook(traces.append)
+    agent.execute_query("What are the latest advancements in AI?")
+
+    trace = traces[0]
+    assert trace.status == "ok"
+    assert list(trace.stages) == ["validate", "http", "parse", "format", "summarize"]
+    assert trace.sizes["request_bytes"] == 42
+    assert trace.sizes["response_bytes"] > 0
+    assert len(trace.request_id) == 16
+    assert current_trace() is None
+
+def test_failed_query_trace_and_failing_hook(monkeypatch):
+    """
+    Test that errors are recorded on the trace and hook failures do not break queries.
+    """
+    def fake_post(self, url, data, timeout):
+        raise requests.exceptions.RequestException("Simulated network error")
+    monkeypatch.setattr(requests.Session, "post", fake_post)
+
+    agent = CognitaAgent(DummyConfig())
+    traces = []
+    agent.add_hook(lambda trace: 1 / 0)
+    agent.add_hook(traces.append)
+    with pytest.raises(APIError):
+        agent.execute_query("What are the latest advancements in AI?")
+    assert traces[0].status == "error"
+    assert traces[0].error == "APIError"
+
+def test_stage_is_noop_without_trace():
+    """
+    Test that stage timing outside a trace does nothing.
+    """
+    with stage("http"):
+        pass
+    instrumentation = Instrumentation()
+    with instrumentation.trace("query") as trace:
+        with stage("http"):
+            pass
+    assert "http" in trace.stages
+
+def test_debug_payloads_not_rendered_when_disabled(monkeypatch):
+    """
+    Test that payloads are not converted to strings unless debug logging is enabled.
+    """
+    class Exploding(dict):
+        def __repr__(self):
+            raise AssertionError("payload rendered")
+        __str__ = __repr__
+
+    agent = CognitaAgent(DummyConfig())
+    agent.logger.setLevel(logging.INFO)
+    monkeypatch.setattr(agent.api, "submit_research_request",
+                        lambda query: Exploding(summary="ok", sources=[], confidence_score=1.0))
+    assert agent.execute_query("What are the latest advancements in AI?")["final_summary"] == "ok"
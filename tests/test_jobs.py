@@ -0,0 +1,151 @@
+import threading
+import time
+import pytest
+from concurrent.futures import CancelledError, wait
+from cognita.agent import CognitaAgent
+from cognita.deadline import current_deadline
+from cognita.deep_research_api import DeepResearchAPI
+from cognita.errors import APIError, CircuitOpenError, JobFailedError
+from cognita.jobs import JobHandle, JobPoller
+from cognita.mock_server import MockResearchServer
+
+# Dummy configuration object for testing
+class DummyConfig:
+    API_KEY = "mock-key"
+    API_TIMEOUT = 10
+    MAX_RESULTS = 5
+    MIN_CONFIDENCE = 0.8
+    JOB_POLL_MIN_INTERVAL = 0.01
+    JOB_POLL_MAX_INTERVAL = 0.05
+
+class FakeJobsAPI:
+    """Serves scripted job statuses and records every poll."""
+
+    def __init__(self, statuses):
+        self.statuses = statuses
+        self.polls = []
+        self.lock = threading.Lock()
+
+    def get_job_status(self, job_id):
+        with self.lock:
+            self.polls.append(job_id)
+            script = self.statuses[job_id]
+            status = script.pop(0) if len(script) > 1 else script[0]
+        if isinstance(status, Exception):
+            raise status
+        return status
+
+RESULT = {"summary": "Done", "sources": [], "confidence_score": 0.9}
+
+def test_poller_resolves_many_jobs_from_one_thread():
+    """
+    Test that one poller resolves every job once its status becomes completed.
+    """
+    statuses = {
+        f"job-{index}": [{"status": "pending"}] * (index % 3) + [{"status": "completed", "result": RESULT}]
+        for index in range(50)
+    }
+    expected_polls = sum(len(script) for script in statuses.values())
+    api = FakeJobsAPI(statuses)
+    threads_before = threading.active_count()
+    with JobPoller(api, min_interval=0.001, max_interval=0.01) as poller:
+        futures = [poller.track(JobHandle(job_id, "q")) for job_id in statuses]
+        assert threading.active_count() == threads_before + 1
+        assert all(future.result(timeout=5) == RESULT for future in futures)
+    assert len(api.polls) == expected_polls
+
+def test_poller_failures_and_timeouts():
+    """
+    Test that failed jobs, timeouts and repeated polling errors fail their futures.
+    """
+    api = FakeJobsAPI({
+        "failed": [{"status": "failed", "error": "quota exceeded"}],
+        "slow": [{"status": "running"}],
+        "flaky": [APIError("boom"), APIError("boom"), {"status": "completed", "result": RESULT}],
+        "broken": [APIError("boom")],
+    })
+    with JobPoller(api, min_interval=0.001, max_interval=0.005, timeout=0.05,
+                   max_poll_errors=3) as poller:
+        failed = poller.track(JobHandle("failed", "q"))
+        slow = poller.track(JobHandle("slow", "q"))
+        flaky = poller.track(JobHandle("flaky", "q"))
+        broken = poller.track(JobHandle("broken", "q"))
+        with pytest.raises(JobFailedError, match="quota exceeded"):
+            failed.result(timeout=5)
+        with pytest.raises(JobFailedError, match="timed out"):
+            slow.result(timeout=5)
+        assert flaky.result(timeout=5) == RESULT
+        with pytest.raises(APIError):
+            broken.result(timeout=5)
+    assert api.polls.count("broken") == 3
+
+def test_timeout_holds_while_polls_fail_and_polls_are_bounded():
+    """
+    Test that the job timeout is enforced while the circuit is open, and each poll has a deadline.
+    """
+    api = FakeJobsAPI({"open": [CircuitOpenError("/research/jobs", 60.0)],
+                       "running": [{"status": "running"}]})
+    deadlines = []
+    get_job_status = api.get_job_status
+    api.get_job_status = lambda job_id: deadlines.append(current_deadline()) or get_job_status(job_id)
+    with JobPoller(api, min_interval=0.01, max_interval=0.02, timeout=0.1, poll_timeout=2) as poller:
+        started = time.monotonic()
+        with pytest.raises(JobFailedError, match="timed out"):
+            poller.track(JobHandle("open", "q")).result(timeout=5)
+        assert time.monotonic() - started < 1
+        with pytest.raises(JobFailedError, match="timed out"):
+            poller.track(JobHandle("running", "q")).result(timeout=5)
+    assert api.polls.count("open") == 1
+    assert all(deadline is not None and deadline.total == 2 for deadline in deadlines)
+
+def test_job_ids_are_quoted_in_the_status_path(monkeypatch):
+    """
+    Test that job IDs cannot change the status request's path.
+    """
+    config = DummyConfig()
+    config.API_BASE_URL = "http://jobs.example"
+    api = DeepResearchAPI(config)
+    paths = []
+    monkeypatch.setattr(api, "_post_with_retries", lambda path, payload, **options: paths.append(path))
+    api.get_job_status("../admin?x=1")
+    assert paths == ["/research/jobs/..%2Fadmin%3Fx%3D1"]
+
+def test_poll_interval_backs_off_while_unchanged():
+    """
+    Test that an unchanged status is polled at growing intervals up to the maximum.
+    """
+    api = FakeJobsAPI({"job": [{"status": "running"}]})
+    poller = JobPoller(api, min_interval=0.01, max_interval=0.04, backoff=2.0)
+    future = poller.track(JobHandle("job", "q"))
+    wait([future], timeout=0.35)
+    poller.close()
+    # Intervals 0.01, 0.02, 0.04, 0.04, ... allow far fewer polls than a fixed 10ms.
+    assert 4 <= len(api.polls) <= 12
+    assert future.cancelled()
+
+def test_job_handle_requires_job_id():
+    """
+    Test that a submission response without a job ID is rejected.
+    """
+    assert JobHandle.from_response({"job_id": 7, "poll_after": "2"}, "q").poll_after == 2.0
+    with pytest.raises(APIError):
+        JobHandle.from_response({"status": "pending"}, "q")
+
+def test_agent_jobs_against_mock_server():
+    """
+    Test that agent job futures resolve to summarized results without per-job connections.
+    """
+    with MockResearchServer(num_sources=2, job_duration=0.05) as server:
+        config = DummyConfig()
+        config.API_BASE_URL = server.url
+        with CognitaAgent(config) as agent:
+            futures = [agent.submit_job(f"Long running research topic {index}") for index in range(20)]
+            results = [future.result(timeout=10) for future in futures]
+            cancelled = agent.submit_job("A job that is cancelled")
+            cancelled.cancel()
+        assert results[3]["final_summary"] == "Mock summary for: Long running research topic 3"
+        assert all(len(result["sources"]) == 2 for result in results)
+        assert server.jobs == 21
+        assert server.stats["connections"] <= 2
+    with pytest.raises(CancelledError):
+        cancelled.result(timeout=1)
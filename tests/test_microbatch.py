@@ -0,0 +1,138 @@
+import threading
+import time
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from cognita.agent import CognitaAgent
+from cognita.deep_research_api import DeepResearchAPI
+from cognita.errors import APIError, ProcessingError
+from cognita.microbatch import MicroBatcher
+from cognita.mock_server import MockResearchServer
+
+# Dummy configuration object for testing
+class DummyConfig:
+    API_KEY = "mock-key"
+    API_TIMEOUT = 10
+    MAX_RESULTS = 5
+    MIN_CONFIDENCE = 0.8
+    API_RETRY_MAX_ATTEMPTS = 1
+    BATCH_MAX_SIZE = 8
+    BATCH_WINDOW = 0.05
+
+class RecordingSender:
+    """Answers every query with its own text and records the batches it received."""
+
+    def __init__(self, fail=()):
+        self.batches = []
+        self.fail = set(fail)
+        self.lock = threading.Lock()
+
+    def __call__(self, queries):
+        with self.lock:
+            self.batches.append(list(queries))
+        return [APIError(query) if query in self.fail else {"summary": query} for query in queries]
+
+def test_batches_by_size_and_window():
+    """
+    Test that queries are grouped up to the size limit and flushed after the window.
+    """
+    sender = RecordingSender()
+    with MicroBatcher(sender, max_batch_size=4, max_wait=0.05) as batcher:
+        futures = [batcher.submit(f"query {index}") for index in range(10)]
+        results = [future.result(timeout=5) for future in futures]
+    assert results == [{"summary": f"query {index}"} for index in range(10)]
+    assert [len(batch) for batch in sender.batches] == [4, 4, 2]
+
+def test_duplicates_are_sent_once_and_errors_stay_per_item():
+    """
+    Test that duplicate queries share one slot and item errors only fail their callers.
+    """
+    sender = RecordingSender(fail={"bad"})
+    with MicroBatcher(sender, max_batch_size=10, max_wait=0.02) as batcher:
+        first, second, bad = batcher.submit("same"), batcher.submit("same"), batcher.submit("bad")
+        assert first.result(timeout=5) == second.result(timeout=5) == {"summary": "same"}
+        with pytest.raises(APIError):
+            bad.result(timeout=5)
+    assert sender.batches == [["same", "bad"]]
+
+def test_failed_batch_fails_every_query():
+    """
+    Test that an exception from the sender fails all futures of the batch.
+    """
+    def send(queries):
+        raise APIError("batch endpoint down")
+
+    with MicroBatcher(send, max_wait=0.01) as batcher:
+        futures = [batcher.submit(f"query {index}") for index in range(3)]
+        for future in futures:
+            with pytest.raises(APIError, match="batch endpoint down"):
+                future.result(timeout=5)
+
+def test_close_flushes_waiting_queries():
+    """
+    Test that closing the batcher sends queries still inside the window.
+    """
+    sender = RecordingSender()
+    batcher = MicroBatcher(sender, max_batch_size=100, max_wait=60)
+    future = batcher.submit("waiting")
+    started = time.monotonic()
+    batcher.close()
+    assert future.result(timeout=1) == {"summary": "waiting"}
+    assert time.monotonic() - started < 5
+
+def test_batch_request_demultiplexes_per_query_parameters():
+    """
+    Test the batch endpoint with per-query parameters and per-item errors.
+    """
+    with MockResearchServer(num_sources=10) as server:
+        config = DummyConfig()
+        config.API_BASE_URL = server.url
+        with DeepResearchAPI(config) as api:
+            results = api.submit_batch_request(
+                ["first query", "", "third query"], [None, None, {"max_results": 2}]
+            )
+    assert results[0]["summary"] == "Mock summary for: first query"
+    assert len(results[0]["sources"]) == 5
+    assert isinstance(results[1], APIError)
+    assert len(results[2]["sources"]) == 2
+    assert server.stats["requests"] == 1
+
+def test_agent_packs_concurrent_queries_into_few_requests():
+    """
+    Test that concurrent submit_batched callers share batch requests.
+    """
+    with MockResearchServer(num_sources=3) as server:
+        config = DummyConfig()
+        config.API_BASE_URL = server.url
+        with CognitaAgent(config) as agent:
+            topics = [f"Research topic number {index}" for index in range(32)]
+            with ThreadPoolExecutor(max_workers=32) as pool:
+                futures = list(pool.map(agent.submit_batched, topics))
+            results = [future.result(timeout=10) for future in futures]
+        assert [result["final_summary"] for result in results] == \
+            [f"Mock summary for: {topic}" for topic in topics]
+        assert server.stats["batches"] == server.stats["requests"] <= 8
+
+def test_processing_failures_reach_the_future():
+    """
+    Test that malformed bodies and archive errors fail the caller's future.
+    """
+    class BrokenStore:
+        def append(self, result, query=None):
+            raise OSError("disk full")
+
+        def close(self):
+            pass
+
+    config = DummyConfig()
+    config.API_BASE_URL = "http://unused"
+    with CognitaAgent(config) as agent:
+        agent.api.submit_batch_request = lambda queries: [
+            {"summary": "s", "sources": None} if "model" in query else {"summary": query}
+            for query in queries]
+        future = agent.submit_batched("Research topic as model", as_model=True)
+        with pytest.raises(ProcessingError, match="Invalid response format"):
+            future.result(timeout=5)
+
+        agent.store = BrokenStore()
+        with pytest.raises(OSError):
+            agent.submit_batched("Research topic number 1").result(timeout=5)
@@ -0,0 +1,87 @@
+import pytest
+from cognita.agent import CognitaAgent
+from cognita.errors import APIError
+from cognita.mock_server import MockResearchServer
+from cognita.utils import collect_stream
+
+# Dummy configuration object for testing
+class DummyConfig:
+    API_KEY = "mock-key"
+    API_TIMEOUT = 10
+    MAX_RESULTS = 5
+    MIN_CONFIDENCE = 0.8
+    API_RETRY_BACKOFF_BASE = 0.01
+
+@pytest.fixture
+def server():
+    """
+    Fixture running a local mock Deep Research server.
+    """
+    with MockResearchServer(num_sources=3) as running:
+        yield running
+
+@pytest.fixture
+def agent(server):
+    """
+    Fixture creating an agent pointed at the mock server.
+    """
+    config = DummyConfig()
+    config.API_BASE_URL = server.url
+    with CognitaAgent(config) as running:
+        yield running
+
+def test_queries_reuse_pooled_connection(server, agent):
+    """
+    Test that sequential queries go over a single keep-alive connection.
+    """
+    for topic in ("quantum computing", "marine ecosystems", "renewable energy"):
+        result = agent.execute_query(f"Recent advances in {topic}")
+        assert result["final_summary"] == f"Mock summary for: Recent advances in {topic}"
+        assert len(result["sources"]) == 3
+    assert server.stats["requests"] == 3
+    assert server.stats["connections"] == 1
+
+@pytest.mark.parametrize("stream_format", ["ndjson", "sse"])
+def test_streaming_against_server(server, agent, stream_format):
+    """
+    Test that streamed NDJSON and SSE responses are parsed end to end.
+    """
+    server.stream_format = stream_format
+    events = agent.stream_query("Recent advances in quantum computing")
+    collected = collect_stream(events)
+    assert collected["summary"] == "Mock summary for: Recent advances in quantum computing"
+    assert len(collected["sources"]) == 3
+    assert collected["confidence"] == 0.9
+
+def test_server_errors_are_retried(server, agent):
+    """
+    Test that a failing server is retried before the error surfaces.
+    """
+    server.error_rate = 1.0
+    with pytest.raises(APIError):
+        agent.execute_query("Recent advances in quantum computing")
+    assert server.stats["requests"] == 3
+
+def test_benchmark_writes_json_report(tmp_path):
+    """
+    Test that the pipeline benchmark runs end to end and writes a JSON report.
+    """
+    import json
+    import os
+    import subprocess
+    import sys
+
+    script = os.path.join(os.path.dirname(__file__), os.pardir, "benchmarks", "bench_pipeline.py")
+    output = tmp_path / "bench.json"
+    subprocess.run(
+        [sys.executable, script, "--requests", "5", "--latency", "0", "--modes", "sync,batch,stream",
+         "--memory-requests", "2", "--output", str(output)],
+        check=True, timeout=60,
+    )
+    report = json.loads(output.read_text())
+    assert set(report["modes"]) == {"sync", "batch", "stream"}
+    for record in report["modes"].values():
+        assert record["requests"] == 5
+        assert record["errors"] == 0
+        assert set(record["latency"]) >= {"p50", "p95", "p99"}
+    assert report["memory"]["queries"] == 2
@@ -0,0 +1,60 @@
+import pytest
+from cognita.agent import CognitaAgent
+from cognita.models import ResearchResult, ResultCollection, Source
+
+# Dummy configuration object for testing
+class DummyConfig:
+    API_BASE_URL = "http://dummyapi.com"
+    API_KEY = "dummykey"
+    API_TIMEOUT = 10
+    MAX_RESULTS = 5
+    MIN_CONFIDENCE = 0.8
+
+RAW_RESPONSE = {
+    "summary": "Test summary",
+    "sources": ["Plain Source", {"title": "Paper", "url": "https://example.org/p", "year": 2024}],
+    "confidence_score": 0.9,
+}
+
+def test_result_round_trips_to_summarized_dict():
+    """
+    Test that a result built from a raw response matches summarize_results output.
+    """
+    result = ResearchResult.from_response(RAW_RESPONSE, "query text")
+    assert result.sources[1].url == "https://example.org/p"
+    assert result.sources[1].extra == {"year": 2024}
+    assert result.to_dict() == {
+        "final_summary": "Test summary",
+        "sources": RAW_RESPONSE["sources"],
+        "confidence": 0.9,
+    }
+    assert ResearchResult.from_dict(result.to_dict(), "query text") == result
+    with pytest.raises(AttributeError):
+        result.unexpected = True
+    with pytest.raises(AttributeError):
+        Source("x").unexpected = True
+
+def test_result_collection_is_columnar():
+    """
+    Test that collections store columns and materialize results on access.
+    """
+    collection = ResultCollection([
+        ResearchResult.from_response(RAW_RESPONSE, "first"),
+        {"final_summary": "Other", "sources": [], "confidence": 0.5},
+    ])
+    assert len(collection) == 2
+    assert collection.confidences.tolist() == [0.9, 0.5]
+    assert collection.mean_confidence() == pytest.approx(0.7)
+    assert [result.query for result in collection.filter(0.8)] == ["first"]
+    assert collection.to_dicts()[1] == {"final_summary": "Other", "sources": [], "confidence": 0.5}
+
+def test_agent_returns_model(monkeypatch):
+    """
+    Test that as_model returns a ResearchResult without the dict pipeline.
+    """
+    agent = CognitaAgent(DummyConfig())
+    monkeypatch.setattr(agent.api, "submit_research_request", lambda query: RAW_RESPONSE)
+    result = agent.execute_query("What are the latest advancements in AI?", as_model=True)
+    assert isinstance(result, ResearchResult)
+    assert result.query == "What are the latest advancements in AI?"
+    assert result.to_dict() == agent.execute_query("What are the latest advancements in AI?")
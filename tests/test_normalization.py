@@ -0,0 +1,102 @@
+import pytest
+from cognita.agent import CognitaAgent
+from cognita.cache import MemoryCache
+from cognita.errors import ConfigError
+from cognita.normalization import NearDuplicateIndex, canonicalize_query, stem
+
+# Dummy configuration object for testing
+class DummyConfig:
+    API_BASE_URL = "http://dummyapi.com"
+    API_KEY = "dummykey"
+    API_TIMEOUT = 10
+    MAX_RESULTS = 5
+    MIN_CONFIDENCE = 0.8
+
+def test_canonicalize_query_ignores_form():
+    """
+    Test that case, punctuation, stopwords and inflections do not change the canonical form.
+    """
+    assert canonicalize_query("Recent advancements in quantum computing?") == \
+        canonicalize_query("recent   advances in QUANTUM computing")
+    assert canonicalize_query("What is the impact of climate change?") == "what impact climate change"
+    assert canonicalize_query("Is it that?") == "is it that"
+    assert stem("class") == "class"
+    assert stem("studies") == "study"
+
+def test_distinct_questions_do_not_match():
+    """
+    Test that questions differing in their question word or word order stay apart.
+    """
+    pairs = [
+        ("Why does smoking cause cancer", "How does smoking cause cancer"),
+        ("When was penicillin discovered", "Who discovered penicillin"),
+        ("Where do monarch butterflies migrate", "Why do monarch butterflies migrate"),
+        ("Recent advancements in quantum computing", "Quantum computing: recent advancements"),
+        ("Cheap flights to Paris from London", "Cheap flights from Paris to London"),
+        ("Did inflation rise in Europe in 2023?", "Will inflation rise in Europe in 2023?"),
+        ("Should governments regulate AI research", "Can governments regulate AI research"),
+        ("Solar and wind subsidies", "Solar or wind subsidies"),
+    ]
+    index = NearDuplicateIndex(threshold=0.8)
+    for number, (first, second) in enumerate(pairs):
+        assert canonicalize_query(first) != canonicalize_query(second)
+        index.add(str(number), first)
+    for first, second in pairs:
+        assert index.find(second) is None
+
+def test_near_duplicate_index_finds_paraphrases():
+    """
+    Test that reworded queries match while unrelated ones do not.
+    """
+    index = NearDuplicateIndex(threshold=0.7)
+    index.add("quantum", "Recent advancements in quantum computing")
+    index.add("reefs", "Impact of rising ocean temperatures on coral reef ecosystems in the Pacific")
+
+    assert index.find("recent advances in quantum computing!") == ("quantum", 1.0)
+    assert index.find("Impact of rising ocean temperatures on coral reef ecosystems across the Pacific")[0] == "reefs"
+    assert index.find("History of the Roman empire") is None
+
+    index.discard("quantum")
+    assert "quantum" not in index
+    assert index.find("recent advances in quantum computing") is None
+
+def test_near_duplicate_index_is_bounded():
+    """
+    Test that the oldest queries are dropped beyond the capacity.
+    """
+    index = NearDuplicateIndex(capacity=2)
+    index.add("a", "first research question about biology")
+    index.add("b", "second research question about physics")
+    index.add("c", "third research question about chemistry")
+    assert len(index) == 2
+    assert "a" not in index
+    with pytest.raises(ValueError):
+        NearDuplicateIndex(num_perm=64, bands=10)
+
+def test_agent_reuses_results_for_similar_queries(monkeypatch):
+    """
+    Test that "canonical" and "similar" matching serve reworded queries from the cache.
+    """
+    config = DummyConfig()
+    config.QUERY_MATCHING = "similar"
+    config.QUERY_SIMILARITY_THRESHOLD = 0.7
+    agent = CognitaAgent(config, cache=MemoryCache())
+    calls = []
+
+    def fake_submit_research_request(query: str):
+        calls.append(query)
+        return {"summary": f"Summary {len(calls)}", "sources": [], "confidence_score": 0.9}
+    monkeypatch.setattr(agent.api, "submit_research_request", fake_submit_research_request)
+
+    first = agent.execute_query("Impact of rising ocean temperatures on coral reef ecosystems in the Pacific?")
+    assert agent.execute_query("impact of rising ocean temperatures on the coral reef ecosystems in the pacific") == first
+    assert agent.execute_query("Impact of rising ocean temperatures on coral reef ecosystems across the Pacific") == first
+    why = agent.execute_query("Why does smoking cause cancer")
+    how = agent.execute_query("How does smoking cause cancer")
+    assert len({first["final_summary"], why["final_summary"], how["final_summary"]}) == 3
+    assert len(calls) == 3
+    assert agent.near_duplicate_hits == 1
+
+    config.QUERY_MATCHING = "fuzzy"
+    with pytest.raises(ConfigError):
+        CognitaAgent(config)
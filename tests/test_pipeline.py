@@ -0,0 +1,126 @@
+import asyncio
+import time
+import pytest
+from cognita.agent import CognitaAgent
+from cognita.errors import ProcessingError
+from cognita.mock_server import MockResearchServer
+from cognita.pipeline import Pipeline
+
+# Dummy configuration object for testing
+class DummyConfig:
+    API_KEY = "mock-key"
+    API_TIMEOUT = 10
+    MAX_RESULTS = 5
+    MIN_CONFIDENCE = 0.8
+    CACHE_BACKEND = "memory"
+
+def slow_count(results):
+    time.sleep(0.2)
+    return len(results["sources"])
+
+def slow_title(results):
+    time.sleep(0.2)
+    return results["final_summary"][:10]
+
+def test_agent_runs_independent_stages_in_parallel():
+    """
+    Test that independent stages overlap, outputs are returned and memoized.
+    """
+    traces = []
+    with MockResearchServer(num_sources=3) as server:
+        config = DummyConfig()
+        config.API_BASE_URL = server.url
+        with CognitaAgent(config) as agent:
+            agent.add_hook(traces.append)
+            agent.add_stage("count", slow_count)
+            agent.add_stage("title", slow_title)
+            agent.add_stage("label", lambda query, count, title: f"{query}: {count} / {title}",
+                            requires=("query", "count", "title"))
+            agent.add_stage("length", len, requires=("query",), kind="process")
+
+            started = time.monotonic()
+            first = agent.execute_query("Recent advances in quantum computing")
+            assert time.monotonic() - started < 0.35
+            second = agent.execute_query("Recent advances in quantum computing")
+            stats = agent.pipeline.stats()
+
+    stages = first["stages"]
+    assert stages["count"] == len(first["sources"])
+    assert stages["label"] == f"Recent advances in quantum computing: {stages['count']} / {stages['title']}"
+    assert stages["length"] == len("Recent advances in quantum computing")
+    assert second["stages"] == stages and "stages" not in agent.cache.get(agent._cache_key(
+        "Recent advances in quantum computing"))
+    assert stats["count"]["runs"] == 1 and stats["count"]["memo_hits"] == 1
+    assert {"pipeline", "pipeline.count", "pipeline.title", "pipeline.label"} <= set(traces[0].stages)
+    assert "pipeline.count" not in traces[1].stages
+
+def test_stages_run_for_models_on_a_copy(monkeypatch):
+    """
+    Test that `as_model` results carry stage outputs and mutating stages cannot change the cache.
+    """
+    config = DummyConfig()
+    config.API_BASE_URL = "http://pipeline.example"
+    with CognitaAgent(config) as agent:
+        monkeypatch.setattr(agent.api, "submit_research_request", lambda query: {
+            "summary": "Summary", "sources": ["A", "B"], "confidence_score": 0.9})
+
+        def take_first(results):
+            return results["sources"].pop(0)
+        agent.add_stage("first", take_first, memoize=False)
+        model = agent.execute_query("Recent advances in quantum computing", as_model=True)
+        again = agent.execute_query("Recent advances in quantum computing")
+        cached = agent.cache.get(agent._cache_key("Recent advances in quantum computing"))
+
+    assert model.stages == {"first": "A"} and len(model.sources) == 2
+    assert again["stages"] == {"first": "A"} and again["sources"] == ["A", "B"]
+    assert cached["sources"] == ["A", "B"]
+
+def test_registration_and_failures():
+    """
+    Test dependency validation, error wrapping and non-memoized stages.
+    """
+    pipeline = Pipeline(workers=2)
+    with pytest.raises(ValueError):
+        pipeline.add_stage("scores", len, requires=("keywords",))
+    with pytest.raises(ValueError):
+        pipeline.add_stage("results", len)
+    with pytest.raises(ValueError):
+        pipeline.add_stage("scores", len, kind="gpu")
+
+    calls = []
+    pipeline.add_stage("seen", lambda results: calls.append(results) or len(calls), memoize=False)
+    pipeline.add_stage("double", lambda seen: seen * 2, requires=("seen",))
+    inputs = {"query": "q", "results": {"sources": []}}
+    assert pipeline.run(inputs) == {"seen": 1, "double": 2}
+    # A stage depending on a non-memoized one is recomputed as well.
+    assert pipeline.run(inputs) == {"seen": 2, "double": 4}
+
+    pipeline.add_stage("broken", lambda results: results["missing"])
+    with pytest.raises(ProcessingError, match="broken"):
+        pipeline.run(inputs)
+    assert pipeline.stats()["broken"]["errors"] == 1
+    pipeline.close()
+
+def test_arun_awaits_io_stages_on_the_loop():
+    """
+    Test that async runs await I/O stages concurrently with thread stages.
+    """
+    async def enrich(query):
+        await asyncio.sleep(0.2)
+        return query.upper()
+
+    pipeline = Pipeline()
+    pipeline.add_stage("enriched", enrich, requires=("query",), kind="io")
+    pipeline.add_stage("count", slow_count)
+    pipeline.add_stage("both", lambda enriched, count: (enriched, count), requires=("enriched", "count"))
+
+    async def run():
+        started = time.monotonic()
+        outputs = await pipeline.arun({"query": "topic", "results": {"sources": [1, 2]}})
+        return outputs, time.monotonic() - started
+
+    outputs, elapsed = asyncio.run(run())
+    assert outputs["both"] == ("TOPIC", 2) and elapsed < 0.35
+    # Synchronous runs await coroutine stages on a worker thread.
+    assert pipeline.run({"query": "other", "results": {"sources": []}})["both"] == ("OTHER", 0)
+    pipeline.close()
@@ -0,0 +1,165 @@
+import asyncio
+import multiprocessing
+import threading
+import pytest
+from cognita.deadline import deadline_scope
+from cognita.deep_research_api import AsyncDeepResearchAPI, DeepResearchAPI
+from cognita.errors import DeadlineExceededError
+from cognita.ratelimit import ConcurrencyLimiter, FileTokenBucket, TokenBucket, shared_limiters
+
+# Dummy configuration object for testing
+class DummyConfig:
+    API_BASE_URL = "http://ratelimited.example"
+    API_KEY = "dummykey"
+    API_TIMEOUT = 10
+    MAX_RESULTS = 5
+    MIN_CONFIDENCE = 0.8
+    API_RATE_LIMIT = 5
+    API_RATE_BURST = 2
+    API_MAX_CONCURRENT_REQUESTS = 3
+
+def test_token_bucket_burst_then_rate(monkeypatch):
+    """
+    Test that the bucket allows a burst and then spaces requests at the configured rate.
+    """
+    now = [100.0]
+    monkeypatch.setattr("cognita.ratelimit.time.monotonic", lambda: now[0])
+    bucket = TokenBucket(rate=10, burst=2)
+
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.1)
+    assert bucket.reserve() == pytest.approx(0.2)
+    assert not bucket.acquire(timeout=0.1)
+
+    now[0] += 1.0
+    assert bucket.reserve() == 0.0
+
+def test_concurrency_limiter_caps_in_flight():
+    """
+    Test that the limiter never admits more than its maximum at once.
+    """
+    limiter = ConcurrencyLimiter(2)
+    peak = []
+    barrier = threading.Barrier(2)
+
+    def work():
+        with limiter:
+            peak.append(limiter.in_flight)
+            try:
+                barrier.wait(timeout=0.2)
+            except threading.BrokenBarrierError:
+                pass
+
+    threads = [threading.Thread(target=work) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert max(peak) <= 2
+    assert limiter.in_flight == 0
+
+def test_abandoned_async_waits_give_back_their_reservation():
+    """
+    Test that timed-out or cancelled async acquires refund the token or pass on the slot.
+    """
+    bucket = TokenBucket(rate=1, burst=1)
+    limiter = ConcurrencyLimiter(1)
+
+    async def run():
+        assert await bucket.acquire_async()
+        assert not await bucket.acquire_async(timeout=0.01)
+        waiter = asyncio.ensure_future(bucket.acquire_async())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert await limiter.acquire_async()
+        assert not await limiter.acquire_async(timeout=0.01)
+        cancelled = asyncio.ensure_future(limiter.acquire_async())
+        queued = asyncio.ensure_future(limiter.acquire_async(timeout=1))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        limiter.release()
+        assert await queued
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+
+    asyncio.run(run())
+    # Only the first token was spent, so the next one is due within one interval.
+    assert 0.5 < bucket.reserve() <= 1.0
+    assert limiter.in_flight == 1
+    limiter.release()
+    assert limiter.in_flight == 0 and limiter.acquire(timeout=0)
+    # A thread waiting for the slot is woken by a release from the event loop.
+    got = []
+    thread = threading.Thread(target=lambda: got.append(limiter.acquire(timeout=1)))
+    thread.start()
+
+    async def release():
+        await asyncio.sleep(0.05)
+        limiter.release()
+    asyncio.run(release())
+    thread.join()
+    assert got == [True] and limiter.in_flight == 1
+
+def test_rate_token_is_refunded_when_no_slot_is_free(tmp_path):
+    """
+    Test that a request giving up on the concurrency limiter returns its rate token,
+    and that refunds never fill a bucket past its burst.
+    """
+    bucket = TokenBucket(rate=1, burst=1)
+    limiter = ConcurrencyLimiter(1)
+    assert limiter.acquire()
+    api = DeepResearchAPI(DummyConfig(), rate_limiter=bucket, concurrency_limiter=limiter)
+    async_api = AsyncDeepResearchAPI(DummyConfig(), rate_limiter=bucket, concurrency_limiter=limiter)
+    query = "What are the latest advancements in AI?"
+
+    with deadline_scope(total=0.05):
+        with pytest.raises(DeadlineExceededError):
+            api.submit_research_request(query)
+    assert bucket.reserve() == 0.0
+    bucket.refund()
+
+    async def run():
+        with deadline_scope(total=0.05):
+            await async_api.submit_research_request(query)
+    with pytest.raises(DeadlineExceededError):
+        asyncio.run(run())
+    assert bucket.reserve() == 0.0
+    limiter.release()
+
+    shared = FileTokenBucket(str(tmp_path / "bucket"), rate=1, burst=1)
+    shared.refund()
+    assert shared.reserve() == 0.0
+    assert shared.reserve() > 0.5
+
+def test_clients_share_limiters():
+    """
+    Test that clients built from equivalent configurations share one set of limiters.
+    """
+    first = DeepResearchAPI(DummyConfig())
+    second = DeepResearchAPI(DummyConfig())
+    assert first.rate_limiter is second.rate_limiter
+    assert first.concurrency_limiter is second.concurrency_limiter
+    assert first.rate_limiter.burst == 2
+
+def _reserve_from_file(path, results):
+    results.put(FileTokenBucket(path, rate=1, burst=2).reserve())
+
+def test_file_token_bucket_is_shared_across_processes(tmp_path):
+    """
+    Test that processes using the same state file draw from one bucket.
+    """
+    path = str(tmp_path / "bucket")
+    results = multiprocessing.Queue()
+    processes = [multiprocessing.Process(target=_reserve_from_file, args=(path, results))
+                 for _ in range(3)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    waits = sorted(results.get() for _ in processes)
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2] > 0.5
@@ -0,0 +1,97 @@
+import json
+import pytest
+from cognita.agent import CognitaAgent
+from cognita.errors import APIError
+from cognita.mock_server import MockResearchServer
+from cognita.refresh import RefreshState, apply_response, conditional_request, content_hash, merge_delta
+
+# Dummy configuration object for testing
+class DummyConfig:
+    API_KEY = "mock-key"
+    API_TIMEOUT = 10
+    MAX_RESULTS = 5
+    MIN_CONFIDENCE = 0.8
+    INCREMENTAL_REFRESH = True
+
+PREVIOUS = {
+    "summary": "Old summary",
+    "confidence_score": 0.8,
+    "sources": [
+        {"title": "Kept", "url": "https://example.org/a", "confidence": 0.9},
+        {"title": "Changed", "url": "https://example.org/b", "confidence": 0.5},
+        {"title": "Removed", "url": "https://example.org/c", "confidence": 0.4},
+    ],
+}
+
+def test_merge_delta():
+    """
+    Test that delta sources replace, remove and append by fingerprint.
+    """
+    delta = {
+        "delta": True,
+        "summary": "New summary",
+        "sources": [
+            {"title": "Changed", "url": "https://EXAMPLE.org/b/", "confidence": 0.7},
+            {"title": "Added", "url": "https://example.org/d", "confidence": 0.6},
+        ],
+        "removed": ["https://example.org/c"],
+    }
+    merged = merge_delta(PREVIOUS, delta)
+    assert merged["summary"] == "New summary" and merged["confidence_score"] == 0.8
+    assert [(s["title"], s["confidence"]) for s in merged["sources"]] == [
+        ("Kept", 0.9), ("Changed", 0.7), ("Added", 0.6)]
+    assert "delta" not in merged and "removed" not in merged
+    assert len(PREVIOUS["sources"]) == 3
+
+def test_apply_response_outcomes():
+    """
+    Test 304 reuse, skipped parsing of identical bodies and conditional headers.
+    """
+    body = json.dumps(PREVIOUS).encode()
+    first = apply_response(None, 200, {"ETag": '"v1"'}, body, json.loads)
+    assert first.outcome == "full" and first.content_hash == content_hash(body)
+
+    headers, fields = conditional_request(first)
+    assert headers == {"If-None-Match": '"v1"'} and fields["since"].endswith("Z")
+
+    unchanged = apply_response(first, 304, {}, b"", json.loads)
+    assert unchanged.outcome == "unchanged" and unchanged.response is first.response
+    assert unchanged.etag == '"v1"'
+
+    def fail(_):
+        raise AssertionError("identical body was parsed")
+    same = apply_response(RefreshState.from_dict(first.to_dict()), 200, {}, body, fail)
+    assert same.outcome == "unchanged" and same.response == PREVIOUS
+
+    with pytest.raises(APIError):
+        apply_response(None, 304, {}, b"", json.loads)
+    with pytest.raises(APIError):
+        apply_response(None, 200, {}, b'{"delta": true, "sources": []}', json.loads)
+
+def test_agent_incremental_refresh(tmp_path):
+    """
+    Test that repeated queries are fetched conditionally and deltas are merged.
+    """
+    query = "Recent advances in quantum computing"
+    with MockResearchServer(num_sources=3) as server:
+        config = DummyConfig()
+        config.API_BASE_URL = server.url
+        config.REFRESH_STATE_PATH = str(tmp_path / "refresh.sqlite3")
+        with CognitaAgent(config) as agent:
+            agent.execute_query(query)
+            agent.execute_query(query)
+            server.revision = 2
+            agent.execute_query(query)
+            key = agent._cache_key(query)
+            response = agent.refresh_states.get(key)["response"]
+            assert agent.refresh_outcomes == {"full": 1, "delta": 1, "unchanged": 1}
+        assert server.stats["not_modified"] == 1 and server.stats["deltas"] == 1
+        assert [source["title"] for source in response["sources"][-2:]] == [
+            f"Update 1 on {query}", f"Update 2 on {query}"]
+        assert len(response["sources"]) == 5 and response["summary"].endswith("(revision 2)")
+
+        # States persist, so a new agent refreshes conditionally straight away.
+        with CognitaAgent(config) as agent:
+            agent.execute_query(query)
+            assert agent.refresh_outcomes["unchanged"] == 1
+        assert server.stats["not_modified"] == 2
@@ -0,0 +1,157 @@
+import asyncio
+import json
+import pytest
+import requests
+from cognita.deep_research_api import AsyncDeepResearchAPI, DeepResearchAPI
+from cognita.errors import APIError, CircuitOpenError, DeadlineExceededError
+from cognita.retry import CircuitBreaker, RetryPolicy, parse_retry_after
+
+# Dummy configuration object for testing
+class DummyConfig:
+    API_BASE_URL = "http://dummyapi.com"
+    API_KEY = "dummykey"
+    API_TIMEOUT = 10
+    MAX_RESULTS = 5
+    MIN_CONFIDENCE = 0.8
+    API_RETRY_BACKOFF_BASE = 0.01
+    API_CIRCUIT_FAILURE_THRESHOLD = 2
+
+# Helper class to simulate responses from requests.Session.post
+class FakeResponse:
+    def __init__(self, json_data, status_code=200, headers=None):
+        self.content = json.dumps(json_data).encode("utf-8")
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"HTTP error: {self.status_code}")
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """
+    Fixture recording retry delays instead of sleeping.
+    """
+    recorded = []
+    monkeypatch.setattr("cognita.deep_research_api.time.sleep", recorded.append)
+    return recorded
+
+def fake_responses(monkeypatch, responses):
+    """
+    Make Session.post return (or raise) the given items in order.
+    """
+    calls = []
+
+    def fake_post(self, url, data, timeout):
+        calls.append(url)
+        item = responses[len(calls) - 1]
+        if isinstance(item, Exception):
+            raise item
+        return item
+    monkeypatch.setattr(requests.Session, "post", fake_post)
+    return calls
+
+def test_retries_transient_failures_then_succeeds(monkeypatch, sleeps):
+    """
+    Test that timeouts and 503 responses are retried, honoring Retry-After.
+    """
+    calls = fake_responses(monkeypatch, [
+        requests.exceptions.Timeout("read timed out"),
+        FakeResponse({}, status_code=503, headers={"Retry-After": "0.2"}),
+        FakeResponse({"summary": "ok"}),
+    ])
+    config = DummyConfig()
+    config.API_CIRCUIT_FAILURE_THRESHOLD = 5
+    api_client = DeepResearchAPI(config, retry_policy=RetryPolicy(max_attempts=3, backoff_base=0.01))
+
+    assert api_client.submit_research_request("A valid research query?") == {"summary": "ok"}
+    assert len(calls) == 3
+    assert len(sleeps) == 2
+    assert sleeps[1] >= 0.2
+
+def test_permanent_errors_are_not_retried(monkeypatch, sleeps):
+    """
+    Test that a 400 response fails immediately and leaves the breaker closed.
+    """
+    calls = fake_responses(monkeypatch, [FakeResponse({}, status_code=400)])
+    api_client = DeepResearchAPI(DummyConfig())
+
+    with pytest.raises(APIError):
+        api_client.submit_research_request("A valid research query?")
+    assert len(calls) == 1
+    assert sleeps == []
+    assert api_client.circuit_breaker_states()["http://dummyapi.com/research"]["state"] == "closed"
+
+def test_circuit_opens_and_fails_fast(monkeypatch, sleeps):
+    """
+    Test that repeated failures open the circuit and later calls skip the network.
+    """
+    calls = fake_responses(monkeypatch, [FakeResponse({}, status_code=502)] * 5)
+    api_client = DeepResearchAPI(DummyConfig())
+
+    with pytest.raises(APIError):
+        api_client.submit_research_request("A valid research query?")
+    with pytest.raises(CircuitOpenError):
+        api_client.submit_research_request("A valid research query?")
+    assert len(calls) == 2
+
+def test_circuit_breaker_half_open_probe(monkeypatch):
+    """
+    Test that an open breaker lets one probe through after the reset timeout.
+    """
+    now = [0.0]
+    monkeypatch.setattr("cognita.retry.time.monotonic", lambda: now[0])
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+
+    now[0] = 10.0
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+def test_unsettled_probe_is_released(monkeypatch):
+    """
+    Test that a half-open probe ending in a deadline or cancellation frees the probe.
+    """
+    config = DummyConfig()
+    config.API_CIRCUIT_RESET_TIMEOUT = 0
+
+    def out_of_time(*args, **kwargs):
+        raise DeadlineExceededError("rate limit")
+
+    api = DeepResearchAPI(config)
+    breaker = api.circuit_breaker(config.API_BASE_URL + "/research")
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    monkeypatch.setattr(api, "_post_once", out_of_time)
+    with pytest.raises(DeadlineExceededError):
+        api.submit_research_request("Research topic")
+    assert breaker.allow_request()
+    breaker.release_probe()
+
+    async def cancelled(*args, **kwargs):
+        raise asyncio.CancelledError()
+
+    async_api = AsyncDeepResearchAPI(config, circuit_breakers=api.circuit_breakers)
+    monkeypatch.setattr(async_api, "_post_once", cancelled)
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(async_api._post_with_retries("/research", {}))
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request()
+
+def test_retry_after_parsing_and_cap():
+    """
+    Test Retry-After parsing and that waits beyond the backoff cap give up.
+    """
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    policy = RetryPolicy(backoff_cap=5, jitter=False)
+    assert policy.compute_delay(1) == 0.5
+    assert policy.compute_delay(10) == 5
+    assert policy.compute_delay(1, retry_after=60) is None
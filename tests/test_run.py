@@ -0,0 +1,97 @@
+import json
+import pytest
+from cognita.errors import ProcessingError
+from cognita.mock_server import MockResearchServer
+from cognita.run import iter_queries, load_checkpoint, main, run_queries
+from cognita.store import ResultStore
+
+# Dummy configuration object for testing
+class DummyConfig:
+    API_KEY = "mock-key"
+    API_TIMEOUT = 10
+    MAX_RESULTS = 5
+    MIN_CONFIDENCE = 0.8
+    API_RETRY_MAX_ATTEMPTS = 1
+
+def write_lines(path, items):
+    path.write_text("".join(json.dumps(item) + "\n" for item in items))
+
+def read_records(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+def test_iter_queries_accepts_strings_and_objects(tmp_path):
+    """
+    Test that query lines can be strings or objects, with line numbers as default IDs.
+    """
+    path = tmp_path / "queries.jsonl"
+    write_lines(path, ["Recent advances in quantum computing", {"id": "q2", "query": "Coral reef decline"}])
+    path.write_text(path.read_text() + "\n" + json.dumps({"topic": "Solar cell efficiency"}) + "\n")
+
+    items = iter_queries(str(path))
+    assert [next(items), next(items)] == [
+        ("1", "Recent advances in quantum computing"), ("q2", "Coral reef decline")]
+    with pytest.raises(ProcessingError):
+        next(items)
+
+    write_lines(path, [{"key": 7, "topic": "Solar cell efficiency"}])
+    assert list(iter_queries(str(path), query_field="topic", id_field="key")) == [
+        ("7", "Solar cell efficiency")]
+
+def test_run_queries_on_process_pool_and_resume(tmp_path):
+    """
+    Test that a run writes and archives one record per query, and that a rerun
+    skips completed IDs and replaces the records of retried ones.
+    """
+    queries = tmp_path / "queries.jsonl"
+    output = tmp_path / "out" / "results.jsonl"
+    write_lines(queries, [{"id": f"q{i}", "query": f"Research topic number {i}"} for i in range(40)]
+                + [{"id": "short", "query": "too short"}])
+
+    with MockResearchServer(num_sources=2) as server:
+        config = DummyConfig()
+        config.API_BASE_URL = server.url
+        config.RESULT_STORE_PATH = str(tmp_path / "archive")
+        stats = run_queries(str(queries), str(output), config=config, processes=2,
+                            threads=4, chunk_size=8)
+        assert stats.submitted == 41
+        assert (stats.succeeded, stats.failed) == (40, 1)
+
+        records = read_records(output)
+        assert len(records) == 41
+        by_id = {record["id"]: record for record in records}
+        assert by_id["q7"]["result"]["final_summary"] == "Mock summary for: Research topic number 7"
+        assert by_id["short"]["error_type"] == "ProcessingError"
+        requests = server.stats["requests"]
+        with ResultStore(config.RESULT_STORE_PATH) as store:
+            assert len(store) == 40
+            assert store.get("Research topic number 7").result == by_id["q7"]["result"]
+
+        # Simulate a crash in the middle of writing a record.
+        with open(output, "a") as handle:
+            handle.write('{"id": "q0", "ok"')
+        stats = run_queries(str(queries), str(output), config=config, processes=2,
+                            retry_failed=True)
+        assert (stats.skipped, stats.submitted, stats.failed) == (40, 1, 1)
+        assert server.stats["requests"] == requests
+    records = read_records(output)
+    assert len(records) == 41 and [record["id"] for record in records].count("short") == 1
+
+def test_load_checkpoint_missing_file(tmp_path):
+    """
+    Test that a run without previous output starts from scratch.
+    """
+    assert load_checkpoint(str(tmp_path / "missing.jsonl")) == set()
+
+def test_main_reports_stats(tmp_path, monkeypatch, capsys):
+    """
+    Test the command-line entry point end to end.
+    """
+    queries = tmp_path / "queries.jsonl"
+    output = tmp_path / "results.jsonl"
+    write_lines(queries, ["Recent advances in quantum computing", "Coral reef decline causes"])
+    with MockResearchServer() as server:
+        monkeypatch.setenv("API_BASE_URL", server.url)
+        monkeypatch.setenv("API_KEY", "mock-key")
+        assert main([str(queries), str(output), "--processes", "1"]) == 0
+    assert json.loads(capsys.readouterr().out)["succeeded"] == 2
+    assert [record["id"] for record in read_records(output)] == ["1", "2"]
@@ -0,0 +1,81 @@
+import json
+import pytest
+import requests
+from cognita.deep_research_api import DeepResearchAPI
+from cognita.errors import APIError, ConfigError
+from cognita.serialization import JSONSerializer, get_serializer
+
+# Dummy configuration object for testing
+class DummyConfig:
+    API_BASE_URL = "http://dummyapi.com"
+    API_KEY = "dummykey"
+    API_TIMEOUT = 10
+    MAX_RESULTS = 5
+    MIN_CONFIDENCE = 0.8
+    API_RETRY_MAX_ATTEMPTS = 1
+
+class FakeResponse:
+    def __init__(self, content, status_code=200):
+        self.content = content
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"HTTP error: {self.status_code}")
+
+DOCUMENT = {"summary": "Résumé", "sources": [{"title": "A", "confidence": 0.5}], "confidence_score": 0.9}
+
+@pytest.mark.parametrize("backend", ["json", "orjson"])
+def test_round_trip_from_buffers(backend):
+    """
+    Test that each backend encodes to bytes and decodes bytes, bytearrays and memoryviews.
+    """
+    if backend == "orjson":
+        pytest.importorskip("orjson")
+    serializer = get_serializer(backend)
+    encoded = serializer.dumps(DOCUMENT)
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded.decode("utf-8")) == DOCUMENT
+    for buffer in (encoded, bytearray(encoded), memoryview(encoded), encoded.decode("utf-8")):
+        assert serializer.loads(buffer) == DOCUMENT
+    with pytest.raises(ValueError):
+        serializer.loads(b"{not json")
+
+def test_backend_selection():
+    """
+    Test that "auto" prefers orjson when installed and that unknown backends are rejected.
+    """
+    try:
+        import orjson  # noqa: F401
+        expected = "orjson"
+    except ImportError:
+        expected = "json"
+    assert get_serializer("auto").name == expected
+    assert get_serializer("json") is get_serializer("json")
+    with pytest.raises(ConfigError):
+        get_serializer("yaml")
+
+def test_api_sends_bytes_and_parses_content(monkeypatch):
+    """
+    Test that the client posts a pre-encoded body and parses the raw response bytes.
+    """
+    sent = {}
+
+    def fake_post(self, url, data, timeout):
+        sent["data"] = data
+        return FakeResponse(json.dumps(DOCUMENT).encode("utf-8"))
+
+    monkeypatch.setattr(requests.Session, "post", fake_post)
+    api_client = DeepResearchAPI(DummyConfig(), serializer=JSONSerializer())
+    assert api_client.submit_research_request("A valid research query?") == DOCUMENT
+    assert isinstance(sent["data"], bytes)
+    assert json.loads(sent["data"])["query"] == "A valid research query?"
+
+def test_api_invalid_json_raises_api_error(monkeypatch):
+    """
+    Test that an unparseable response body surfaces as an APIError.
+    """
+    monkeypatch.setattr(requests.Session, "post", lambda self, url, data, timeout: FakeResponse(b"<html>"))
+    api_client = DeepResearchAPI(DummyConfig())
+    with pytest.raises(APIError):
+        api_client.submit_research_request("A valid research query?")
@@ -0,0 +1,162 @@
+import asyncio
+import threading
+import time
+import pytest
+from cognita.agent import CognitaAgent
+from cognita.errors import APIError
+from cognita.models import ResearchResult
+from cognita.singleflight import AsyncSingleFlight, SingleFlight
+from cognita.store import ResultStore
+
+# Dummy configuration object for testing
+class DummyConfig:
+    API_BASE_URL = "http://dummyapi.com"
+    API_KEY = "dummykey"
+    API_TIMEOUT = 10
+    MAX_RESULTS = 5
+    MIN_CONFIDENCE = 0.8
+
+def test_single_flight_shares_result_across_threads():
+    """
+    Test that concurrent threads with the same key run the function once.
+    """
+    flight = SingleFlight()
+    calls = []
+    release = threading.Event()
+
+    def fetch():
+        calls.append(1)
+        release.wait(5)
+        return {"summary": "shared"}
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(flight.do("key", fetch)))
+               for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    while flight.coalesced < 4:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [{"summary": "shared"}] * 5
+    assert flight.in_flight == 0
+
+def test_async_single_flight_shares_errors():
+    """
+    Test that every coroutine waiting on a failed call receives its error.
+    """
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        raise APIError("upstream down")
+
+    async def run():
+        return await asyncio.gather(*(flight.do("key", fetch) for _ in range(3)),
+                                    return_exceptions=True)
+
+    errors = asyncio.run(run())
+    assert len(calls) == 1
+    assert all(isinstance(error, APIError) for error in errors)
+    assert flight.coalesced == 2
+
+def test_async_single_flight_survives_leader_cancellation():
+    """
+    Test that cancelling the caller that started a call does not fail the other waiters.
+    """
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.02)
+        return "shared"
+
+    async def run():
+        leader = asyncio.ensure_future(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        waiters = [asyncio.ensure_future(flight.do("key", fetch)) for _ in range(2)]
+        await asyncio.sleep(0)
+        leader.cancel()
+        results = await asyncio.gather(leader, *waiters, return_exceptions=True)
+
+        abandoned = asyncio.ensure_future(flight.do("other", fetch))
+        await asyncio.sleep(0)
+        abandoned.cancel()
+        await asyncio.gather(abandoned, return_exceptions=True)
+        await asyncio.sleep(0.05)
+        return results
+
+    results = asyncio.run(run())
+    assert isinstance(results[0], asyncio.CancelledError)
+    assert results[1:] == ["shared", "shared"]
+    assert calls == [1, 1] and flight.in_flight == 0
+
+def test_agent_coalesces_identical_async_queries(monkeypatch):
+    """
+    Test that the agent sends one request for identical concurrent async queries.
+    """
+    agent = CognitaAgent(DummyConfig())
+    calls = []
+
+    async def fake_async_submit(query: str):
+        calls.append(query)
+        await asyncio.sleep(0.01)
+        return {"summary": "Async summary", "sources": [], "confidence_score": 0.9}
+    monkeypatch.setattr(agent.async_api, "submit_research_request", fake_async_submit)
+
+    async def run():
+        query = "What are the latest advancements in AI?"
+        return await asyncio.gather(*(agent.aexecute_query(query) for _ in range(4)))
+
+    results = asyncio.run(run())
+    assert len(calls) == 1
+    assert all(result["final_summary"] == "Async summary" for result in results)
+    assert agent.coalesced_requests == 3
+
+def test_coalesced_queries_are_archived_once(monkeypatch, tmp_path):
+    """
+    Test that concurrent identical queries store one record and each get their own result.
+    """
+    store = ResultStore(str(tmp_path / "results"))
+    agent = CognitaAgent(DummyConfig(), store=store)
+    release = threading.Event()
+
+    def fake_submit(query: str):
+        release.wait(5)
+        return {"summary": "Shared", "sources": ["A"], "confidence_score": 0.9}
+    monkeypatch.setattr(agent.api, "submit_research_request", fake_submit)
+
+    async def fake_async_submit(query: str):
+        await asyncio.sleep(0.01)
+        return {"summary": "Shared", "sources": ["A"], "confidence_score": 0.9}
+    monkeypatch.setattr(agent.async_api, "submit_research_request", fake_async_submit)
+
+    query = "What are the latest advancements in AI?"
+    results = []
+    threads = [threading.Thread(target=lambda index=index: results.append(
+        agent.execute_query(query, as_model=index == 0))) for index in range(6)]
+    for thread in threads:
+        thread.start()
+    while agent.coalesced_requests < 5:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert len(store) == 1
+
+    dicts = [result for result in results if isinstance(result, dict)]
+    assert len(dicts) == 5 and sum(isinstance(result, ResearchResult) for result in results) == 1
+    dicts[0]["sources"].append("mutated")
+    assert all(result["sources"] == ["A"] for result in dicts[1:])
+
+    async def run():
+        return await asyncio.gather(*(agent.aexecute_query("How do transformers work?") for _ in range(4)))
+    asyncio.run(run())
+    assert len(store) == 2
+    agent.close()
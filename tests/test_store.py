@@ -0,0 +1,144 @@
+import os
+import pytest
+from cognita.agent import CognitaAgent
+from cognita.errors import ProcessingError
+from cognita.serialization import JSONSerializer
+from cognita.store import ResultStore, encode_record
+
+# Dummy configuration object for testing
+class DummyConfig:
+    API_BASE_URL = "http://dummyapi.com"
+    API_KEY = "dummykey"
+    API_TIMEOUT = 10
+    MAX_RESULTS = 5
+    MIN_CONFIDENCE = 0.8
+
+def test_store_append_get_and_reopen(tmp_path):
+    """
+    Test that results can be looked up by key and position after reopening the store.
+    """
+    path = str(tmp_path / "archive" / "results")
+    with ResultStore(path) as store:
+        assert store.append({"final_summary": "A1"}, query="a") == 0
+        store.append({"final_summary": "B"}, query="b")
+        store.append({"final_summary": "A2"}, query="a")
+        assert store.get("a").result == {"final_summary": "A2"}
+
+    with ResultStore(path) as store:
+        assert len(store) == 3
+        assert store[0].result == {"final_summary": "A1"}
+        assert store[-1].query == "a"
+        assert store.get("b").index == 1
+        assert store.get("missing") is None
+        assert "a" in store
+        assert store.keys() == ["b", "a"]
+        with pytest.raises(IndexError):
+            store[3]
+        digest, payload = encode_record({"final_summary": "C"}, query="c")
+        assert store.append_encoded(digest, payload) == 3
+        assert store.get("c").result == {"final_summary": "C"}
+
+def test_store_time_range_and_lazy_iteration(tmp_path):
+    """
+    Test that time ranges select the matching records and iteration keeps append order.
+    """
+    store = ResultStore(str(tmp_path / "results"), serializer=JSONSerializer())
+    for i in range(10):
+        store.append({"n": i}, key=f"k{i}", timestamp=100.0 + i)
+
+    assert [record.result["n"] for record in store.range(103.0, 106.0)] == [3, 4, 5]
+    assert [record.key for record in store.range(start=108.0)] == ["k8", "k9"]
+    assert [record.result["n"] for record in store.range(end=101.5)] == [0, 1]
+    assert [record.timestamp for record in store][:2] == [100.0, 101.0]
+    with pytest.raises(ValueError):
+        store.append({"n": 10}, key="late", timestamp=50.0)
+    store.close()
+
+def test_store_ignores_torn_writes(tmp_path):
+    """
+    Test that an index entry pointing past the end of the log is dropped on reopen.
+    """
+    path = str(tmp_path / "results")
+    with ResultStore(path) as store:
+        store.append({"n": 1}, query="one")
+        store.append({"n": 2}, query="two")
+    with open(path + ".log", "r+b") as log:
+        log.truncate(os.path.getsize(path + ".log") - 3)
+
+    with ResultStore(path) as store:
+        assert len(store) == 1
+        assert store.get("two") is None
+        store.append({"n": 3}, query="three")
+    with ResultStore(path) as store:
+        assert [record.result["n"] for record in store] == [1, 3]
+
+def test_store_key_table_is_persistent(monkeypatch, tmp_path):
+    """
+    Test that key lookups probe the on-disk key table instead of scanning the index.
+    """
+    path = str(tmp_path / "results")
+    with ResultStore(path) as store:
+        for i in range(1500):
+            store.append({"n": i}, key=f"k{i % 700}")
+    assert os.path.getsize(path + ".keys") > 700 * 24
+
+    with ResultStore(path) as store:
+        entries = []
+        read_entry = store._entry
+        monkeypatch.setattr(store, "_entry", lambda position: entries.append(position) or read_entry(position))
+        assert store.get("k5").result == {"n": 1405}
+        assert store.get("k699").result == {"n": 1399}
+        assert store.get("missing") is None
+        assert entries == [1405, 1399]
+        assert len(store.keys()) == 700
+
+    # Stores written without a key table get one on the next append.
+    os.remove(path + ".keys")
+    with ResultStore(path) as store:
+        assert store.get("k5").result == {"n": 1405}
+        store.append({"n": 1500}, key="k0")
+    with ResultStore(path) as store:
+        assert store._keys.covered == 1501
+        assert store.get("k0").index == 1500 and store.get("k1").index == 1401
+
+def test_store_refresh_sees_other_writers(tmp_path):
+    """
+    Test that a reader picks up records appended through another handle.
+    """
+    path = str(tmp_path / "results")
+    writer = ResultStore(path)
+    writer.append({"n": 1}, query="one")
+    reader = ResultStore(path)
+    assert reader.get("one").result == {"n": 1}
+    writer.append({"n": 2}, query="two")
+    assert reader.refresh() == 1
+    assert reader.get("two").result == {"n": 2}
+    reader.close()
+    writer.close()
+
+def test_store_rejects_foreign_index(tmp_path):
+    """
+    Test that a file that is not a store index is refused.
+    """
+    path = str(tmp_path / "results")
+    with open(path + ".idx", "wb") as index:
+        index.write(b"not an index")
+    with pytest.raises(ProcessingError):
+        ResultStore(path)
+
+def test_agent_archives_fetched_results(monkeypatch, tmp_path):
+    """
+    Test that the agent appends every fetched result to its store.
+    """
+    store = ResultStore(str(tmp_path / "results"))
+    agent = CognitaAgent(DummyConfig(), store=store)
+    monkeypatch.setattr(agent.api, "submit_research_request",
+                        lambda query: {"summary": "S", "sources": [], "confidence_score": 0.9})
+
+    results = agent.execute_query("What are the latest advancements in AI?")
+    agent.execute_query("How do transformers work?", as_model=True)
+
+    assert len(store) == 2
+    assert store.get("What are the latest advancements in AI?").result == results
+    assert store.get("How do transformers work?").result["final_summary"] == "S"
+    agent.close()
@@ -0,0 +1,127 @@
+import json
+import pytest
+import requests
+from cognita.agent import CognitaAgent
+from cognita.deadline import deadline_scope
+from cognita.deep_research_api import DeepResearchAPI
+from cognita.errors import APIError, ProcessingError
+from cognita.utils import collect_stream, iter_ndjson, iter_sse, stream_format_response
+
+# Dummy configuration object for testing
+class DummyConfig:
+    API_BASE_URL = "http://dummyapi.com"
+    API_KEY = "dummykey"
+    API_TIMEOUT = 10
+    MAX_RESULTS = 5
+    MIN_CONFIDENCE = 0.8
+
+# Helper class to simulate a streamed response from requests.Session.post
+class FakeStreamResponse:
+    def __init__(self, lines, content_type, status_code=200):
+        self._lines = lines
+        self.status_code = status_code
+        self.headers = {"Content-Type": content_type}
+        self.closed = False
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} Error", response=self)
+
+    def close(self):
+        self.closed = True
+
+    def iter_lines(self):
+        yield from self._lines
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.closed = True
+
+def test_iter_sse_joins_data_lines_and_stops_at_done():
+    """
+    Test that SSE parsing handles comments, multi-line data and the [DONE] marker.
+    """
+    lines = [
+        ": keep-alive",
+        'data: {"type": "summary",',
+        'data:  "text": "Hello"}',
+        "",
+        'data: {"type": "source", "source": "A"}',
+        "",
+        "data: [DONE]",
+        "",
+        'data: {"type": "source", "source": "ignored"}',
+    ]
+    assert list(iter_sse(lines)) == [
+        {"type": "summary", "text": "Hello"},
+        {"type": "source", "source": "A"},
+    ]
+
+def test_stream_format_and_collect():
+    """
+    Test that streamed events fold back into the format_response structure.
+    """
+    lines = [
+        b'{"type": "summary", "text": "Quantum "}',
+        b"",
+        b'{"type": "source", "source": {"title": "Paper"}}',
+        b'{"type": "summary", "text": "computing"}',
+        b'{"type": "confidence", "confidence_score": 0.9}',
+        b'{"type": "done"}',
+    ]
+    assert collect_stream(stream_format_response(iter_ndjson(lines))) == {
+        "summary": "Quantum computing",
+        "sources": [{"title": "Paper"}],
+        "confidence": 0.9,
+    }
+    with pytest.raises(ProcessingError):
+        list(iter_ndjson(["not json"]))
+
+def test_agent_stream_query_yields_sources_incrementally(monkeypatch):
+    """
+    Test that the agent yields events while the response is still being read.
+    """
+    consumed = []
+
+    def lines():
+        for index in range(3):
+            consumed.append(index)
+            yield f'{{"type": "source", "source": "Source {index}"}}'
+
+    response = FakeStreamResponse(lines(), "application/x-ndjson")
+
+    def fake_post(self, url, data, timeout, stream, headers):
+        assert json.loads(data)["stream"] is True and stream is True
+        return response
+    monkeypatch.setattr(requests.Session, "post", fake_post)
+
+    agent = CognitaAgent(DummyConfig())
+    events = agent.stream_query("What are the latest advancements in AI?")
+    assert next(events) == {"type": "source", "value": "Source 0"}
+    assert consumed == [0]
+    assert [event["value"] for event in events] == ["Source 1", "Source 2"]
+    assert response.closed
+
+@pytest.mark.parametrize("status_code, failures", [(400, 0), (503, 1)])
+def test_failed_stream_is_closed_and_classified(monkeypatch, status_code, failures):
+    """
+    Test that a failed stream releases its connection, trips the breaker only on
+    retryable statuses and caps its timeouts at the active deadline.
+    """
+    response = FakeStreamResponse([], "application/x-ndjson", status_code=status_code)
+    timeouts = []
+
+    def fake_post(self, url, data, timeout, stream, headers):
+        timeouts.append(timeout)
+        return response
+    monkeypatch.setattr(requests.Session, "post", fake_post)
+
+    api = DeepResearchAPI(DummyConfig())
+    with deadline_scope(total=2.0):
+        with pytest.raises(APIError):
+            list(api.stream_research_request("What are the latest advancements in AI?"))
+    assert response.closed
+    assert api.circuit_breaker("http://dummyapi.com/research")._failures == failures
+    assert all(0 < timeout <= 2.0 for timeout in timeouts[0])
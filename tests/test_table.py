@@ -0,0 +1,80 @@
+import pytest
+from cognita.models import ResearchResult, ResultCollection, Source
+
+np = pytest.importorskip("numpy")
+from cognita.table import ResultTable  # noqa: E402
+
+def make_results():
+    return [
+        {"final_summary": "A", "confidence": 0.9,
+         "sources": [{"title": "a1", "confidence": 0.8}, {"title": "a2", "confidence": 0.4}]},
+        {"final_summary": "B", "confidence": 0.5, "sources": ["b1"]},
+        ResearchResult("C", (Source(title="c1", confidence=0.95),), 0.7, "query c"),
+        {"final_summary": "D", "confidence": 0.8, "sources": []},
+    ]
+
+def test_columns_are_contiguous_arrays():
+    """
+    Test that confidences and flattened sources are stored as NumPy arrays.
+    """
+    table = ResultTable.from_results(make_results())
+    assert len(table) == 4
+    assert table.confidences.dtype == np.float64 and table.confidences.flags["C_CONTIGUOUS"]
+    assert table.source_offsets.tolist() == [0, 2, 3, 4, 4]
+    assert table.source_counts.tolist() == [2, 1, 1, 0]
+    assert np.isnan(table.source_confidences[2])
+    assert table[2] == ResearchResult("C", (Source(title="c1", confidence=0.95),), 0.7, "query c")
+    assert table[-1].summary == "D"
+
+def test_filter_rethresholds_results_and_sources():
+    """
+    Test vectorized filtering at a new result and source threshold.
+    """
+    table = ResultTable.from_results(make_results())
+    strong = table.filter(0.7)
+    assert list(strong.summaries) == ["A", "C", "D"]
+    assert strong.source_offsets.tolist() == [0, 2, 3, 3]
+    assert [source.title for source in strong[0].sources] == ["a1", "a2"]
+    pruned = table.filter(0.0, min_source_confidence=0.5)
+    assert [[source.title for source in result.sources] for result in pruned] == [["a1"], ["b1"], ["c1"], []]
+    assert len(table.filter(0.99)) == 0
+
+def test_statistics_and_normalization():
+    """
+    Test percentiles, summary statistics and the normalization methods.
+    """
+    table = ResultTable.from_results(make_results())
+    assert table.percentile(50) == pytest.approx(0.75)
+    assert table.percentile([0, 100]).tolist() == [0.5, 0.9]
+    assert table.percentile(50, sources=True) == pytest.approx(0.8)
+    assert table.describe()["max"] == 0.9
+    assert table.normalize("minmax").tolist() == pytest.approx([1.0, 0.0, 0.5, 0.75])
+    assert table.normalize("zscore").mean() == pytest.approx(0.0)
+    assert table.normalize("rank", [3.0, 1.0, 1.0, 2.0]).tolist() == pytest.approx([1.0, 1 / 6, 1 / 6, 2 / 3])
+    with pytest.raises(ValueError):
+        table.normalize("log")
+
+def test_scores_and_top():
+    """
+    Test weighted scoring and argpartition-based top-k selection.
+    """
+    table = ResultTable.from_results(make_results())
+    assert [result.summary for result in table.top(2)] == ["A", "D"]
+    assert table.mean_source_confidence()[0] == pytest.approx(0.6)
+    ranked = table.top(4, confidence_weight=1.0, source_weight=2.0)
+    assert ranked[0].summary == "C"
+    assert len(table.top(10)) == 4
+
+def test_large_table_roundtrip():
+    """
+    Test building and filtering a table of many results, including via ResultCollection.
+    """
+    collection = ResultCollection(
+        {"final_summary": f"s{i}", "confidence": (i % 100) / 100, "sources": [f"src{i}"] * (i % 3)}
+        for i in range(5000)
+    )
+    table = collection.to_table()
+    filtered = table.filter(0.9)
+    assert len(filtered) == 500
+    assert filtered.source_counts.sum() == sum(i % 3 for i in range(5000) if i % 100 >= 90)
+    assert filtered.to_collection().mean_confidence() == pytest.approx(0.945)